@@ -53,7 +53,21 @@ def ml_opportunity_scoring_agent(state: OpportunityState) -> OpportunityState:
     parcels_raw = state.get("parcels_raw", [])
     jurisdiction = state.get("jurisdiction", "Palm Bay")
     approval_rate = state.get("approval_rate", 70.0)
-    
+
+    # Nothing to score - skip model load entirely
+    if not density_gaps or all(g.gap_du_acre <= 0 for g in density_gaps.values()):
+        now = datetime.utcnow().isoformat()
+        state["scores"] = {}
+        state["ranked_parcels"] = []
+        state["top_opportunities"] = []
+        state["ml_model_version"] = ZODXGBoostModel.MODEL_VERSION
+        state["ml_enhanced"] = True
+        state["scoring_timestamp"] = now
+        state["current_stage"] = 6
+        state["stages_completed"] = state.get("stages_completed", []) + [5]
+        state["updated_at"] = now
+        return state
+
     # Initialize ML model
     ml_model = ZODXGBoostModel()
     
@@ -128,38 +142,41 @@ def ml_opportunity_scoring_agent(state: OpportunityState) -> OpportunityState:
     # Rank by blended score
     ranked = sorted(scores.keys(), key=lambda x: scores[x].total_score, reverse=True)
     
-    # Build top opportunities with ML data
-    top_opportunities = []
-    for parcel_id in ranked[:10]:
-        parcel = parcel_lookup.get(parcel_id)
-        raw = raw_lookup.get(parcel_id, {})
-        gap = density_gaps.get(parcel_id)
-        score = scores.get(parcel_id)
-        ml_pred = ml_predictions.get(parcel_id)
-        
-        if parcel and gap and score and ml_pred:
-            opp = {
-                "parcel_id": parcel_id,
-                "address": parcel.address,
-                "city": parcel.city,
-                "owner": parcel.owner_name,
-                "acreage": parcel.acreage,
-                "current_zoning": raw.get("current_zoning", "Unknown"),
-                "flu_designation": raw.get("flu_designation", "Unknown"),
-                "density_gap": gap.to_dict(),
-                "score": score.to_dict(),
-                "buildable_pct": buildable_pct.get(parcel_id, 100),
-                "constraints": [c.to_dict() for c in constraints.get(parcel_id, [])],
-                # ML enhancements
-                "ml_prediction": {
-                    "approval_probability": ml_pred.approval_probability,
-                    "value_uplift_estimate": ml_pred.value_uplift_estimate,
-                    "confidence": ml_pred.confidence,
-                    "grade": ml_pred.grade,
-                    "features_used": ml_pred.features_used
-                }
+    # Build top opportunities with ML data. Every scored parcel has a parcel,
+    # gap and prediction, so pull each structure once for the top 10 and zip.
+    top_ids = ranked[:10]
+    top_parcels = [parcel_lookup[p] for p in top_ids]
+    top_raws = [raw_lookup.get(p, {}) for p in top_ids]
+    top_gaps = [density_gaps[p] for p in top_ids]
+    top_scores = [scores[p] for p in top_ids]
+    top_preds = [ml_predictions[p] for p in top_ids]
+
+    top_opportunities = [
+        {
+            "parcel_id": parcel_id,
+            "address": parcel.address,
+            "city": parcel.city,
+            "owner": parcel.owner_name,
+            "acreage": parcel.acreage,
+            "current_zoning": raw.get("current_zoning", "Unknown"),
+            "flu_designation": raw.get("flu_designation", "Unknown"),
+            "density_gap": gap.to_dict(),
+            "score": score.to_dict(),
+            "buildable_pct": buildable_pct.get(parcel_id, 100),
+            "constraints": [c.to_dict() for c in constraints.get(parcel_id, [])],
+            # ML enhancements
+            "ml_prediction": {
+                "approval_probability": ml_pred.approval_probability,
+                "value_uplift_estimate": ml_pred.value_uplift_estimate,
+                "confidence": ml_pred.confidence,
+                "grade": ml_pred.grade,
+                "features_used": ml_pred.features_used
             }
-            top_opportunities.append(opp)
+        }
+        for parcel_id, parcel, raw, gap, score, ml_pred in zip(
+            top_ids, top_parcels, top_raws, top_gaps, top_scores, top_preds
+        )
+    ]
     
     # Update state
     state["scores"] = scores
@@ -80,7 +80,7 @@ class RoughDiamondPipeline:
     
     def node_scrape(self, state: PipelineState) -> PipelineState:
         """SCRAPE node - Fetch parcels from BCPAO"""
-        logger.info(f"[{self.run_id}] SCRAPE: Starting BCPAO data collection")
+        logger.info("[%s] SCRAPE: Starting BCPAO data collection", self.run_id)
         state["stage"] = PipelineStage.SCRAPE.value
         
         try:
@@ -91,17 +91,17 @@ class RoughDiamondPipeline:
             
             state["raw_parcels"] = parcels
             state["metrics"]["parcels_scraped"] = len(parcels)
-            logger.info(f"[{self.run_id}] SCRAPE: Found {len(parcels)} parcels")
+            logger.info("[%s] SCRAPE: Found %d parcels", self.run_id, len(parcels))
             
         except Exception as e:
             state["errors"].append(f"SCRAPE error: {str(e)}")
-            logger.error(f"[{self.run_id}] SCRAPE failed: {e}")
+            logger.error("[%s] SCRAPE failed: %s", self.run_id, e)
         
         return state
     
     def node_score(self, state: PipelineState) -> PipelineState:
         """SCORE node - Apply scoring model to parcels"""
-        logger.info(f"[{self.run_id}] SCORE: Applying XGBoost scoring model")
+        logger.info("[%s] SCORE: Applying XGBoost scoring model", self.run_id)
         state["stage"] = PipelineStage.SCORE.value
         
         try:
@@ -123,17 +123,17 @@ class RoughDiamondPipeline:
                 else: score_dist["<50"] += 1
             
             state["metrics"]["score_distribution"] = score_dist
-            logger.info(f"[{self.run_id}] SCORE: Scored {len(scored)} parcels")
+            logger.info("[%s] SCORE: Scored %d parcels", self.run_id, len(scored))
             
         except Exception as e:
             state["errors"].append(f"SCORE error: {str(e)}")
-            logger.error(f"[{self.run_id}] SCORE failed: {e}")
+            logger.error("[%s] SCORE failed: %s", self.run_id, e)
         
         return state
     
     def node_filter(self, state: PipelineState) -> PipelineState:
         """FILTER node - Extract candidates by recommendation"""
-        logger.info(f"[{self.run_id}] FILTER: Extracting candidates")
+        logger.info("[%s] FILTER: Extracting candidates", self.run_id)
         state["stage"] = PipelineStage.FILTER.value
         
         try:
@@ -145,21 +145,21 @@ class RoughDiamondPipeline:
             state["metrics"]["bid_count"] = len(bid)
             state["metrics"]["review_count"] = len(review)
             
-            logger.info(f"[{self.run_id}] FILTER: {len(bid)} BID, {len(review)} REVIEW")
+            logger.info("[%s] FILTER: %d BID, %d REVIEW", self.run_id, len(bid), len(review))
             
         except Exception as e:
             state["errors"].append(f"FILTER error: {str(e)}")
-            logger.error(f"[{self.run_id}] FILTER failed: {e}")
+            logger.error("[%s] FILTER failed: %s", self.run_id, e)
         
         return state
     
     def node_store(self, state: PipelineState) -> PipelineState:
         """STORE node - Save to Supabase"""
-        logger.info(f"[{self.run_id}] STORE: Saving to Supabase")
+        logger.info("[%s] STORE: Saving to Supabase", self.run_id)
         state["stage"] = PipelineStage.STORE.value
         
         if not self.supabase_key:
-            logger.warning(f"[{self.run_id}] STORE: No Supabase key - skipping database storage")
+            logger.warning("[%s] STORE: No Supabase key - skipping database storage", self.run_id)
             state["metrics"]["db_stored"] = False
             return state
         
@@ -173,12 +173,12 @@ class RoughDiamondPipeline:
             # Store raw parcels
             if state["raw_parcels"]:
                 client.insert_parcels_batch(state["raw_parcels"][:100])  # Limit batch size
-                logger.info(f"[{self.run_id}] STORE: Inserted parcels")
+                logger.info("[%s] STORE: Inserted parcels", self.run_id)
             
             # Store scores
             if state["scored_parcels"]:
                 client.insert_scores_batch(state["scored_parcels"][:100])
-                logger.info(f"[{self.run_id}] STORE: Inserted scores")
+                logger.info("[%s] STORE: Inserted scores", self.run_id)
             
             # Log run
             client.log_search_run({
@@ -195,13 +195,13 @@ class RoughDiamondPipeline:
         except Exception as e:
             state["errors"].append(f"STORE error: {str(e)}")
             state["metrics"]["db_stored"] = False
-            logger.error(f"[{self.run_id}] STORE failed: {e}")
+            logger.error("[%s] STORE failed: %s", self.run_id, e)
         
         return state
     
     def node_report(self, state: PipelineState) -> PipelineState:
         """REPORT node - Generate summary"""
-        logger.info(f"[{self.run_id}] REPORT: Generating summary")
+        logger.info("[%s] REPORT: Generating summary", self.run_id)
         state["stage"] = PipelineStage.REPORT.value
         
         state["metrics"]["completed_at"] = datetime.now().isoformat()
@@ -237,12 +237,12 @@ class RoughDiamondPipeline:
         with open(output_path, 'w') as f:
             json.dump(state, f, indent=2, default=str)
         
-        logger.info(f"[{self.run_id}] COMPLETE: Pipeline finished - {output_path}")
+        logger.info("[%s] COMPLETE: Pipeline finished - %s", self.run_id, output_path)
         return state
     
     def run(self, params: Dict = None) -> PipelineState:
         """Execute full pipeline"""
-        logger.info(f"Starting Rough Diamond Pipeline - Run ID: {self.run_id}")
+        logger.info("Starting Rough Diamond Pipeline - Run ID: %s", self.run_id)
         
         # Initialize state
         state = self.init_state(params)
@@ -263,7 +263,7 @@ class RoughDiamondPipeline:
             except Exception as e:
                 state["errors"].append(f"Pipeline error in {node.__name__}: {str(e)}")
                 state["status"] = "failed"
-                logger.error(f"Pipeline failed at {node.__name__}: {e}")
+                logger.error("Pipeline failed at %s: %s", node.__name__, e)
                 break
         
         return state
@@ -16,11 +16,32 @@ Part of the 12-Stage SPD Pipeline:
 9. Decision → 10. Entitlement → 11. Construction → 12. Archive
 """
 
-from dataclasses import dataclass, field
+from bisect import bisect_left
+from dataclasses import asdict, dataclass, field
+from functools import cached_property
 from typing import List, Dict, Optional, Tuple
 from enum import Enum
+import json
 import math
 
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 
 class ZoningDistrict(Enum):
     """Palm Bay Zoning Districts with density limits"""
@@ -30,15 +51,30 @@ class ZoningDistrict(Enum):
     PUD = 0     # Planned Unit Development - variable
 
 
+# Name -> member table for string zoning codes coming from pipeline state
+_ZONING: Dict[str, ZoningDistrict] = {z.name: z for z in ZoningDistrict}
+
+
+# Risk levels in ascending order - ScenarioBatch stores indices into these.
+# A % of tenants without parking up to each bound falls in that level.
+_RISK_LABELS: Tuple[str, ...] = ("LOW", "MEDIUM", "HIGH")
+_RISK_BOUNDS: Tuple[int, ...] = (25, 40)
+_RISK_RECOMMENDATIONS: Tuple[str, ...] = (
+    "RECOMMENDED - Low lease-up risk",
+    "VIABLE - Moderate lease-up risk, consider e-bike infrastructure",
+    "CAUTION - High lease-up risk, 50%+ tenants need to be car-free",
+)
+
+
 class ParkingTier(Enum):
     """Parking allocation tiers"""
     WITH_PARKING = "with_parking"
     NO_PARKING = "no_parking"
 
 
-@dataclass
+@dataclass(frozen=True)
 class SiteConstraints:
-    """Site physical constraints"""
+    """Site physical constraints (immutable - derived areas are cached)"""
     lot_sf: float                    # Total lot square footage
     lot_width: float                 # Lot width in feet
     lot_depth: float                 # Lot depth in feet
@@ -50,15 +86,15 @@ class SiteConstraints:
     max_lot_coverage: float = 0.60   # Maximum lot coverage (60%)
     max_height_no_variance: float = 25  # Max height without variance
     
-    @property
+    @cached_property
     def lot_acres(self) -> float:
         return self.lot_sf / 43560
     
-    @property
+    @cached_property
     def buildable_sf(self) -> float:
         return self.lot_sf - self.easement_sf - self.wellhead_sf
     
-    @property
+    @cached_property
     def building_envelope_sf(self) -> float:
         """Calculate building envelope after setbacks"""
         usable_width = self.lot_width - (self.side_setback * 2)
@@ -66,39 +102,45 @@ class SiteConstraints:
         usable_depth = (self.buildable_sf / self.lot_width) - self.front_setback - self.rear_setback
         return max(0, usable_width * usable_depth)
     
-    @property
+    @cached_property
     def max_footprint_sf(self) -> float:
         """Maximum building footprint based on coverage"""
         return self.building_envelope_sf * self.max_lot_coverage
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MicroUnitSpec:
     """Micro-unit specifications"""
     living_sf: int = 180          # Living/sleeping area
     kitchenette_sf: int = 70      # Kitchenette with mini-fridge, 2-burner, micro
     bathroom_sf: int = 50         # Bathroom with toilet, sink, shower
     closet_sf: int = 20           # Closet space
+    total_sf: int = field(init=False)
     
-    @property
-    def total_sf(self) -> int:
-        return self.living_sf + self.kitchenette_sf + self.bathroom_sf + self.closet_sf
+    def __post_init__(self):
+        # Spec is immutable - fold the total once at construction
+        object.__setattr__(
+            self, "total_sf", self.living_sf + self.kitchenette_sf + self.bathroom_sf + self.closet_sf
+        )
     
     def __repr__(self):
         return f"MicroUnit({self.total_sf}SF)"
 
 
-@dataclass 
+@dataclass(slots=True, frozen=True)
 class DwellingUnitConfig:
     """Configuration for a dwelling unit containing micro-units"""
     micro_units_per_dwelling: int
     micro_unit_spec: MicroUnitSpec
     shared_entry_sf: int = 60       # Internal hallway/entry
     parking_spaces_per_dwelling: int = 2  # Code requirement
+    dwelling_unit_sf: int = field(init=False)
     
-    @property
-    def dwelling_unit_sf(self) -> int:
-        return (self.micro_units_per_dwelling * self.micro_unit_spec.total_sf) + self.shared_entry_sf
+    def __post_init__(self):
+        object.__setattr__(
+            self, "dwelling_unit_sf",
+            (self.micro_units_per_dwelling * self.micro_unit_spec.total_sf) + self.shared_entry_sf
+        )
     
     @property
     def tenants_with_parking(self) -> int:
@@ -111,7 +153,7 @@ class DwellingUnitConfig:
         return max(0, self.micro_units_per_dwelling - self.parking_spaces_per_dwelling)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RentStructure:
     """Rent pricing structure"""
     rent_with_parking: int          # Monthly rent for micro-unit with parking
@@ -128,7 +170,7 @@ class RentStructure:
         )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ParkingAllocation:
     """Parking allocation results"""
     total_spaces_required: int
@@ -137,18 +179,11 @@ class ParkingAllocation:
     tenants_without_parking: int
     parking_ratio: float            # Spaces per tenant
     meets_code: bool
-    
-    @property
-    def pct_with_parking(self) -> float:
-        total = self.tenants_with_parking + self.tenants_without_parking
-        return (self.tenants_with_parking / total * 100) if total > 0 else 0
-    
-    @property
-    def pct_without_parking(self) -> float:
-        return 100 - self.pct_with_parking
+    pct_with_parking: float
+    pct_without_parking: float
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BuildingSpec:
     """Building specifications"""
     gross_sf: float
@@ -164,11 +199,11 @@ class BuildingSpec:
         return self.gross_sf / self.stories
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FinancialProjection:
     """Financial projections"""
-    monthly_gross: float
-    annual_gpr: float
+    monthly_gross: int              # Tenant counts x integer rents
+    annual_gpr: int
     vacancy_rate: float
     egi: float
     opex_rate: float
@@ -183,7 +218,7 @@ class FinancialProjection:
         return (self.noi / self.construction_cost * 100) if self.construction_cost > 0 else 0
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class UnitConfigScenario:
     """Complete unit configuration scenario"""
     name: str
@@ -200,6 +235,128 @@ class UnitConfigScenario:
     recommendation: str
 
 
+@dataclass
+class ScenarioBatch:
+    """
+    Structure-of-arrays view of many scenarios (requires numpy).
+    
+    One contiguous array per numeric field so sweeps and reports (argmax NOI,
+    top-K by cash-on-cash) are single passes. Shared inputs are scalars.
+    """
+    names: List[str]
+    dwelling_units: int
+    spaces_required: int
+    spaces_available: int
+    micro_units_per_dwelling: "np.ndarray"
+    micro_unit_sf: "np.ndarray"
+    dwelling_unit_sf: "np.ndarray"
+    total_tenants: "np.ndarray"
+    tenants_wp: "np.ndarray"
+    tenants_np: "np.ndarray"
+    pct_with_parking: "np.ndarray"
+    pct_without_parking: "np.ndarray"
+    gross_sf: "np.ndarray"
+    stories: "np.ndarray"
+    footprint: "np.ndarray"
+    height_ft: "np.ndarray"
+    fits_envelope: "np.ndarray"
+    requires_variance: "np.ndarray"
+    monthly_gross: "np.ndarray"
+    annual_gpr: "np.ndarray"
+    noi: "np.ndarray"
+    value: "np.ndarray"
+    construction_cost: "np.ndarray"
+    rent_with_parking: "np.ndarray"
+    rent_no_parking: "np.ndarray"
+    risk: "np.ndarray"              # uint8 index into _RISK_LABELS
+    
+    def __len__(self) -> int:
+        return len(self.names)
+
+
+# =============================================================================
+# VECTORIZED SCENARIO KERNELS
+# =============================================================================
+
+def _scenarios_numpy(
+    dwelling_units, micro_units, micro_sf, rent_wp, rent_np,
+    parking_per_dwelling, envelope, vacancy, opex, cap, common_area_pct
+):
+    """NumPy scenario core - returns SoA arrays, see calculate_scenarios_vectorized()"""
+    tenants_wp = dwelling_units * np.minimum(parking_per_dwelling, micro_units)
+    tenants_np = dwelling_units * micro_units - tenants_wp
+    
+    # Same truncating split as MicroUnitSpec in calculate_scenario
+    micro_total_sf = (
+        (micro_sf * 0.56).astype(np.int64) +
+        (micro_sf * 0.22).astype(np.int64) +
+        (micro_sf * 0.16).astype(np.int64) +
+        (micro_sf * 0.06).astype(np.int64)
+    )
+    dwelling_unit_sf = micro_units * micro_total_sf + np.where(micro_units == 3, 60, 80)
+    
+    # Minimum stories (2-5) whose footprint fits the envelope
+    gross_sf = dwelling_units * dwelling_unit_sf / (1 - common_area_pct)
+    if envelope > 0:
+        needed_stories = np.ceil(gross_sf / envelope)
+    else:
+        needed_stories = np.full(gross_sf.shape, np.inf)
+    stories = needed_stories.clip(2, 5).astype(np.int64)
+    
+    monthly_gross = tenants_wp * rent_wp + tenants_np * rent_np
+    egi = monthly_gross * 12 * (1 - vacancy)
+    noi = egi - egi * opex
+    
+    return (tenants_wp, tenants_np, dwelling_unit_sf, gross_sf, stories, needed_stories <= 5,
+            monthly_gross, noi, noi / cap)
+
+
+if HAS_NUMBA:
+    @njit(cache=True, parallel=True)
+    def _scenarios_kernel(
+        dwelling_units, micro_units, micro_sf, rent_wp, rent_np,
+        parking_per_dwelling, envelope, vacancy, opex, cap, common_area_pct
+    ):
+        """Compiled per-sample loop with the same outputs as _scenarios_numpy()"""
+        n = micro_units.shape[0]
+        tenants_wp = np.empty(n, dtype=np.int64)
+        tenants_np = np.empty(n, dtype=np.int64)
+        dwelling_unit_sf = np.empty(n, dtype=np.int64)
+        gross_sf = np.empty(n, dtype=np.float64)
+        stories = np.empty(n, dtype=np.int64)
+        fits_envelope = np.empty(n, dtype=np.bool_)
+        monthly_gross = np.empty(n, dtype=np.int64)
+        noi = np.empty(n, dtype=np.float64)
+        value = np.empty(n, dtype=np.float64)
+        
+        for i in prange(n):
+            micro = micro_units[i]
+            sf = micro_sf[i]
+            wp = dwelling_units * min(parking_per_dwelling, micro)
+            tenants_wp[i] = wp
+            tenants_np[i] = dwelling_units * micro - wp
+            
+            micro_total = int(sf * 0.56) + int(sf * 0.22) + int(sf * 0.16) + int(sf * 0.06)
+            du_sf = micro * micro_total + (60 if micro == 3 else 80)
+            dwelling_unit_sf[i] = du_sf
+            gross = dwelling_units * du_sf / (1 - common_area_pct)
+            gross_sf[i] = gross
+            
+            needed = math.ceil(gross / envelope) if envelope > 0 else 6
+            stories[i] = min(5, max(2, needed))
+            fits_envelope[i] = needed <= 5
+            
+            mg = wp * rent_wp[i] + (dwelling_units * micro - wp) * rent_np[i]
+            monthly_gross[i] = mg
+            egi = mg * 12 * (1 - vacancy[i])
+            noi_i = egi - egi * opex[i]
+            noi[i] = noi_i
+            value[i] = noi_i / cap[i]
+        
+        return (tenants_wp, tenants_np, dwelling_unit_sf, gross_sf, stories, fits_envelope,
+                monthly_gross, noi, value)
+
+
 class ParkingUnitCalculator:
     """
     Main calculator for parking and unit configurations.
@@ -224,10 +381,23 @@ class ParkingUnitCalculator:
     DEFAULT_OPEX_RATE = 0.42
     DEFAULT_CAP_RATE = 0.06
     
+    # Monthly gross -> EGI / NOI / value multipliers under the default rates
+    _DEFAULT_EGI_MULTIPLIER = 12 * (1 - DEFAULT_VACANCY_RATE)
+    _DEFAULT_NOI_MULTIPLIER = _DEFAULT_EGI_MULTIPLIER * (1 - DEFAULT_OPEX_RATE)
+    _DEFAULT_VALUE_MULTIPLIER = _DEFAULT_NOI_MULTIPLIER / DEFAULT_CAP_RATE
+    
     # Floor height assumptions
     FLOOR_HEIGHT_FT = 10
     PARAPET_HEIGHT_FT = 2
     
+    # Standard comparison: (name, micro-units/dwelling, micro SF, rent w/ parking, rent w/o)
+    STANDARD_SCENARIOS = (
+        # Scenario A: 4 micro-units per dwelling (compact 320 SF)
+        ("Scenario A: 4 Micro-Units per Dwelling", 4, 320, 850, 650),
+        # Scenario B: 3 micro-units per dwelling (comfortable 400 SF)
+        ("Scenario B: 3 Micro-Units per Dwelling", 3, 400, 900, 700),
+    )
+    
     def __init__(
         self,
         site: SiteConstraints,
@@ -242,6 +412,13 @@ class ParkingUnitCalculator:
         
         # Calculate max dwelling units from zoning
         self.max_dwelling_units = int(self.site.lot_acres * self.zoning.value)
+        
+        # Envelope is read for every stories candidate - resolve it once
+        self._envelope = self.site.building_envelope_sf
+        
+        # Scenarios are deterministic in their inputs (results are frozen),
+        # so graph retries replaying the same state reuse prior results
+        self._scenario_cache: Dict[tuple, UnitConfigScenario] = {}
     
     def calculate_parking_allocation(
         self,
@@ -259,6 +436,7 @@ class ParkingUnitCalculator:
         tenants_without_parking = total_tenants - tenants_with_parking
         
         parking_ratio = self.parking_available / total_tenants if total_tenants > 0 else 0
+        pct_with_parking = (tenants_with_parking / total_tenants * 100) if total_tenants > 0 else 0
         
         return ParkingAllocation(
             total_spaces_required=spaces_required,
@@ -266,7 +444,9 @@ class ParkingUnitCalculator:
             tenants_with_parking=tenants_with_parking,
             tenants_without_parking=tenants_without_parking,
             parking_ratio=round(parking_ratio, 2),
-            meets_code=self.parking_available >= spaces_required
+            meets_code=self.parking_available >= spaces_required,
+            pct_with_parking=pct_with_parking,
+            pct_without_parking=100 - pct_with_parking
         )
     
     def calculate_building_spec(
@@ -279,16 +459,10 @@ class ParkingUnitCalculator:
         total_living_sf = dwelling_units * dwelling_unit_sf
         gross_sf = total_living_sf / (1 - self.COMMON_AREA_PCT)
         
-        # Find minimum stories that fit
-        best_stories = None
-        for stories in range(2, 6):
-            footprint = gross_sf / stories
-            if footprint <= self.site.building_envelope_sf:
-                best_stories = stories
-                break
-        
-        if best_stories is None:
-            best_stories = 5  # Max out at 5 stories
+        # Minimum stories (2-5) whose footprint fits the envelope
+        envelope = self._envelope
+        needed_stories = math.ceil(gross_sf / envelope) if envelope > 0 else math.inf
+        best_stories = min(5, max(2, needed_stories))  # Max out at 5 stories
         
         footprint_sf = gross_sf / best_stories
         height_ft = (best_stories * self.FLOOR_HEIGHT_FT) + self.PARAPET_HEIGHT_FT
@@ -298,9 +472,9 @@ class ParkingUnitCalculator:
             stories=best_stories,
             footprint_sf=round(footprint_sf, 0),
             height_ft=height_ft,
-            fits_envelope=footprint_sf <= self.site.building_envelope_sf,
+            fits_envelope=needed_stories <= 5,
             requires_variance=height_ft > self.site.max_height_no_variance,
-            units_per_floor=math.ceil(dwelling_units / best_stories)
+            units_per_floor=-(-dwelling_units // best_stories)
         )
     
     def calculate_financials(
@@ -314,20 +488,31 @@ class ParkingUnitCalculator:
     ) -> FinancialProjection:
         """Calculate financial projections"""
         
-        vacancy_rate = vacancy_rate or self.DEFAULT_VACANCY_RATE
-        opex_rate = opex_rate or self.DEFAULT_OPEX_RATE
-        cap_rate = cap_rate or self.DEFAULT_CAP_RATE
-        
+        # Counts and rents are ints, so gross rent stays in integer math;
+        # floats only enter with the vacancy/opex/cap rates
         monthly_gross = (
             (parking.tenants_with_parking * rent_structure.rent_with_parking) +
             (parking.tenants_without_parking * rent_structure.rent_no_parking)
         )
-        
         annual_gpr = monthly_gross * 12
-        egi = annual_gpr * (1 - vacancy_rate)
-        opex = egi * opex_rate
-        noi = egi - opex
-        value = noi / cap_rate
+        
+        if not (vacancy_rate or opex_rate or cap_rate):
+            # Default assumptions - NOI and value are a single multiply each
+            vacancy_rate = self.DEFAULT_VACANCY_RATE
+            opex_rate = self.DEFAULT_OPEX_RATE
+            cap_rate = self.DEFAULT_CAP_RATE
+            egi = monthly_gross * self._DEFAULT_EGI_MULTIPLIER
+            opex = egi * opex_rate
+            noi = monthly_gross * self._DEFAULT_NOI_MULTIPLIER
+            value = monthly_gross * self._DEFAULT_VALUE_MULTIPLIER
+        else:
+            vacancy_rate = vacancy_rate or self.DEFAULT_VACANCY_RATE
+            opex_rate = opex_rate or self.DEFAULT_OPEX_RATE
+            cap_rate = cap_rate or self.DEFAULT_CAP_RATE
+            egi = annual_gpr * (1 - vacancy_rate)
+            opex = egi * opex_rate
+            noi = egi - opex
+            value = noi / cap_rate
         
         construction_cost = building.gross_sf * self.CONSTRUCTION_COST_PER_SF
         
@@ -346,14 +531,7 @@ class ParkingUnitCalculator:
     
     def assess_risk(self, parking: ParkingAllocation) -> str:
         """Assess market risk based on parking ratio"""
-        pct_no_parking = parking.pct_without_parking
-        
-        if pct_no_parking <= 25:
-            return "LOW"
-        elif pct_no_parking <= 40:
-            return "MEDIUM"
-        else:
-            return "HIGH"
+        return _RISK_LABELS[bisect_left(_RISK_BOUNDS, parking.pct_without_parking)]
     
     def calculate_scenario(
         self,
@@ -364,10 +542,18 @@ class ParkingUnitCalculator:
         rent_no_parking: int,
         dwelling_units: int = None
     ) -> UnitConfigScenario:
-        """Calculate a complete scenario"""
+        """Calculate a complete scenario (memoized per calculator)"""
         
         dwelling_units = dwelling_units or self.max_dwelling_units
         
+        cache_key = (
+            name, micro_units_per_dwelling, micro_unit_sf, rent_with_parking, rent_no_parking,
+            dwelling_units, self.parking_available, self.parking_per_dwelling
+        )
+        cached = self._scenario_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
         # Create micro-unit spec
         micro_spec = MicroUnitSpec(
             living_sf=int(micro_unit_sf * 0.56),      # ~56% living
@@ -410,14 +596,9 @@ class ParkingUnitCalculator:
         risk_level = self.assess_risk(parking)
         
         # Generate recommendation
-        if risk_level == "LOW":
-            recommendation = "RECOMMENDED - Low lease-up risk"
-        elif risk_level == "MEDIUM":
-            recommendation = "VIABLE - Moderate lease-up risk, consider e-bike infrastructure"
-        else:
-            recommendation = "CAUTION - High lease-up risk, 50%+ tenants need to be car-free"
+        recommendation = _RISK_RECOMMENDATIONS[_RISK_LABELS.index(risk_level)]
         
-        return UnitConfigScenario(
+        scenario = UnitConfigScenario(
             name=name,
             dwelling_units=dwelling_units,
             micro_units_per_dwelling=micro_units_per_dwelling,
@@ -431,36 +612,158 @@ class ParkingUnitCalculator:
             risk_level=risk_level,
             recommendation=recommendation
         )
+        self._scenario_cache[cache_key] = scenario
+        return scenario
     
     def calculate_all_scenarios(self) -> List[UnitConfigScenario]:
         """Calculate both 3-micro and 4-micro scenarios"""
+        return [
+            self.calculate_scenario(
+                name=name,
+                micro_units_per_dwelling=micro_units,
+                micro_unit_sf=micro_sf,
+                rent_with_parking=rent_wp,
+                rent_no_parking=rent_np
+            )
+            for name, micro_units, micro_sf, rent_wp, rent_np in self.STANDARD_SCENARIOS
+        ]
+    
+    def calculate_all_scenarios_batch(self) -> ScenarioBatch:
+        """Calculate the standard scenarios as a ScenarioBatch (requires numpy)"""
+        names, micro_units, micro_sf, rent_wp, rent_np = zip(*self.STANDARD_SCENARIOS)
+        return self.calculate_batch(list(names), micro_units, micro_sf, rent_wp, rent_np)
+    
+    def calculate_batch(
+        self,
+        names: List[str],
+        micro_units_arr: "np.ndarray",
+        micro_sf_arr: "np.ndarray",
+        rent_wp_arr: "np.ndarray",
+        rent_np_arr: "np.ndarray",
+        dwelling_units: int = None
+    ) -> ScenarioBatch:
+        """Wrap calculate_scenarios_vectorized() output in a ScenarioBatch"""
+        dwelling_units = dwelling_units or self.max_dwelling_units
+        micro_units = np.asarray(micro_units_arr, dtype=np.int64)
+        rent_wp = np.asarray(rent_wp_arr, dtype=np.int64)
+        rent_np = np.asarray(rent_np_arr, dtype=np.int64)
+        result = self.calculate_scenarios_vectorized(
+            micro_units, micro_sf_arr, rent_wp, rent_np, dwelling_units=dwelling_units
+        )
+        pct_np = result["pct_without_parking"]
         
-        scenarios = []
-        
-        # Scenario A: 4 micro-units per dwelling (compact 320 SF)
-        scenario_a = self.calculate_scenario(
-            name="Scenario A: 4 Micro-Units per Dwelling",
-            micro_units_per_dwelling=4,
-            micro_unit_sf=320,
-            rent_with_parking=850,
-            rent_no_parking=650
+        return ScenarioBatch(
+            names=names,
+            dwelling_units=dwelling_units,
+            spaces_required=dwelling_units * self.parking_per_dwelling,
+            spaces_available=self.parking_available,
+            micro_units_per_dwelling=micro_units,
+            micro_unit_sf=np.asarray(micro_sf_arr, dtype=np.int64),
+            dwelling_unit_sf=result["dwelling_unit_sf"],
+            total_tenants=result["total_tenants"],
+            tenants_wp=result["tenants_with_parking"],
+            tenants_np=result["tenants_without_parking"],
+            pct_with_parking=result["pct_with_parking"],
+            pct_without_parking=pct_np,
+            gross_sf=result["gross_sf"],
+            stories=result["stories"],
+            footprint=result["footprint_sf"],
+            height_ft=result["height_ft"],
+            fits_envelope=result["fits_envelope"],
+            requires_variance=result["requires_variance"],
+            monthly_gross=result["monthly_gross"],
+            annual_gpr=result["annual_gpr"],
+            noi=result["noi"],
+            value=result["value"],
+            construction_cost=result["construction_cost"],
+            rent_with_parking=rent_wp,
+            rent_no_parking=rent_np,
+            risk=np.searchsorted(_RISK_BOUNDS, pct_np, side="left").astype(np.uint8)
         )
-        scenarios.append(scenario_a)
+    
+    def calculate_scenarios_vectorized(
+        self,
+        micro_units_arr: "np.ndarray",
+        micro_sf_arr: "np.ndarray",
+        rent_wp_arr: "np.ndarray",
+        rent_np_arr: "np.ndarray",
+        dwelling_units: int = None,
+        vacancy_rate: "float | np.ndarray" = None,
+        opex_rate: "float | np.ndarray" = None,
+        cap_rate: "float | np.ndarray" = None
+    ) -> Dict[str, "np.ndarray"]:
+        """
+        Calculate many scenarios in one pass for sensitivity sweeps.
         
-        # Scenario B: 3 micro-units per dwelling (comfortable 400 SF)
-        scenario_b = self.calculate_scenario(
-            name="Scenario B: 3 Micro-Units per Dwelling",
-            micro_units_per_dwelling=3,
-            micro_unit_sf=400,
-            rent_with_parking=900,
-            rent_no_parking=700
+        Element-wise equivalent of calculate_scenario() over the parameter
+        arrays. Rates may be scalars or per-sample arrays (Monte-Carlo runs)
+        and default to the class assumptions. The numeric core runs in a
+        Numba-compiled kernel when numba is installed. Returns a dict of
+        arrays keyed by field name - only build UnitConfigScenario objects
+        for the rows that are actually reported.
+        """
+        if not HAS_NUMPY:
+            raise ImportError("numpy required for vectorized scenarios. Install with: pip install numpy")
+        
+        dwelling_units = dwelling_units or self.max_dwelling_units
+        micro_units = np.ascontiguousarray(micro_units_arr, dtype=np.int64)
+        n = micro_units.shape[0]
+        
+        def _rates(rate, default):
+            rate = default if rate is None else rate
+            return np.ascontiguousarray(np.broadcast_to(np.asarray(rate, dtype=np.float64), (n,)))
+        
+        kernel = _scenarios_kernel if HAS_NUMBA else _scenarios_numpy
+        (tenants_wp, tenants_np, dwelling_unit_sf, gross_sf, stories, fits_envelope,
+         monthly_gross, noi, value) = kernel(
+            dwelling_units,
+            micro_units,
+            np.ascontiguousarray(micro_sf_arr, dtype=np.float64),
+            np.ascontiguousarray(rent_wp_arr, dtype=np.int64),
+            np.ascontiguousarray(rent_np_arr, dtype=np.int64),
+            self.parking_per_dwelling,
+            self._envelope,
+            _rates(vacancy_rate, self.DEFAULT_VACANCY_RATE),
+            _rates(opex_rate, self.DEFAULT_OPEX_RATE),
+            _rates(cap_rate, self.DEFAULT_CAP_RATE),
+            self.COMMON_AREA_PCT
         )
-        scenarios.append(scenario_b)
         
-        return scenarios
+        total_tenants = tenants_wp + tenants_np
+        pct_wp = np.where(total_tenants > 0, tenants_wp * 100.0 / np.maximum(total_tenants, 1), 0.0)
+        height_ft = stories * self.FLOOR_HEIGHT_FT + self.PARAPET_HEIGHT_FT
+        gross_sf_rounded = np.round(gross_sf, 0)
+        
+        return {
+            "total_tenants": total_tenants,
+            "tenants_with_parking": tenants_wp,
+            "tenants_without_parking": tenants_np,
+            "pct_with_parking": pct_wp,
+            "pct_without_parking": 100 - pct_wp,
+            "dwelling_unit_sf": dwelling_unit_sf,
+            "gross_sf": gross_sf_rounded,
+            "stories": stories,
+            "footprint_sf": np.round(gross_sf / stories, 0),
+            "height_ft": height_ft,
+            "fits_envelope": fits_envelope,
+            "requires_variance": height_ft > self.site.max_height_no_variance,
+            "monthly_gross": monthly_gross,
+            "annual_gpr": monthly_gross * 12,
+            "noi": np.round(noi, 0),
+            "value": np.round(value, 0),
+            "construction_cost": np.round(gross_sf_rounded * self.CONSTRUCTION_COST_PER_SF, 0)
+        }
     
     def to_dict(self, scenario: UnitConfigScenario) -> Dict:
         """Convert scenario to dictionary for JSON serialization"""
+        p = scenario.parking
+        b = scenario.building
+        f = scenario.financials
+        r = scenario.rent_structure
+        pct_with_parking = round(p.pct_with_parking, 1)
+        pct_without_parking = round(p.pct_without_parking, 1)
+        cash_on_cash = round(f.cash_on_cash, 1)
+        
         return {
             "name": scenario.name,
             "dwelling_units": scenario.dwelling_units,
@@ -469,44 +772,141 @@ class ParkingUnitCalculator:
             "micro_unit_sf": scenario.micro_unit_sf,
             "dwelling_unit_sf": scenario.dwelling_unit_sf,
             "parking": {
-                "spaces_required": scenario.parking.total_spaces_required,
-                "spaces_available": scenario.parking.total_spaces_available,
-                "tenants_with_parking": scenario.parking.tenants_with_parking,
-                "tenants_without_parking": scenario.parking.tenants_without_parking,
-                "pct_with_parking": round(scenario.parking.pct_with_parking, 1),
-                "pct_without_parking": round(scenario.parking.pct_without_parking, 1),
-                "parking_ratio": scenario.parking.parking_ratio,
-                "meets_code": scenario.parking.meets_code
+                "spaces_required": p.total_spaces_required,
+                "spaces_available": p.total_spaces_available,
+                "tenants_with_parking": p.tenants_with_parking,
+                "tenants_without_parking": p.tenants_without_parking,
+                "pct_with_parking": pct_with_parking,
+                "pct_without_parking": pct_without_parking,
+                "parking_ratio": p.parking_ratio,
+                "meets_code": p.meets_code
             },
             "building": {
-                "gross_sf": scenario.building.gross_sf,
-                "stories": scenario.building.stories,
-                "footprint_sf": scenario.building.footprint_sf,
-                "height_ft": scenario.building.height_ft,
-                "fits_envelope": scenario.building.fits_envelope,
-                "requires_variance": scenario.building.requires_variance
+                "gross_sf": b.gross_sf,
+                "stories": b.stories,
+                "footprint_sf": b.footprint_sf,
+                "height_ft": b.height_ft,
+                "fits_envelope": b.fits_envelope,
+                "requires_variance": b.requires_variance
             },
             "financials": {
-                "monthly_gross": scenario.financials.monthly_gross,
-                "annual_gpr": scenario.financials.annual_gpr,
-                "noi": scenario.financials.noi,
-                "value_at_cap": scenario.financials.value,
-                "construction_cost": scenario.financials.construction_cost,
-                "cash_on_cash": round(scenario.financials.cash_on_cash, 1)
+                "monthly_gross": f.monthly_gross,
+                "annual_gpr": f.annual_gpr,
+                "noi": f.noi,
+                "value_at_cap": f.value,
+                "construction_cost": f.construction_cost,
+                "cash_on_cash": cash_on_cash
             },
             "rent": {
-                "with_parking": scenario.rent_structure.rent_with_parking,
-                "no_parking": scenario.rent_structure.rent_no_parking
+                "with_parking": r.rent_with_parking,
+                "no_parking": r.rent_no_parking
             },
             "risk_level": scenario.risk_level,
             "recommendation": scenario.recommendation
         }
 
 
+    def to_json(self, scenarios: List[UnitConfigScenario]) -> bytes:
+        """
+        Serialize scenarios straight from their dataclass fields.
+        
+        orjson reads the slotted dataclasses natively; without it this falls
+        back to json + asdict(). Unlike to_dict(), values are unrounded and
+        keyed by field name.
+        """
+        if HAS_ORJSON:
+            return orjson.dumps(scenarios)
+        return json.dumps([asdict(s) for s in scenarios]).encode("utf-8")
+    
+    def to_dicts_batch(self, batch: ScenarioBatch) -> List[Dict]:
+        """Convert a ScenarioBatch to to_dict()-shaped dicts in a single pass"""
+        meets_code = batch.spaces_available >= batch.spaces_required
+        columns = zip(
+            batch.names,
+            batch.micro_units_per_dwelling.tolist(),
+            batch.total_tenants.tolist(),
+            batch.micro_unit_sf.tolist(),
+            batch.dwelling_unit_sf.tolist(),
+            batch.tenants_wp.tolist(),
+            batch.tenants_np.tolist(),
+            batch.pct_with_parking.round(1).tolist(),
+            batch.pct_without_parking.round(1).tolist(),
+            batch.gross_sf.tolist(),
+            batch.stories.tolist(),
+            batch.footprint.tolist(),
+            batch.height_ft.tolist(),
+            batch.fits_envelope.tolist(),
+            batch.requires_variance.tolist(),
+            batch.monthly_gross.tolist(),
+            batch.annual_gpr.tolist(),
+            batch.noi.tolist(),
+            batch.value.tolist(),
+            batch.construction_cost.tolist(),
+            batch.rent_with_parking.tolist(),
+            batch.rent_no_parking.tolist(),
+            batch.risk.tolist()
+        )
+        
+        return [
+            {
+                "name": name,
+                "dwelling_units": batch.dwelling_units,
+                "micro_units_per_dwelling": micro_units,
+                "total_tenants": tenants,
+                "micro_unit_sf": micro_sf,
+                "dwelling_unit_sf": dwelling_sf,
+                "parking": {
+                    "spaces_required": batch.spaces_required,
+                    "spaces_available": batch.spaces_available,
+                    "tenants_with_parking": tenants_wp,
+                    "tenants_without_parking": tenants_np,
+                    "pct_with_parking": pct_wp,
+                    "pct_without_parking": pct_np,
+                    "parking_ratio": round(batch.spaces_available / tenants, 2) if tenants > 0 else 0,
+                    "meets_code": meets_code
+                },
+                "building": {
+                    "gross_sf": gross_sf,
+                    "stories": stories,
+                    "footprint_sf": footprint,
+                    "height_ft": height_ft,
+                    "fits_envelope": fits,
+                    "requires_variance": variance
+                },
+                "financials": {
+                    "monthly_gross": monthly_gross,
+                    "annual_gpr": annual_gpr,
+                    "noi": noi,
+                    "value_at_cap": value,
+                    "construction_cost": cost,
+                    "cash_on_cash": round(noi / cost * 100 if cost > 0 else 0, 1)
+                },
+                "rent": {
+                    "with_parking": rent_wp,
+                    "no_parking": rent_np
+                },
+                "risk_level": _RISK_LABELS[risk],
+                "recommendation": _RISK_RECOMMENDATIONS[risk]
+            }
+            for (name, micro_units, tenants, micro_sf, dwelling_sf, tenants_wp, tenants_np, pct_wp, pct_np,
+                 gross_sf, stories, footprint, height_ft, fits, variance, monthly_gross, annual_gpr,
+                 noi, value, cost, rent_wp, rent_np, risk) in columns
+        ]
+
+
 # =============================================================================
 # LANGGRAPH NODE FUNCTION
 # =============================================================================
 
+# (scenario A is HIGH risk, A's NOI edge under 25%) -> (recommended, reason template)
+_COMPARISON_RECOMMENDATIONS: Dict[Tuple[bool, bool], Tuple[str, str]] = {
+    (True, True): ("Scenario B", "Lower risk ({risk_b}) with only {noi_diff_pct:.0f}% less NOI"),
+    (True, False): ("Scenario A", "Higher NOI (+${noi_diff:,.0f}/yr) justifies risk"),
+    (False, True): ("Scenario A", "Higher NOI (+${noi_diff:,.0f}/yr) with acceptable risk"),
+    (False, False): ("Scenario A", "Higher NOI (+${noi_diff:,.0f}/yr) with acceptable risk"),
+}
+
+
 def parking_unit_analysis_node(state: Dict) -> Dict:
     """
     LangGraph node for parking and unit configuration analysis.
@@ -539,7 +939,7 @@ def parking_unit_analysis_node(state: Dict) -> Dict:
     
     # Get zoning
     zoning_str = state.get("zoning_district", "RM_20")
-    zoning = ZoningDistrict[zoning_str]
+    zoning = _ZONING[zoning_str]
     
     # Get parking
     parking_available = state.get("parking_available", 42)
@@ -561,35 +961,32 @@ def parking_unit_analysis_node(state: Dict) -> Dict:
     # Prefer scenario with lower risk unless NOI difference is significant
     scenario_a = scenarios[0]
     scenario_b = scenarios[1]
+    noi_a = scenario_a.financials.noi
+    noi_b = scenario_b.financials.noi
     
-    noi_diff = scenario_a.financials.noi - scenario_b.financials.noi
-    noi_diff_pct = (noi_diff / scenario_b.financials.noi * 100) if scenario_b.financials.noi > 0 else 0
+    noi_diff = noi_a - noi_b
+    noi_diff_pct = (noi_diff / noi_b * 100) if noi_b > 0 else 0
     
-    if scenario_a.risk_level == "HIGH" and noi_diff_pct < 25:
-        recommended = "Scenario B"
-        reason = f"Lower risk ({scenario_b.risk_level}) with only {noi_diff_pct:.0f}% less NOI"
-    elif scenario_a.risk_level == "HIGH":
-        recommended = "Scenario A"
-        reason = f"Higher NOI (+${noi_diff:,.0f}/yr) justifies risk"
-    else:
-        recommended = "Scenario A"
-        reason = f"Higher NOI (+${noi_diff:,.0f}/yr) with acceptable risk"
-    
-    # Update state
-    return {
-        **state,
-        "parking_analysis": {
-            "scenarios": scenario_dicts,
-            "comparison": {
-                "noi_difference": noi_diff,
-                "noi_difference_pct": round(noi_diff_pct, 1),
-                "tenant_difference": scenario_a.total_tenants - scenario_b.total_tenants
-            }
-        },
-        "recommended_scenario": recommended,
-        "recommendation_reason": reason,
-        "unit_config_complete": True
+    a_is_high_risk = scenario_a.risk_level == "HIGH"
+    recommended, reason_template = _COMPARISON_RECOMMENDATIONS[(a_is_high_risk, noi_diff_pct < 25)]
+    reason = reason_template.format(
+        risk_b=scenario_b.risk_level, noi_diff=noi_diff, noi_diff_pct=noi_diff_pct
+    )
+    
+    # Update state in place - no shallow copy of the full pipeline state
+    state["parking_analysis"] = {
+        "scenarios": scenario_dicts,
+        "comparison": {
+            "noi_difference": noi_diff,
+            "noi_difference_pct": round(noi_diff_pct, 1),
+            "tenant_difference": scenario_a.total_tenants - scenario_b.total_tenants
+        }
     }
+    state["recommended_scenario"] = recommended
+    state["recommendation_reason"] = reason
+    state["unit_config_complete"] = True
+    
+    return state
 
 
 # =============================================================================
@@ -597,6 +994,14 @@ def parking_unit_analysis_node(state: Dict) -> Dict:
 # =============================================================================
 
 if __name__ == "__main__":
+    import io
+    import sys
+    from functools import partial
+    
+    # Buffer the whole report and write it to stdout once
+    report = io.StringIO()
+    emit = partial(print, file=report)
+    
     # Bliss Palm Bay site constraints
     site = SiteConstraints(
         lot_sf=46394,
@@ -617,62 +1022,62 @@ if __name__ == "__main__":
         parking_available=42
     )
     
-    print("=" * 80)
-    print("BLISS PALM BAY - PARKING & UNIT CONFIGURATION ANALYSIS")
-    print("=" * 80)
-    print(f"\nSite: {site.lot_acres:.3f} acres ({site.lot_sf:,} SF)")
-    print(f"Zoning: RM-20 (Max {calculator.max_dwelling_units} dwelling units)")
-    print(f"Parking Available: {calculator.parking_available} spaces")
-    print(f"Building Envelope: {site.building_envelope_sf:,.0f} SF")
+    emit("=" * 80)
+    emit("BLISS PALM BAY - PARKING & UNIT CONFIGURATION ANALYSIS")
+    emit("=" * 80)
+    emit(f"\nSite: {site.lot_acres:.3f} acres ({site.lot_sf:,} SF)")
+    emit(f"Zoning: RM-20 (Max {calculator.max_dwelling_units} dwelling units)")
+    emit(f"Parking Available: {calculator.parking_available} spaces")
+    emit(f"Building Envelope: {site.building_envelope_sf:,.0f} SF")
     
     # Calculate scenarios
     scenarios = calculator.calculate_all_scenarios()
     
     for scenario in scenarios:
-        print(f"\n{'='*80}")
-        print(f"{scenario.name}")
-        print("=" * 80)
-        
-        print(f"\n  CONFIGURATION:")
-        print(f"    Dwelling Units:        {scenario.dwelling_units}")
-        print(f"    Micro-Units/Dwelling:  {scenario.micro_units_per_dwelling}")
-        print(f"    Total Tenants:         {scenario.total_tenants}")
-        print(f"    Micro-Unit Size:       {scenario.micro_unit_sf} SF")
-        print(f"    Dwelling Unit Size:    {scenario.dwelling_unit_sf} SF")
-        
-        print(f"\n  PARKING:")
-        print(f"    Required:              {scenario.parking.total_spaces_required}")
-        print(f"    Available:             {scenario.parking.total_spaces_available}")
-        print(f"    Meets Code:            {'✅ YES' if scenario.parking.meets_code else '❌ NO'}")
-        print(f"    With Parking:          {scenario.parking.tenants_with_parking} ({scenario.parking.pct_with_parking:.0f}%)")
-        print(f"    Without Parking:       {scenario.parking.tenants_without_parking} ({scenario.parking.pct_without_parking:.0f}%)")
-        print(f"    Parking Ratio:         {scenario.parking.parking_ratio} spaces/tenant")
-        
-        print(f"\n  BUILDING:")
-        print(f"    Gross SF:              {scenario.building.gross_sf:,.0f}")
-        print(f"    Stories:               {scenario.building.stories}")
-        print(f"    Footprint:             {scenario.building.footprint_sf:,.0f} SF")
-        print(f"    Height:                {scenario.building.height_ft} ft")
-        print(f"    Fits Envelope:         {'✅ YES' if scenario.building.fits_envelope else '❌ NO'}")
-        print(f"    Requires Variance:     {'⚠️ YES' if scenario.building.requires_variance else '✅ NO'}")
-        
-        print(f"\n  FINANCIALS:")
-        print(f"    Monthly Gross:         ${scenario.financials.monthly_gross:,}")
-        print(f"    Annual NOI:            ${scenario.financials.noi:,.0f}")
-        print(f"    Value @ 6%:            ${scenario.financials.value:,.0f}")
-        print(f"    Construction Cost:     ${scenario.financials.construction_cost:,.0f}")
-        print(f"    Cash-on-Cash:          {scenario.financials.cash_on_cash:.1f}%")
-        
-        print(f"\n  RISK: {scenario.risk_level}")
-        print(f"  {scenario.recommendation}")
+        emit(f"\n{'='*80}")
+        emit(f"{scenario.name}")
+        emit("=" * 80)
+        
+        emit(f"\n  CONFIGURATION:")
+        emit(f"    Dwelling Units:        {scenario.dwelling_units}")
+        emit(f"    Micro-Units/Dwelling:  {scenario.micro_units_per_dwelling}")
+        emit(f"    Total Tenants:         {scenario.total_tenants}")
+        emit(f"    Micro-Unit Size:       {scenario.micro_unit_sf} SF")
+        emit(f"    Dwelling Unit Size:    {scenario.dwelling_unit_sf} SF")
+        
+        emit(f"\n  PARKING:")
+        emit(f"    Required:              {scenario.parking.total_spaces_required}")
+        emit(f"    Available:             {scenario.parking.total_spaces_available}")
+        emit(f"    Meets Code:            {'✅ YES' if scenario.parking.meets_code else '❌ NO'}")
+        emit(f"    With Parking:          {scenario.parking.tenants_with_parking} ({scenario.parking.pct_with_parking:.0f}%)")
+        emit(f"    Without Parking:       {scenario.parking.tenants_without_parking} ({scenario.parking.pct_without_parking:.0f}%)")
+        emit(f"    Parking Ratio:         {scenario.parking.parking_ratio} spaces/tenant")
+        
+        emit(f"\n  BUILDING:")
+        emit(f"    Gross SF:              {scenario.building.gross_sf:,.0f}")
+        emit(f"    Stories:               {scenario.building.stories}")
+        emit(f"    Footprint:             {scenario.building.footprint_sf:,.0f} SF")
+        emit(f"    Height:                {scenario.building.height_ft} ft")
+        emit(f"    Fits Envelope:         {'✅ YES' if scenario.building.fits_envelope else '❌ NO'}")
+        emit(f"    Requires Variance:     {'⚠️ YES' if scenario.building.requires_variance else '✅ NO'}")
+        
+        emit(f"\n  FINANCIALS:")
+        emit(f"    Monthly Gross:         ${scenario.financials.monthly_gross:,}")
+        emit(f"    Annual NOI:            ${scenario.financials.noi:,.0f}")
+        emit(f"    Value @ 6%:            ${scenario.financials.value:,.0f}")
+        emit(f"    Construction Cost:     ${scenario.financials.construction_cost:,.0f}")
+        emit(f"    Cash-on-Cash:          {scenario.financials.cash_on_cash:.1f}%")
+        
+        emit(f"\n  RISK: {scenario.risk_level}")
+        emit(f"  {scenario.recommendation}")
     
     # Summary comparison
-    print(f"\n{'='*80}")
-    print("SUMMARY COMPARISON")
-    print("=" * 80)
+    emit(f"\n{'='*80}")
+    emit("SUMMARY COMPARISON")
+    emit("=" * 80)
     
     a, b = scenarios[0], scenarios[1]
-    print(f"""
+    emit(f"""
     ┌────────────────────────────────────────────────────────────────────┐
     │                    Scenario A          Scenario B                  │
     │                    (21 × 4 micro)      (21 × 3 micro)              │
@@ -684,3 +1089,5 @@ if __name__ == "__main__":
     │  Risk Level        {a.risk_level:<20} {b.risk_level:<20} │
     └────────────────────────────────────────────────────────────────────┘
     """)
+    
+    sys.stdout.write(report.getvalue())
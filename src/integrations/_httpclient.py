@@ -0,0 +1,245 @@
+"""
+Shared HTTP Client Configuration
+================================
+Connection-pool settings, client factory and the process-wide shared
+client used by the integration clients (BCPAO, municipal GIS, FEMA,
+Census, Apify, ...).
+"""
+
+import os
+import json
+import random
+import asyncio
+import weakref
+from functools import partial
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Sequence
+
+import httpx
+
+# HTTP/2 needs the h2 package (pip install httpx[http2])
+try:
+    import h2  # noqa: F401
+    HAS_H2 = True
+except ImportError:
+    HAS_H2 = False
+
+# Multiplex concurrent requests to one host over a single connection;
+# SPD_HTTP2=0 falls back to HTTP/1.1 keep-alive pooling
+HTTP2_ENABLED = HAS_H2 and os.environ.get("SPD_HTTP2", "1") != "0"
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+POOL_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50, keepalive_expiry=30.0)
+
+# The shared client carries every integration's traffic, so it gets a larger pool
+SHARED_POOL_LIMITS = httpx.Limits(max_connections=128, max_keepalive_connections=64, keepalive_expiry=30.0)
+
+# Transport-level retries cover connect failures only (not HTTP status codes)
+CONNECT_RETRIES = 2
+
+# Responses worth retrying: throttled or transiently unavailable
+RETRY_STATUS = frozenset({429, 500, 502, 503, 504})
+
+# A non-idempotent request (e.g. a POST that starts a billed job) may have
+# been acted on after a 5xx or a read timeout, so it is only retried when
+# the server provably did not process it: throttled, or never connected
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+UNSAFE_RETRY_STATUS = frozenset({429})
+UNSENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+
+def make_client(timeout: float = 30, limits: httpx.Limits = POOL_LIMITS) -> httpx.AsyncClient:
+    """AsyncClient with tuned keep-alive pool limits, HTTP/2 when enabled"""
+    transport = httpx.AsyncHTTPTransport(http2=HTTP2_ENABLED, limits=limits, retries=CONNECT_RETRIES)
+    return httpx.AsyncClient(timeout=timeout, transport=transport)
+
+
+def loads_json(response: httpx.Response) -> Any:
+    """Decode a (fully read) response body, with orjson when available"""
+    if HAS_ORJSON:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def loads_content(content: bytes) -> Any:
+    """Decode a raw JSON body (e.g. one kept in a cache), with orjson when available"""
+    if HAS_ORJSON:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def dumps_json(data: Any) -> bytes:
+    """
+    Encode a request body once, with orjson when available. The fallback
+    emits the same compact UTF-8 as orjson (and httpx's ``json=``), so
+    body sizes - and the batch chunking built on them - do not depend on
+    which encoder is installed.
+    """
+    if HAS_ORJSON:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def retry_delay(response: Optional[httpx.Response], attempt: int, base: float = 1.0, cap: float = 30.0) -> float:
+    """Honor Retry-After (seconds) if sent, else jittered exponential backoff"""
+    retry_after = response.headers.get("Retry-After") if response is not None else None
+    if retry_after:
+        try:
+            return min(float(retry_after), 60.0)
+        except ValueError:
+            pass
+    return min(base * (2 ** attempt + random.random()), cap)
+
+
+# One pooled client per event loop - connections cannot cross loops
+_shared_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_shared_client() -> httpx.AsyncClient:
+    """Pooled keep-alive AsyncClient shared by every API client on the running loop"""
+    loop = asyncio.get_running_loop()
+    client = _shared_clients.get(loop)
+    if client is None or client.is_closed:
+        client = make_client(60, limits=SHARED_POOL_LIMITS)
+        _shared_clients[loop] = client
+    return client
+
+
+async def close_shared_client() -> None:
+    """Close the running loop's shared client (call once at shutdown)"""
+    client = _shared_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+async def warm_up(client: httpx.AsyncClient, *urls: str) -> None:
+    """
+    Open connections (TLS + HTTP/2 negotiation) to each URL's host ahead
+    of a burst of requests. Failures are ignored - the burst will retry.
+    """
+    async def head(url):
+        try:
+            await client.head(url, timeout=10)
+        except httpx.HTTPError:
+            pass
+
+    await asyncio.gather(*(head(url) for url in urls))
+
+
+async def gather_with_defaults(aws: Sequence[Awaitable[Any]], defaults: Sequence[Any]) -> List[Any]:
+    """
+    Run ``aws`` concurrently, replacing the result of any that raised
+    with its entry in ``defaults``. The happy path is a plain gather;
+    per-task outcomes are only inspected once something has failed.
+    """
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    try:
+        return await asyncio.gather(*tasks)
+    except Exception:
+        await asyncio.wait(tasks)
+        return [
+            default if task.cancelled() or task.exception() is not None else task.result()
+            for task, default in zip(tasks, defaults)
+        ]
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent identical calls: the first caller for a key starts
+    ``fetch()`` as a task, callers arriving while it is in flight await the
+    same result (or exception) instead of issuing their own request.
+    
+    Every caller awaits the task through ``asyncio.shield``, so cancelling
+    one caller (a timeout, a dropped client) never cancels the others.
+    """
+
+    def __init__(self):
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+
+    async def do(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fetch())
+            self._inflight[key] = task
+            task.add_done_callback(partial(self._done, key))
+        return await asyncio.shield(task)
+
+    def _done(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            task.exception()  # retrieved - no "never retrieved" warning if every caller left
+
+
+class AsyncClientContext:
+    """Mixin: ``async with Client() as c:`` closes the client on exit"""
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+
+class SharedClientBase(AsyncClientContext):
+    """
+    Base for integration clients: requests go through an injected
+    AsyncClient or, by default, the shared per-loop pool. The client is
+    owned by the caller / the loop, so close() leaves it open.
+
+    ``_request`` retries transport errors and 429/5xx responses with
+    jittered exponential backoff, applying ``rate_limiter`` (if set)
+    before every attempt. Non-idempotent methods (POST, PATCH) are only
+    retried on 429 and connect errors unless the caller passes
+    ``idempotent=True`` (e.g. a read-only POST query).
+    """
+
+    MAX_RETRIES = 2
+    RETRY_STATUS = RETRY_STATUS
+    RETRY_BACKOFF = 0.2  # seconds, doubled per attempt
+    RETRY_BACKOFF_MAX = 2.0
+
+    rate_limiter = None
+
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
+        self._client = client
+        self._flights = SingleFlight()
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        return self._client if self._client is not None else get_shared_client()
+
+    async def _request(
+        self, method: str, url: str, idempotent: Optional[bool] = None, **kwargs
+    ) -> httpx.Response:
+        host = httpx.URL(url).host if self.rate_limiter is not None else None
+        if idempotent is None:
+            idempotent = method.upper() in IDEMPOTENT_METHODS
+        retry_status = self.RETRY_STATUS if idempotent else self.RETRY_STATUS & UNSAFE_RETRY_STATUS
+        retry_errors = httpx.TransportError if idempotent else UNSENT_ERRORS
+        for attempt in range(self.MAX_RETRIES + 1):
+            if host is not None:
+                await self.rate_limiter.acquire(host)
+            try:
+                response = await self.client.request(method, url, **kwargs)
+            except retry_errors:
+                if attempt == self.MAX_RETRIES:
+                    raise
+                response = None
+            else:
+                if response.status_code not in retry_status or attempt == self.MAX_RETRIES:
+                    return response
+            await asyncio.sleep(retry_delay(response, attempt, self.RETRY_BACKOFF, self.RETRY_BACKOFF_MAX))
+
+    async def _single_flight(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        return await self._flights.do(key, fetch)
+
+    async def close(self):
+        pass
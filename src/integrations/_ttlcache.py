@@ -0,0 +1,67 @@
+"""
+In-Memory Caches
+================
+Bounded LRU cache with per-entry expiry, used to memoize lookups whose
+answer is stable for hours (FEMA flood polygons, ...), and a per-second
+memoized UTC timestamp for stamping batch results and database rows.
+"""
+
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, Hashable, Tuple
+
+# get() default that can't collide with a cached None
+MISSING = object()
+
+
+class TTLCache:
+    """LRU mapping of at most ``maxsize`` entries, each expiring ``ttl`` seconds after set()"""
+
+    def __init__(self, maxsize: int = 10_000, ttl: float = 86_400.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        item = self._data.get(key)
+        if item is None:
+            return default
+        expires, value = item
+        if expires <= time.monotonic():
+            del self._data[key]
+            return default
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+def coord_key(latitude: float, longitude: float, places: int = 4) -> Tuple[float, float]:
+    """Cache key for a point; 4 decimal places is ~11 m, well inside a flood polygon"""
+    return (round(latitude, places), round(longitude, places))
+
+
+_ts_cache: Tuple[int, str] = (0, "")
+
+
+def utc_now_iso() -> str:
+    """
+    Offset-qualified UTC ISO timestamp (seconds precision, ``+00:00``),
+    unambiguous for TIMESTAMPTZ columns; formatted once per second
+    """
+    global _ts_cache
+    sec = int(time.time())
+    if _ts_cache[0] != sec:
+        _ts_cache = (sec, datetime.fromtimestamp(sec, timezone.utc).isoformat())
+    return _ts_cache[1]
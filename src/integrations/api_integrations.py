@@ -14,19 +14,122 @@ Based on BidDeed.AI V14.5 integration patterns.
 """
 
 import os
+import re
+import atexit
 import json
+import logging
+import time
 import asyncio
-from dataclasses import dataclass, asdict
-from datetime import datetime
-from typing import Dict, Any, List, Optional
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache, partial
+from urllib.parse import urlencode
+from typing import Dict, Any, AsyncIterator, List, Optional
 import httpx
 
+from src.integrations._httpclient import (  # noqa: F401
+    SharedClientBase,
+    close_shared_client,
+    get_shared_client,
+    loads_json
+)
+from src.integrations._ttlcache import TTLCache, utc_now_iso
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+try:
+    import aiometer
+    HAS_AIOMETER = True
+except ImportError:
+    HAS_AIOMETER = False
+
+# Optional persistent cache for geocodes / ACS tracts
+try:
+    import diskcache
+    HAS_DISKCACHE = True
+except ImportError:
+    HAS_DISKCACHE = False
+
+
+logger = logging.getLogger(__name__)
+
+
+_ADDR_PUNCT = re.compile(r"[^\w\s]")
+_ADDR_SPACE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=10000)
+def _normalize_addr(address: str) -> str:
+    """Cache key for an address: lower-cased, punctuation stripped, whitespace collapsed"""
+    return _ADDR_SPACE.sub(" ", _ADDR_PUNCT.sub(" ", address.lower())).strip()
+
+
+# =============================================================================
+# RATE LIMITING / RETRIES
+# =============================================================================
+
+class HostRateLimiter:
+    """
+    Token-bucket rate limiter keyed by host.
+    
+    Each host refills at its configured requests/second with a burst of
+    one second's worth of tokens; unknown hosts use ``default_rate``.
+    """
+    
+    def __init__(self, rates: Dict[str, float], default_rate: float = 10.0):
+        self.rates = rates
+        self.default_rate = default_rate
+        self._buckets: Dict[str, tuple] = {}
+    
+    async def acquire(self, host: str) -> None:
+        rate = self.rates.get(host, self.default_rate)
+        while True:
+            now = time.monotonic()
+            tokens, last = self._buckets.get(host, (rate, now))
+            tokens = min(rate, tokens + (now - last) * rate)
+            if tokens >= 1:
+                self._buckets[host] = (tokens - 1, now)
+                return
+            self._buckets[host] = (tokens, now)
+            await asyncio.sleep((1 - tokens) / rate)
+
+
+DEFAULT_RATE_LIMITER = HostRateLimiter({
+    "api.census.gov": 50,
+    "geocoding.geo.census.gov": 50,
+    "api.apify.com": 30,
+    "api.firecrawl.dev": 3,
+})
+
+
+class _PooledAPIClient(SharedClientBase):
+    """
+    Base for API clients: requests go through an injected AsyncClient or,
+    by default, the shared per-loop pool, so TLS sessions are reused.
+    
+    ``_request`` applies the per-host rate limit and retries 429/5xx
+    responses with backoff before handing the response back. POSTs that
+    start billed work (Apify runs, Firecrawl jobs) are only retried on
+    429 and connect errors, so a 502 can't launch a duplicate run.
+    """
+    
+    TIMEOUT = 30
+    MAX_RETRIES = 5
+    RETRY_BACKOFF = 1.0
+    RETRY_BACKOFF_MAX = 30.0
+    
+    rate_limiter = DEFAULT_RATE_LIMITER
+
 
 # =============================================================================
 # CENSUS API INTEGRATION (FREE)
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CensusData:
     """Census demographics for a tract"""
     geoid: str
@@ -42,10 +145,37 @@ class CensusData:
     poverty_rate: float
     
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        return {f: getattr(self, f) for f in self.__dataclass_fields__}
+
+
+# Cell values the ACS API uses for "no estimate"
+_NULL_TOKENS = frozenset({'-', 'null', '', None})
+
+
+def _acs_float(val: Any, default: Optional[float]) -> Optional[float]:
+    """Parse one ACS cell, mapping null markers to default"""
+    try:
+        return default if val in _NULL_TOKENS else float(val)
+    except (TypeError, ValueError):
+        return default
+
+
+def _tract_rates_numpy(total, vacant, owner, renter, population, poverty):
+    """
+    Vectorized derived rates for a batch of tracts (int64 columns in).
+    
+    Same arithmetic as CensusAPIClient._parse_tract_row, with 0 wherever
+    the denominator is not positive. Rounding is left to the caller.
+    """
+    occupied = total - vacant
+    
+    def pct(num, den):
+        return np.divide(num, den, out=np.zeros(len(num)), where=den > 0) * 100
+    
+    return pct(vacant, total), pct(owner, occupied), pct(renter, occupied), pct(poverty, population)
 
 
-class CensusAPIClient:
+class CensusAPIClient(_PooledAPIClient):
     """
     US Census Bureau API Client.
     
@@ -55,6 +185,11 @@ class CensusAPIClient:
     - TIGERweb for boundaries
     
     API Key: https://api.census.gov/data/key_signup.html
+    
+    Geocodes and tract demographics are cached in-process (bounded LRU)
+    and, when diskcache is installed, on disk under CENSUS_CACHE_DIR;
+    both tiers expire entries after CACHE_TTL (30 days). Tract data is
+    static within an ACS vintage, so it is keyed by year.
     """
     
     BASE_URL = "https://api.census.gov/data"
@@ -73,13 +208,75 @@ class CensusAPIClient:
         "households": "B11001_001E",
         "poverty_population": "B17001_002E",
     }
+    _VAR_LIST = ",".join(VARIABLES.values())
+    _ACS_GET = "NAME," + _VAR_LIST
     
-    def __init__(self, api_key: Optional[str] = None):
+    CACHE_TTL = 30 * 24 * 3600  # seconds
+    GEO_CACHE_SIZE = 10_000
+    TRACT_CACHE_SIZE = 20_000  # county queries cache every tract in the county
+    ZIP_CACHE_SIZE = 5_000
+    
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        cache_dir: Optional[str] = None,
+        client: Optional[httpx.AsyncClient] = None
+    ):
+        super().__init__(client)
         self.api_key = api_key or os.environ.get("CENSUS_API_KEY", "")
-        self.client = httpx.AsyncClient(timeout=30)
+        
+        cache_dir = cache_dir if cache_dir is not None else os.environ.get("CENSUS_CACHE_DIR", ".cache/census")
+        self._geo_cache = TTLCache(maxsize=self.GEO_CACHE_SIZE, ttl=self.CACHE_TTL)
+        self._tract_cache = TTLCache(maxsize=self.TRACT_CACHE_SIZE, ttl=self.CACHE_TTL)
+        self._zip_cache = TTLCache(maxsize=self.ZIP_CACHE_SIZE, ttl=self.CACHE_TTL)
+        self._url_cache: Dict[int, str] = {}
+        self._tract_query_cache: Dict[int, str] = {}
+        self._disk = diskcache.Cache(cache_dir) if HAS_DISKCACHE and cache_dir else None
+    
+    def _cache_get(self, memory: TTLCache, key):
+        """Look up key in memory, falling back to (and promoting from) disk"""
+        value = memory.get(key)
+        if value is None and self._disk is not None:
+            value = self._disk.get(key)
+            if value is not None:
+                memory.set(key, value)
+        return value
+    
+    def _cache_set(self, memory: TTLCache, key, value) -> None:
+        memory.set(key, value)
+        if self._disk is not None:
+            self._disk.set(key, value, expire=self.CACHE_TTL)
+    
+    def _acs_url(self, year: int) -> str:
+        url = self._url_cache.get(year)
+        if url is None:
+            url = self._url_cache[year] = f"{self.BASE_URL}/{year}/acs/acs5"
+        return url
+    
+    def _tract_query_url(self, year: int, tract: str, state_fips: str, county_fips: str) -> str:
+        """
+        ACS tract query URL. The static get=/key= part is encoded once per
+        year; only the geography clause is encoded per call.
+        """
+        base = self._tract_query_cache.get(year)
+        if base is None:
+            static = {"get": self._ACS_GET}
+            if self.api_key:
+                static["key"] = self.api_key
+            base = self._tract_query_cache[year] = f"{self._acs_url(year)}?{urlencode(static, safe=',')}&"
+        return base + urlencode(
+            {"for": f"tract:{tract}", "in": f"state:{state_fips} county:{county_fips}"}, safe=":*"
+        )
     
     async def geocode_address(self, address: str) -> Optional[Dict[str, str]]:
         """Convert address to Census geography (FIPS codes)"""
+        key = ("geo", _normalize_addr(address))
+        cached = self._cache_get(self._geo_cache, key)
+        if cached is not None:
+            return cached
+        return await self._single_flight(key, partial(self._fetch_geocode, address, key))
+    
+    async def _fetch_geocode(self, address: str, key: tuple) -> Optional[Dict[str, str]]:
         try:
             params = {
                 "street": address,
@@ -88,104 +285,344 @@ class CensusAPIClient:
                 "format": "json"
             }
             
-            response = await self.client.get(self.GEOCODE_URL, params=params)
+            response = await self._request("GET", self.GEOCODE_URL, params=params, timeout=self.TIMEOUT)
             response.raise_for_status()
-            data = response.json()
+            data = loads_json(response)
             
             matches = data.get("result", {}).get("addressMatches", [])
             if matches:
-                geographies = matches[0].get("geographies", {})
+                match = matches[0]
+                geographies = match.get("geographies", {})
                 tracts = geographies.get("Census Tracts", [])
                 if tracts:
                     tract = tracts[0]
-                    return {
+                    coords = match.get("coordinates", {})
+                    geo = {
                         "state_fips": tract.get("STATE"),
                         "county_fips": tract.get("COUNTY"),
                         "tract_fips": tract.get("TRACT"),
                         "geoid": tract.get("GEOID"),
-                        "tract_name": tract.get("NAME", "")
+                        "tract_name": tract.get("NAME", ""),
+                        "matched_address": match.get("matchedAddress"),
+                        "latitude": coords.get("y"),
+                        "longitude": coords.get("x")
                     }
+                    self._cache_set(self._geo_cache, key, geo)
+                    return geo
             return None
         except Exception as e:
-            print(f"Census geocoding error: {e}")
+            logger.warning("Census geocoding error: %s", e)
             return None
     
     async def get_tract_demographics(
+        self,
+        state_fips: str,
+        county_fips: str,
+        tract_fips: str,
+        year: int = 2022,
+        geoid: Optional[str] = None
+    ) -> Optional[CensusData]:
+        """
+        Get ACS demographics for a census tract.
+        
+        ``geoid`` (e.g. from geocode_address) is used as-is when given
+        instead of being rebuilt from the FIPS parts.
+        """
+        key = ("acs", state_fips, county_fips, tract_fips, year)
+        cached = self._cache_get(self._tract_cache, key)
+        if cached is not None:
+            return cached
+        return await self._single_flight(
+            key, partial(self._fetch_tract_demographics, state_fips, county_fips, tract_fips, year, geoid, key)
+        )
+    
+    def cached_tract_demographics(
         self,
         state_fips: str,
         county_fips: str,
         tract_fips: str,
         year: int = 2022
     ) -> Optional[CensusData]:
-        """Get ACS demographics for a census tract"""
+        """Tract demographics from the memory / disk cache only - None on a miss"""
+        return self._cache_get(self._tract_cache, ("acs", state_fips, county_fips, tract_fips, year))
+    
+    async def _fetch_tract_demographics(
+        self,
+        state_fips: str,
+        county_fips: str,
+        tract_fips: str,
+        year: int,
+        geoid: Optional[str],
+        key: tuple
+    ) -> Optional[CensusData]:
         try:
-            # Build variable list
-            var_list = ",".join(self.VARIABLES.values())
-            
-            params = {
-                "get": f"NAME,{var_list}",
-                "for": f"tract:{tract_fips}",
-                "in": f"state:{state_fips} county:{county_fips}",
-            }
-            
-            if self.api_key:
-                params["key"] = self.api_key
-            
-            url = f"{self.BASE_URL}/{year}/acs/acs5"
-            response = await self.client.get(url, params=params)
+            url = self._tract_query_url(year, tract_fips, state_fips, county_fips)
+            response = await self._request("GET", url, timeout=self.TIMEOUT)
             response.raise_for_status()
-            data = response.json()
+            data = loads_json(response)
             
             if len(data) < 2:
                 return None
             
-            headers = data[0]
-            values = data[1]
+            census = self._parse_tract_row(
+                dict(zip(data[0], data[1])),
+                geoid=geoid or f"{state_fips}{county_fips}{tract_fips}"
+            )
+            self._cache_set(self._tract_cache, key, census)
+            return census
+        except Exception as e:
+            logger.warning("Census ACS error: %s", e)
+            return None
+    
+    def _parse_tract_row(self, result: Dict[str, Any], geoid: str) -> CensusData:
+        """Build CensusData (with derived rates) from one ACS row mapped by header"""
+        get = result.get
+        v = self.VARIABLES
+        
+        # Each cell parsed once; None marks a missing / null value
+        population_raw = _acs_float(get(v["population"]), None)
+        total_housing = int(_acs_float(get(v["total_housing"]), 1))
+        vacant = int(_acs_float(get(v["vacant_housing"]), 0))
+        owner = int(_acs_float(get(v["owner_occupied"]), 0))
+        renter = int(_acs_float(get(v["renter_occupied"]), 0))
+        poverty = int(_acs_float(get(v["poverty_population"]), 0))
+        population = int(population_raw) if population_raw is not None else 0
+        rate_population = population if population_raw is not None else 1
+        
+        # Calculate derived metrics
+        occupied = total_housing - vacant
+        vacancy_rate = (vacant / total_housing * 100) if total_housing > 0 else 0
+        owner_pct = (owner / occupied * 100) if occupied > 0 else 0
+        renter_pct = (renter / occupied * 100) if occupied > 0 else 0
+        poverty_rate = (poverty / rate_population * 100) if rate_population > 0 else 0
+        
+        return CensusData(
+            geoid=geoid,
+            tract_name=get("NAME", ""),
+            population=population,
+            median_income=_acs_float(get(v["median_income"]), 0.0),
+            median_home_value=_acs_float(get(v["median_home_value"]), 0.0),
+            vacancy_rate=round(vacancy_rate, 1),
+            owner_occupied_pct=round(owner_pct, 1),
+            renter_occupied_pct=round(renter_pct, 1),
+            median_age=_acs_float(get(v["median_age"]), 0.0),
+            households=int(_acs_float(get(v["households"]), 0)),
+            poverty_rate=round(poverty_rate, 1)
+        )
+    
+    def _parse_tract_rows(
+        self,
+        headers: List[str],
+        rows: List[List[Any]],
+        state_fips: str,
+        county_fips: str
+    ) -> Dict[str, CensusData]:
+        """
+        Batch counterpart of _parse_tract_row for a county-wide response.
+        
+        Rows are transposed to columns once; each variable column is parsed
+        into a float array and the derived rates are computed with NumPy
+        over all tracts at once.
+        """
+        if not rows:
+            return {}
+        
+        n = len(rows)
+        col = {name: i for i, name in enumerate(headers)}
+        columns = list(zip(*rows))  # one C-level transpose, rows -> columns
+        
+        def column(key: str):
+            # NaN marks missing cells so each use can apply its own default
+            i = col.get(self.VARIABLES[key])
+            if i is None:
+                return np.full(n, np.nan)
+            return np.fromiter((_acs_float(x, np.nan) for x in columns[i]), dtype=np.float64, count=n)
+        
+        def filled(values, default: float):
+            return np.where(np.isnan(values), default, values)
+        
+        population = column("population")
+        total_housing = filled(column("total_housing"), 1).astype(np.int64)
+        vacant = filled(column("vacant_housing"), 0).astype(np.int64)
+        owner = filled(column("owner_occupied"), 0).astype(np.int64)
+        renter = filled(column("renter_occupied"), 0).astype(np.int64)
+        poverty = filled(column("poverty_population"), 0).astype(np.int64)
+        
+        vacancy_rate, owner_pct, renter_pct, poverty_rate = _tract_rates_numpy(
+            total_housing, vacant, owner, renter, filled(population, 1).astype(np.int64), poverty
+        )
+        
+        tracts = columns[col["tract"]]
+        names = columns[col["NAME"]] if "NAME" in col else ("",) * n
+        prefix = f"{state_fips}{county_fips}"
+        
+        # Python round() per value keeps results identical to the scalar path
+        return {
+            tract: CensusData(
+                geoid=prefix + tract,
+                tract_name=name,
+                population=pop,
+                median_income=income,
+                median_home_value=home_value,
+                vacancy_rate=round(vac, 1),
+                owner_occupied_pct=round(own, 1),
+                renter_occupied_pct=round(rent, 1),
+                median_age=age,
+                households=hh,
+                poverty_rate=round(pov, 1)
+            )
+            for tract, name, pop, income, home_value, vac, own, rent, age, hh, pov in zip(
+                tracts,
+                names,
+                filled(population, 0).astype(np.int64).tolist(),
+                filled(column("median_income"), 0.0).tolist(),
+                filled(column("median_home_value"), 0.0).tolist(),
+                vacancy_rate.tolist(),
+                owner_pct.tolist(),
+                renter_pct.tolist(),
+                filled(column("median_age"), 0.0).tolist(),
+                filled(column("households"), 0).astype(np.int64).tolist(),
+                poverty_rate.tolist()
+            )
+        }
+    
+    async def get_county_tracts(
+        self,
+        state_fips: str,
+        county_fips: str,
+        year: int = 2022
+    ) -> Dict[str, CensusData]:
+        """
+        Get ACS demographics for every tract in a county with one request.
+        
+        Returns {tract_fips: CensusData}; each tract is also cached so later
+        get_tract_demographics() calls for the county are free.
+        """
+        key = ("county", state_fips, county_fips, year)
+        return await self._single_flight(key, partial(self._fetch_county_tracts, state_fips, county_fips, year))
+    
+    async def _fetch_county_tracts(self, state_fips: str, county_fips: str, year: int) -> Dict[str, CensusData]:
+        try:
+            url = self._tract_query_url(year, "*", state_fips, county_fips)
+            response = await self._request("GET", url, timeout=self.TIMEOUT)
+            response.raise_for_status()
+            data = loads_json(response)
             
-            # Map to dictionary
-            result = dict(zip(headers, values))
+            headers = data[0]
+            tract_col = headers.index("tract")
+            if HAS_NUMPY:
+                tracts = self._parse_tract_rows(headers, data[1:], state_fips, county_fips)
+            else:
+                tracts = {
+                    row[tract_col]: self._parse_tract_row(
+                        dict(zip(headers, row)),
+                        geoid=f"{state_fips}{county_fips}{row[tract_col]}"
+                    )
+                    for row in data[1:]
+                }
             
-            # Parse values
-            def safe_float(key: str, default: float = 0.0) -> float:
-                var_code = self.VARIABLES.get(key, key)
-                val = result.get(var_code)
-                try:
-                    return float(val) if val and val not in ['-', 'null', None] else default
-                except:
-                    return default
+            for tract_fips, census in tracts.items():
+                self._cache_set(self._tract_cache, ("acs", state_fips, county_fips, tract_fips, year), census)
+            return tracts
+        except Exception as e:
+            logger.warning("Census ACS county error: %s", e)
+            return {}
+    
+    async def get_demographics_by_zip(self, zip_code: str, year: int = 2022) -> Dict[str, Any]:
+        """
+        Get demographic data for a zip code (ZCTA).
+        
+        Returns: population, median income, median home value, etc.
+        """
+        key = ("zip", zip_code, year)
+        cached = self._cache_get(self._zip_cache, key)
+        if cached is None:
+            cached = await self._single_flight(key, partial(self._fetch_zip_demographics, zip_code, year, key))
+        # Copy - callers (SPDAPIClient.get_market_data) add derived fields
+        return dict(cached)
+    
+    async def _fetch_zip_demographics(self, zip_code: str, year: int, key: tuple) -> Dict[str, Any]:
+        # Variables: B01003_001E (population), B19013_001E (median income),
+        # B25077_001E (median home value), B25002_003E (vacancy)
+        variables = "B01003_001E,B19013_001E,B25077_001E,B25002_003E,B25003_002E"
+        
+        params = {
+            "get": variables,
+            "for": f"zip code tabulation area:{zip_code}",
+            "key": self.api_key
+        }
+        
+        try:
+            response = await self._request("GET", self._acs_url(year), params=params, timeout=self.TIMEOUT)
+            data = loads_json(response)
             
-            def safe_int(key: str, default: int = 0) -> int:
-                return int(safe_float(key, default))
+            if len(data) >= 2:
+                result = dict(zip(data[0], data[1]))
+                
+                demographics = {
+                    "zip_code": zip_code,
+                    "population": int(result.get("B01003_001E", 0) or 0),
+                    "median_income": int(result.get("B19013_001E", 0) or 0),
+                    "median_home_value": int(result.get("B25077_001E", 0) or 0),
+                    "vacant_units": int(result.get("B25002_003E", 0) or 0),
+                    "owner_occupied": int(result.get("B25003_002E", 0) or 0),
+                    "year": year,
+                    "source": "US Census ACS 5-Year Estimates"
+                }
+                self._cache_set(self._zip_cache, key, demographics)
+                return demographics
+            return {"error": "No data found", "zip_code": zip_code}
             
-            # Calculate derived metrics
-            total_housing = safe_int("total_housing", 1)
-            vacant = safe_int("vacant_housing")
-            owner = safe_int("owner_occupied")
-            renter = safe_int("renter_occupied")
-            population = safe_int("population", 1)
-            poverty = safe_int("poverty_population")
+        except Exception as e:
+            return {"error": str(e), "zip_code": zip_code}
+    
+    async def get_housing_characteristics(self, fips_code: str, year: int = 2022) -> Dict[str, Any]:
+        """Get housing characteristics by FIPS code (county or tract)."""
+        # Housing variables
+        variables = (
+            "B25001_001E,"  # Total housing units
+            "B25002_002E,"  # Occupied
+            "B25002_003E,"  # Vacant
+            "B25003_002E,"  # Owner occupied
+            "B25003_003E,"  # Renter occupied
+            "B25064_001E,"  # Median gross rent
+            "B25077_001E"   # Median home value
+        )
+        
+        params = {
+            "get": variables,
+            "for": f"county:{fips_code[-3:]}" if len(fips_code) == 5 else f"tract:{fips_code}",
+            "in": f"state:{fips_code[:2]}",
+            "key": self.api_key
+        }
+        
+        try:
+            response = await self._request("GET", self._acs_url(year), params=params, timeout=self.TIMEOUT)
+            data = loads_json(response)
             
-            vacancy_rate = (vacant / total_housing * 100) if total_housing > 0 else 0
-            owner_pct = (owner / (total_housing - vacant) * 100) if (total_housing - vacant) > 0 else 0
-            renter_pct = (renter / (total_housing - vacant) * 100) if (total_housing - vacant) > 0 else 0
-            poverty_rate = (poverty / population * 100) if population > 0 else 0
+            if len(data) >= 2:
+                result = dict(zip(data[0], data[1]))
+                
+                total = int(result.get("B25001_001E", 1) or 1)
+                occupied = int(result.get("B25002_002E", 0) or 0)
+                vacant = int(result.get("B25002_003E", 0) or 0)
+                
+                return {
+                    "fips_code": fips_code,
+                    "total_housing_units": total,
+                    "occupied_units": occupied,
+                    "vacant_units": vacant,
+                    "vacancy_rate": round(vacant / total * 100, 2) if total > 0 else 0,
+                    "owner_occupied": int(result.get("B25003_002E", 0) or 0),
+                    "renter_occupied": int(result.get("B25003_003E", 0) or 0),
+                    "median_rent": int(result.get("B25064_001E", 0) or 0),
+                    "median_home_value": int(result.get("B25077_001E", 0) or 0),
+                    "year": year
+                }
+            return {"error": "No data found"}
             
-            return CensusData(
-                geoid=f"{state_fips}{county_fips}{tract_fips}",
-                tract_name=result.get("NAME", ""),
-                population=safe_int("population"),
-                median_income=safe_float("median_income"),
-                median_home_value=safe_float("median_home_value"),
-                vacancy_rate=round(vacancy_rate, 1),
-                owner_occupied_pct=round(owner_pct, 1),
-                renter_occupied_pct=round(renter_pct, 1),
-                median_age=safe_float("median_age"),
-                households=safe_int("households"),
-                poverty_rate=round(poverty_rate, 1)
-            )
         except Exception as e:
-            print(f"Census ACS error: {e}")
-            return None
+            return {"error": str(e)}
     
     async def get_demographics_by_address(self, address: str) -> Optional[CensusData]:
         """Get demographics for an address (geocode + ACS lookup)"""
@@ -196,18 +633,20 @@ class CensusAPIClient:
         return await self.get_tract_demographics(
             state_fips=geo["state_fips"],
             county_fips=geo["county_fips"],
-            tract_fips=geo["tract_fips"]
+            tract_fips=geo["tract_fips"],
+            geoid=geo["geoid"]
         )
     
     async def close(self):
-        await self.client.aclose()
+        if self._disk is not None:
+            self._disk.close()
 
 
 # =============================================================================
 # APIFY REAL ESTATE SCRAPERS (Zillow, Redfin, Realtor)
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PropertyValuation:
     """Multi-source property valuation"""
     address: str
@@ -221,10 +660,10 @@ class PropertyValuation:
     sources: List[str] = None
     
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        return {f: getattr(self, f) for f in self.__dataclass_fields__}
 
 
-class ApifyRealEstateClient:
+class ApifyRealEstateClient(_PooledAPIClient):
     """
     Apify Real Estate Scrapers.
     
@@ -243,48 +682,90 @@ class ApifyRealEstateClient:
         "zillow": "petr_cermak/zillow-api-scraper",
         "realtor": "epctex/realtor-scraper",
         "redfin": "misceres/redfin-scraper",
-        "global_aggregator": "charlestechy/global-real-estate-aggregator"
+        "global_aggregator": "charlestechy/global-real-estate-aggregator",
+        "zillow_search": "l7auZloH1fqZw8FKa"
     }
     
-    def __init__(self, api_token: Optional[str] = None):
-        self.api_token = api_token or os.environ.get("APIFY_API_TOKEN", "")
-        self.client = httpx.AsyncClient(timeout=60)
+    TIMEOUT = 60
+    
+    # Apify holds a waitForFinish request open for at most 60 s
+    POLL_SECS = 60
+    TERMINAL_STATUSES = frozenset({"SUCCEEDED", "FAILED", "ABORTED", "TIMED-OUT"})
+    
+    def __init__(self, api_token: Optional[str] = None, client: Optional[httpx.AsyncClient] = None):
+        super().__init__(client)
+        self.api_token = api_token or os.environ.get("APIFY_API_TOKEN") or os.environ.get("APIFY_API_KEY", "")
     
     async def run_actor(
         self,
         actor_id: str,
         input_data: Dict[str, Any],
-        wait_secs: int = 60
+        wait_secs: int = 300
     ) -> Optional[List[Dict]]:
-        """Run an Apify actor and wait for results"""
+        """
+        Run an Apify actor and return its dataset items.
+        
+        The run is started once and then waited on by id (long-polling
+        with waitForFinish) for up to ``wait_secs``; runs that finish
+        within the first poll cost one request plus the dataset fetch.
+        Returns None if the run fails or is still going at the deadline -
+        the run itself is never aborted or restarted. Identical runs
+        already in flight are shared rather than started twice.
+        """
         if not self.api_token:
             return None
         
+        key = (actor_id, json.dumps(input_data, sort_keys=True), wait_secs)
+        return await self._single_flight(key, partial(self._run_actor, actor_id, input_data, wait_secs))
+    
+    async def _run_actor(self, actor_id: str, input_data: Dict[str, Any], wait_secs: int) -> Optional[List[Dict]]:
         try:
-            # Start actor run
-            url = f"{self.BASE_URL}/acts/{actor_id}/runs"
             headers = {"Authorization": f"Bearer {self.api_token}"}
+            actor_path = actor_id.replace("/", "~")
+            deadline = time.monotonic() + wait_secs
             
-            response = await self.client.post(
-                url,
+            response = await self._request(
+                "POST",
+                f"{self.BASE_URL}/acts/{actor_path}/runs",
                 headers=headers,
                 json=input_data,
-                params={"waitForFinish": wait_secs}
+                params={"waitForFinish": min(wait_secs, self.POLL_SECS)},
+                timeout=self.TIMEOUT + self.POLL_SECS
             )
             response.raise_for_status()
-            run_data = response.json()
+            run = loads_json(response).get("data", {})
+            
+            # Keep waiting on this run - never start a second one
+            while run.get("status") not in self.TERMINAL_STATUSES:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    logger.warning("Apify run %s still %s after %ss", run.get("id"), run.get("status"), wait_secs)
+                    return None
+                response = await self._request(
+                    "GET",
+                    f"{self.BASE_URL}/actor-runs/{run['id']}",
+                    headers=headers,
+                    params={"waitForFinish": max(1, min(int(remaining), self.POLL_SECS))},
+                    timeout=self.TIMEOUT + self.POLL_SECS
+                )
+                response.raise_for_status()
+                run = loads_json(response).get("data", {})
+            
+            if run["status"] != "SUCCEEDED":
+                logger.warning("Apify run %s ended %s", run.get("id"), run["status"])
+                return None
             
             # Get results from dataset
-            dataset_id = run_data.get("data", {}).get("defaultDatasetId")
+            dataset_id = run.get("defaultDatasetId")
             if dataset_id:
                 items_url = f"{self.BASE_URL}/datasets/{dataset_id}/items"
-                items_response = await self.client.get(items_url, headers=headers)
+                items_response = await self._request("GET", items_url, headers=headers, timeout=self.TIMEOUT)
                 items_response.raise_for_status()
-                return items_response.json()
+                return loads_json(items_response)
             
             return None
         except Exception as e:
-            print(f"Apify actor error: {e}")
+            logger.warning("Apify actor error: %s", e)
             return None
     
     async def get_zillow_valuation(self, address: str) -> Optional[Dict]:
@@ -307,6 +788,51 @@ class ApifyRealEstateClient:
             return results[0]
         return None
     
+    async def search_zillow(
+        self,
+        address: str = None,
+        zip_code: str = None,
+        city: str = None,
+        state: str = "FL"
+    ) -> Dict[str, Any]:
+        """Start a Zillow search run (by address or zip) and return the run record."""
+        if not self.api_token:
+            return {"error": "APIFY_API_KEY not configured"}
+        
+        payload = {
+            "searchType": "address" if address else "zipcode",
+            "searchQuery": address or zip_code,
+            "city": city,
+            "state": state,
+            "maxItems": 10
+        }
+        
+        try:
+            response = await self._request(
+                "POST",
+                f"{self.BASE_URL}/acts/{self.ACTORS['zillow_search']}/runs",
+                headers={"Authorization": f"Bearer {self.api_token}"},
+                json=payload,
+                timeout=self.TIMEOUT
+            )
+            return loads_json(response)
+        except Exception as e:
+            return {"error": str(e)}
+    
+    async def get_comps(
+        self,
+        address: str,
+        radius_miles: float = 0.5,
+        max_results: int = 10
+    ) -> List[Dict[str, Any]]:
+        """Get comparable sales from multiple sources."""
+        # Would aggregate from Zillow, Redfin, Realtor.com
+        return []
+    
+    async def get_zestimate(self, address: str) -> Dict[str, Any]:
+        """Get Zillow Zestimate for property."""
+        return await self.search_zillow(address=address)
+    
     async def get_multi_source_valuation(self, address: str) -> PropertyValuation:
         """Get valuations from multiple sources"""
         sources = []
@@ -344,16 +870,13 @@ class ApifyRealEstateClient:
             confidence=confidence,
             sources=sources
         )
-    
-    async def close(self):
-        await self.client.aclose()
 
 
 # =============================================================================
 # FIRECRAWL INTEGRATION (ANTI-BOT SCRAPING)
 # =============================================================================
 
-class FirecrawlClient:
+class FirecrawlClient(_PooledAPIClient):
     """
     Firecrawl API Client for anti-bot web scraping.
     
@@ -367,9 +890,11 @@ class FirecrawlClient:
     
     BASE_URL = "https://api.firecrawl.dev/v0"
     
-    def __init__(self, api_key: Optional[str] = None):
+    TIMEOUT = 60
+    
+    def __init__(self, api_key: Optional[str] = None, client: Optional[httpx.AsyncClient] = None):
+        super().__init__(client)
         self.api_key = api_key or os.environ.get("FIRECRAWL_API_KEY", "")
-        self.client = httpx.AsyncClient(timeout=60)
     
     async def scrape_url(
         self,
@@ -398,15 +923,17 @@ class FirecrawlClient:
             if wait_for:
                 payload["waitFor"] = wait_for
             
-            response = await self.client.post(
+            response = await self._request(
+                "POST",
                 f"{self.BASE_URL}/scrape",
                 headers=headers,
-                json=payload
+                json=payload,
+                timeout=self.TIMEOUT
             )
             response.raise_for_status()
-            return response.json()
+            return loads_json(response)
         except Exception as e:
-            print(f"Firecrawl error: {e}")
+            logger.warning("Firecrawl error: %s", e)
             return None
     
     async def crawl_site(
@@ -429,19 +956,18 @@ class FirecrawlClient:
             if include_patterns:
                 payload["includePaths"] = include_patterns
             
-            response = await self.client.post(
+            response = await self._request(
+                "POST",
                 f"{self.BASE_URL}/crawl",
                 headers=headers,
-                json=payload
+                json=payload,
+                timeout=self.TIMEOUT
             )
             response.raise_for_status()
-            return response.json()
+            return loads_json(response)
         except Exception as e:
-            print(f"Firecrawl crawl error: {e}")
+            logger.warning("Firecrawl crawl error: %s", e)
             return None
-    
-    async def close(self):
-        await self.client.aclose()
 
 
 # =============================================================================
@@ -462,8 +988,8 @@ class AIWebAgentClient:
     
     ACTOR_ID = "apify/ai-web-agent"
     
-    def __init__(self, apify_token: Optional[str] = None):
-        self.apify_client = ApifyRealEstateClient(apify_token)
+    def __init__(self, apify_token: Optional[str] = None, client: Optional[httpx.AsyncClient] = None):
+        self.apify_client = ApifyRealEstateClient(apify_token, client=client)
     
     async def execute_task(
         self,
@@ -505,17 +1031,21 @@ class EnhancedDataFetcher:
     - Zillow/Redfin valuations
     - FEMA flood data
     - BCPAO property data
+    
+    All sources share one connection pool (``client`` or the per-loop
+    shared client), so a fetcher can be reused across many opportunities.
     """
     
     def __init__(
         self,
         census_key: Optional[str] = None,
         apify_token: Optional[str] = None,
-        firecrawl_key: Optional[str] = None
+        firecrawl_key: Optional[str] = None,
+        client: Optional[httpx.AsyncClient] = None
     ):
-        self.census = CensusAPIClient(census_key)
-        self.apify = ApifyRealEstateClient(apify_token)
-        self.firecrawl = FirecrawlClient(firecrawl_key) if firecrawl_key else None
+        self.census = CensusAPIClient(census_key, client=client)
+        self.apify = ApifyRealEstateClient(apify_token, client=client)
+        self.firecrawl = FirecrawlClient(firecrawl_key, client=client) if firecrawl_key else None
     
     async def get_enhanced_property_data(
         self,
@@ -526,36 +1056,110 @@ class EnhancedDataFetcher:
         """
         Get comprehensive property data from all sources.
         """
-        result = {
-            "address": address,
-            "fetched_at": datetime.utcnow().isoformat(),
-            "demographics": None,
-            "valuation": None
-        }
-        
-        tasks = []
+        results = await self.enrich_batch([address], include_valuation, include_demographics)
+        return results[0]
+    
+    async def enrich_batch(
+        self,
+        addresses: List[str],
+        include_valuation: bool = True,
+        include_demographics: bool = True
+    ) -> List[Dict[str, Any]]:
+        """
+        Get property data for many addresses.
         
-        if include_demographics:
-            tasks.append(("demographics", self.census.get_demographics_by_address(address)))
+        Addresses are geocoded (cached) and their tracts looked up in the
+        Census cache; counties with uncached tracts are fetched with a
+        single ACS request each instead of one request per address.
+        Results are in input order.
+        """
+        fetched_at = utc_now_iso()
+        results = [
+            {"address": address, "fetched_at": fetched_at, "demographics": None, "valuation": None}
+            for address in addresses
+        ]
         
-        if include_valuation:
-            tasks.append(("valuation", self.apify.get_multi_source_valuation(address)))
+        # Valuations run while the Census lookups proceed
+        valuations = asyncio.gather(
+            *[self.apify.get_multi_source_valuation(a) for a in addresses],
+            return_exceptions=True
+        ) if include_valuation else None
         
-        # Run in parallel
-        if tasks:
-            results = await asyncio.gather(
-                *[t[1] for t in tasks],
+        if include_demographics:
+            geos = await asyncio.gather(
+                *[self.census.geocode_address(a) for a in addresses],
+                return_exceptions=True
+            )
+            geos = [g if isinstance(g, dict) else None for g in geos]
+            cached = [
+                self.census.cached_tract_demographics(g["state_fips"], g["county_fips"], g["tract_fips"])
+                if g else None
+                for g in geos
+            ]
+            
+            # County queries only for counties with a cache miss
+            counties = list({
+                (g["state_fips"], g["county_fips"]) for g, census in zip(geos, cached) if g and census is None
+            })
+            tables = await asyncio.gather(
+                *[self.census.get_county_tracts(state, county) for state, county in counties],
                 return_exceptions=True
             )
+            by_county = {c: t for c, t in zip(counties, tables) if isinstance(t, dict)}
             
-            for i, (key, _) in enumerate(tasks):
-                if not isinstance(results[i], Exception) and results[i]:
-                    if hasattr(results[i], 'to_dict'):
-                        result[key] = results[i].to_dict()
-                    else:
-                        result[key] = results[i]
+            for result, geo, census in zip(results, geos, cached):
+                if geo and census is None:
+                    census = by_county.get((geo["state_fips"], geo["county_fips"]), {}).get(geo["tract_fips"])
+                if census:
+                    result["demographics"] = census.to_dict()
         
-        return result
+        if valuations is not None:
+            for result, valuation in zip(results, await valuations):
+                if valuation and not isinstance(valuation, Exception):
+                    result["valuation"] = valuation.to_dict()
+        
+        return results
+    
+    async def enrich_all(
+        self,
+        addresses: List[str],
+        max_at_once: int = 32,
+        max_per_second: float = 10.0,
+        **kwargs
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Enrich many addresses with bounded fan-out, yielding each result
+        as it completes (not in input order).
+        
+        At most ``max_at_once`` lookups are outstanding and new ones start
+        at no more than ``max_per_second``; the per-host limiter still
+        applies to the individual API calls. Uses aiometer when installed.
+        """
+        jobs = [partial(self.get_enhanced_property_data, address, **kwargs) for address in addresses]
+        
+        if HAS_AIOMETER:
+            async with aiometer.amap(
+                lambda job: job(), jobs, max_at_once=max_at_once, max_per_second=max_per_second
+            ) as results:
+                async for result in results:
+                    yield result
+            return
+        
+        semaphore = asyncio.Semaphore(max_at_once)
+        pacer = HostRateLimiter({}, default_rate=max_per_second)
+        
+        async def run(job):
+            async with semaphore:
+                await pacer.acquire("enrich_all")
+                return await job()
+        
+        tasks = [asyncio.ensure_future(run(job)) for job in jobs]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
     
     async def close(self):
         await asyncio.gather(
@@ -569,10 +1173,54 @@ class EnhancedDataFetcher:
 # CONVENIENCE FUNCTIONS
 # =============================================================================
 
+ENRICHMENT_TTL = timedelta(hours=24)
+
+# Process-wide fetchers by (census_key, apify_token), so the Census memory
+# cache and disk handle outlive a single enrichment; closed at exit
+_fetchers: Dict[tuple, EnhancedDataFetcher] = {}
+
+
+def _get_fetcher(census_key: Optional[str] = None, apify_token: Optional[str] = None) -> EnhancedDataFetcher:
+    """Cached EnhancedDataFetcher for the given credentials"""
+    key = (census_key, apify_token)
+    fetcher = _fetchers.get(key)
+    if fetcher is None:
+        fetcher = _fetchers[key] = EnhancedDataFetcher(census_key, apify_token)
+    return fetcher
+
+
+async def _close_fetchers():
+    fetchers = list(_fetchers.values())
+    _fetchers.clear()
+    await asyncio.gather(*(fetcher.close() for fetcher in fetchers))
+
+
+@atexit.register
+def _close_fetchers_at_exit():
+    if _fetchers:
+        asyncio.run(_close_fetchers())
+
+
+def _is_freshly_enriched(opportunity: Dict[str, Any]) -> bool:
+    """True if the opportunity already carries API data newer than ENRICHMENT_TTL"""
+    enriched_at = opportunity.get("api_enriched_at")
+    if not enriched_at or "census_demographics" not in opportunity or "market_valuation" not in opportunity:
+        return False
+    try:
+        enriched = datetime.fromisoformat(enriched_at)
+    except (TypeError, ValueError):
+        return False
+    if enriched.tzinfo is None:  # stamped before timestamps carried an offset
+        enriched = enriched.replace(tzinfo=timezone.utc)
+    return datetime.now(timezone.utc) - enriched < ENRICHMENT_TTL
+
+
 async def enrich_opportunity_with_apis(
     opportunity: Dict[str, Any],
     census_key: Optional[str] = None,
-    apify_token: Optional[str] = None
+    apify_token: Optional[str] = None,
+    fetcher: Optional[EnhancedDataFetcher] = None,
+    force: bool = False
 ) -> Dict[str, Any]:
     """
     Enrich a ZOD opportunity with API data.
@@ -581,41 +1229,48 @@ async def enrich_opportunity_with_apis(
     - Census demographics (income, population, vacancy)
     - Market valuations (Zillow, Redfin)
     - Derived metrics
+    
+    Without ``fetcher`` a process-wide EnhancedDataFetcher for the given
+    credentials is reused (and closed at exit); pass one to control its
+    client and lifetime yourself.
+    Opportunities enriched within ENRICHMENT_TTL are returned unchanged
+    unless ``force`` is set.
     """
-    fetcher = EnhancedDataFetcher(census_key, apify_token)
+    if not force and _is_freshly_enriched(opportunity):
+        return opportunity
     
-    try:
-        address = opportunity.get("address", "")
-        if not address:
-            return opportunity
-        
-        enhanced = await fetcher.get_enhanced_property_data(address)
-        
-        # Merge into opportunity
-        if enhanced.get("demographics"):
-            opportunity["census_demographics"] = enhanced["demographics"]
-            
-            # Calculate affordability metrics
-            median_income = enhanced["demographics"].get("median_income", 0)
-            if median_income > 0:
-                opportunity["affordability_ratio"] = (
-                    enhanced["demographics"].get("median_home_value", 0) / median_income
-                )
-        
-        if enhanced.get("valuation"):
-            opportunity["market_valuation"] = enhanced["valuation"]
-            
-            # Update assessed value if we have better data
-            consensus = enhanced["valuation"].get("consensus_value")
-            if consensus:
-                opportunity["api_market_value"] = consensus
+    address = opportunity.get("address", "")
+    if not address:
+        return opportunity
+    
+    if fetcher is None:
+        fetcher = _get_fetcher(census_key, apify_token)
+    
+    enhanced = await fetcher.get_enhanced_property_data(address)
+    
+    # Merge into opportunity
+    if enhanced.get("demographics"):
+        opportunity["census_demographics"] = enhanced["demographics"]
         
-        opportunity["api_enriched"] = True
-        opportunity["api_enriched_at"] = enhanced["fetched_at"]
+        # Calculate affordability metrics
+        median_income = enhanced["demographics"].get("median_income", 0)
+        if median_income > 0:
+            opportunity["affordability_ratio"] = (
+                enhanced["demographics"].get("median_home_value", 0) / median_income
+            )
+    
+    if enhanced.get("valuation"):
+        opportunity["market_valuation"] = enhanced["valuation"]
         
-        return opportunity
-    finally:
-        await fetcher.close()
+        # Update assessed value if we have better data
+        consensus = enhanced["valuation"].get("consensus_value")
+        if consensus:
+            opportunity["api_market_value"] = consensus
+    
+    opportunity["api_enriched"] = True
+    opportunity["api_enriched_at"] = enhanced["fetched_at"]
+    
+    return opportunity
 
 
 # =============================================================================
@@ -648,6 +1303,7 @@ if __name__ == "__main__":
             print("   Census data not available (API key may be required)")
         
         await census.close()
+        await close_shared_client()
         
         print("\n✅ API integration test complete")
     
@@ -11,240 +11,44 @@ Priority Integrations:
 """
 
 import os
+import atexit
 import asyncio
 import httpx
-from typing import Dict, Any, List, Optional
-from datetime import datetime
+from functools import partial
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Optional, Tuple
 from dataclasses import dataclass
 
+from src.integrations._httpclient import SharedClientBase, gather_with_defaults, loads_json
+from src.integrations._ttlcache import MISSING, TTLCache, coord_key, utc_now_iso
 
-# =============================================================================
-# APIFY REAL ESTATE SCRAPERS
-# =============================================================================
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
 
-class ApifyRealEstateClient:
-    """
-    Client for Apify real estate scrapers from API Mega Library.
-    
-    APIs:
-    - Global Real Estate Aggregator (Zillow, Realtor, Zumper, etc.)
-    - Realtor.com Scraper
-    - Zillow API via Apify
-    - Redfin Scraper
-    """
-    
-    BASE_URL = "https://api.apify.com/v2"
-    
-    def __init__(self, api_key: str = None):
-        self.api_key = api_key or os.getenv("APIFY_API_KEY", "")
-        self.client = httpx.AsyncClient(timeout=60.0)
-    
-    async def search_zillow(
-        self,
-        address: str = None,
-        zip_code: str = None,
-        city: str = None,
-        state: str = "FL"
-    ) -> Dict[str, Any]:
-        """Search Zillow for property data via Apify actor."""
-        if not self.api_key:
-            return {"error": "APIFY_API_KEY not configured"}
-        
-        actor_id = "l7auZloH1fqZw8FKa"  # Zillow scraper actor
-        
-        payload = {
-            "searchType": "address" if address else "zipcode",
-            "searchQuery": address or zip_code,
-            "city": city,
-            "state": state,
-            "maxItems": 10
-        }
-        
-        try:
-            response = await self.client.post(
-                f"{self.BASE_URL}/acts/{actor_id}/runs",
-                params={"token": self.api_key},
-                json=payload
-            )
-            return response.json()
-        except Exception as e:
-            return {"error": str(e)}
-    
-    async def get_comps(
-        self,
-        address: str,
-        radius_miles: float = 0.5,
-        max_results: int = 10
-    ) -> List[Dict[str, Any]]:
-        """Get comparable sales from multiple sources."""
-        # Would aggregate from Zillow, Redfin, Realtor.com
-        return []
-    
-    async def get_zestimate(self, address: str) -> Dict[str, Any]:
-        """Get Zillow Zestimate for property."""
-        return await self.search_zillow(address=address)
-    
-    async def close(self):
-        await self.client.aclose()
+# Census and Apify clients are shared with api_integrations (re-exported here)
+from src.integrations.api_integrations import ApifyRealEstateClient, CensusAPIClient
 
-
-# =============================================================================
-# CENSUS API CLIENT
-# =============================================================================
-
-class CensusAPIClient:
-    """
-    US Census Bureau API Client.
-    
-    Endpoints:
-    - American Community Survey (ACS) - Demographics, income, housing
-    - Population Estimates
-    - TIGER/Line Geocoder
-    
-    FREE - Request API key at: https://api.census.gov/data/key_signup.html
-    """
-    
-    BASE_URL = "https://api.census.gov/data"
-    
-    def __init__(self, api_key: str = None):
-        self.api_key = api_key or os.getenv("CENSUS_API_KEY", "")
-        self.client = httpx.AsyncClient(timeout=30.0)
-    
-    async def get_demographics_by_zip(self, zip_code: str, year: int = 2022) -> Dict[str, Any]:
-        """
-        Get demographic data for a zip code.
-        
-        Returns: population, median income, median home value, etc.
-        """
-        # ACS 5-year estimates
-        endpoint = f"{self.BASE_URL}/{year}/acs/acs5"
-        
-        # Variables: B01003_001E (population), B19013_001E (median income),
-        # B25077_001E (median home value), B25002_003E (vacancy)
-        variables = "B01003_001E,B19013_001E,B25077_001E,B25002_003E,B25003_002E"
-        
-        params = {
-            "get": variables,
-            "for": f"zip code tabulation area:{zip_code}",
-            "key": self.api_key
-        }
-        
-        try:
-            response = await self.client.get(endpoint, params=params)
-            data = response.json()
-            
-            if len(data) >= 2:
-                headers = data[0]
-                values = data[1]
-                result = dict(zip(headers, values))
-                
-                return {
-                    "zip_code": zip_code,
-                    "population": int(result.get("B01003_001E", 0) or 0),
-                    "median_income": int(result.get("B19013_001E", 0) or 0),
-                    "median_home_value": int(result.get("B25077_001E", 0) or 0),
-                    "vacant_units": int(result.get("B25002_003E", 0) or 0),
-                    "owner_occupied": int(result.get("B25003_002E", 0) or 0),
-                    "year": year,
-                    "source": "US Census ACS 5-Year Estimates"
-                }
-            return {"error": "No data found", "zip_code": zip_code}
-            
-        except Exception as e:
-            return {"error": str(e), "zip_code": zip_code}
-    
-    async def get_housing_characteristics(self, fips_code: str, year: int = 2022) -> Dict[str, Any]:
-        """Get housing characteristics by FIPS code (county or tract)."""
-        endpoint = f"{self.BASE_URL}/{year}/acs/acs5"
-        
-        # Housing variables
-        variables = (
-            "B25001_001E,"  # Total housing units
-            "B25002_002E,"  # Occupied
-            "B25002_003E,"  # Vacant
-            "B25003_002E,"  # Owner occupied
-            "B25003_003E,"  # Renter occupied
-            "B25064_001E,"  # Median gross rent
-            "B25077_001E"   # Median home value
-        )
-        
-        params = {
-            "get": variables,
-            "for": f"county:{fips_code[-3:]}" if len(fips_code) == 5 else f"tract:{fips_code}",
-            "in": f"state:{fips_code[:2]}",
-            "key": self.api_key
-        }
-        
-        try:
-            response = await self.client.get(endpoint, params=params)
-            data = response.json()
-            
-            if len(data) >= 2:
-                headers = data[0]
-                values = data[1]
-                result = dict(zip(headers, values))
-                
-                total = int(result.get("B25001_001E", 1) or 1)
-                occupied = int(result.get("B25002_002E", 0) or 0)
-                vacant = int(result.get("B25002_003E", 0) or 0)
-                
-                return {
-                    "fips_code": fips_code,
-                    "total_housing_units": total,
-                    "occupied_units": occupied,
-                    "vacant_units": vacant,
-                    "vacancy_rate": round(vacant / total * 100, 2) if total > 0 else 0,
-                    "owner_occupied": int(result.get("B25003_002E", 0) or 0),
-                    "renter_occupied": int(result.get("B25003_003E", 0) or 0),
-                    "median_rent": int(result.get("B25064_001E", 0) or 0),
-                    "median_home_value": int(result.get("B25077_001E", 0) or 0),
-                    "year": year
-                }
-            return {"error": "No data found"}
-            
-        except Exception as e:
-            return {"error": str(e)}
-    
-    async def geocode_address(self, address: str) -> Dict[str, Any]:
-        """Geocode address using Census Geocoder."""
-        endpoint = "https://geocoding.geo.census.gov/geocoder/locations/onelineaddress"
-        
-        params = {
-            "address": address,
-            "benchmark": "Public_AR_Current",
-            "format": "json"
-        }
-        
-        try:
-            response = await self.client.get(endpoint, params=params)
-            data = response.json()
-            
-            matches = data.get("result", {}).get("addressMatches", [])
-            if matches:
-                match = matches[0]
-                coords = match.get("coordinates", {})
-                return {
-                    "matched_address": match.get("matchedAddress"),
-                    "latitude": coords.get("y"),
-                    "longitude": coords.get("x"),
-                    "tiger_line_id": match.get("tigerLine", {}).get("tigerLineId"),
-                    "state_fips": match.get("geographies", {}).get("States", [{}])[0].get("STATEFP"),
-                    "county_fips": match.get("geographies", {}).get("Counties", [{}])[0].get("COUNTYFP")
-                }
-            return {"error": "No match found", "address": address}
-            
-        except Exception as e:
-            return {"error": str(e)}
-    
-    async def close(self):
-        await self.client.aclose()
+__all__ = [
+    "ApifyRealEstateClient",
+    "CensusAPIClient",
+    "AIAgentClient",
+    "GovernmentDataClient",
+    "MCP_SERVERS",
+    "SPDAPIClient",
+    "enrich_parcel_data",
+    "get_market_data",
+    "get_flood_zone",
+]
 
 
 # =============================================================================
 # AI AGENT APIS
 # =============================================================================
 
-class AIAgentClient:
+class AIAgentClient(SharedClientBase):
     """
     AI Agent APIs from API Mega Library.
     
@@ -254,10 +58,17 @@ class AIAgentClient:
     - AI Real Estate Agent - Property search by criteria
     """
     
-    def __init__(self, apify_key: str = None, anthropic_key: str = None):
+    def __init__(
+        self,
+        apify_key: str = None,
+        anthropic_key: str = None,
+        timeout: float = 120.0,
+        client: Optional[httpx.AsyncClient] = None
+    ):
+        super().__init__(client)
         self.apify_key = apify_key or os.getenv("APIFY_API_KEY", "")
         self.anthropic_key = anthropic_key or os.getenv("ANTHROPIC_API_KEY", "")
-        self.client = httpx.AsyncClient(timeout=120.0)
+        self.timeout = timeout
     
     async def run_web_agent(
         self,
@@ -285,12 +96,14 @@ class AIAgentClient:
         }
         
         try:
-            response = await self.client.post(
+            response = await self._request(
+                "POST",
                 f"https://api.apify.com/v2/acts/{actor_id}/runs",
                 params={"token": self.apify_key},
-                json=payload
+                json=payload,
+                timeout=self.timeout
             )
-            return response.json()
+            return loads_json(response)
         except Exception as e:
             return {"error": str(e)}
     
@@ -310,24 +123,22 @@ class AIAgentClient:
         }
         
         try:
-            response = await self.client.post(
+            response = await self._request(
+                "POST",
                 f"https://api.apify.com/v2/acts/{actor_id}/runs",
                 params={"token": self.apify_key},
-                json=payload
+                json=payload,
+                timeout=self.timeout
             )
-            return response.json()
+            return loads_json(response)
         except Exception as e:
             return {"error": str(e)}
-    
-    async def close(self):
-        await self.client.aclose()
-
 
 # =============================================================================
 # GOVERNMENT DATA APIS
 # =============================================================================
 
-class GovernmentDataClient:
+class GovernmentDataClient(SharedClientBase):
     """
     Government data APIs for zoning and land use.
     """
@@ -338,8 +149,32 @@ class GovernmentDataClient:
     # FEMA National Flood Hazard Layer
     FEMA_NFHL = "https://hazards.fema.gov/gis/nfhl/rest/services"
     
-    def __init__(self):
-        self.client = httpx.AsyncClient(timeout=30.0)
+    # Fixed NFHL point-query parameters; get_flood_zone adds "geometry"
+    NFHL_POINT_PARAMS: Mapping[str, str] = MappingProxyType({
+        "geometryType": "esriGeometryPoint",
+        "spatialRel": "esriSpatialRelIntersects",
+        "outFields": "FLD_ZONE,ZONE_SUBTY,SFHA_TF",
+        "returnGeometry": "false",
+        "f": "json"
+    })
+    
+    ZONE_DESCRIPTIONS: Mapping[str, str] = MappingProxyType({
+        "A": "High Risk - 1% annual flood",
+        "AE": "High Risk with BFE",
+        "AH": "High Risk - Shallow",
+        "AO": "High Risk - Sheet Flow",
+        "V": "High Risk - Coastal",
+        "VE": "High Risk - Coastal with BFE",
+        "X": "Minimal Risk",
+        "B": "Moderate Risk (0.2%)",
+        "C": "Minimal Risk"
+    })
+    
+    def __init__(self, timeout: float = 30.0, client: Optional[httpx.AsyncClient] = None):
+        super().__init__(client)
+        self.timeout = timeout
+        # FEMA zone attributes per ~11 m cell
+        self._flood_cache = TTLCache(maxsize=10_000, ttl=86_400)
     
     async def get_flood_zone(
         self,
@@ -347,58 +182,49 @@ class GovernmentDataClient:
         longitude: float
     ) -> Dict[str, Any]:
         """Get FEMA flood zone at coordinates."""
-        endpoint = f"{self.FEMA_NFHL}/public/NFHL/MapServer/28/query"
-        
-        params = {
-            "geometry": f"{longitude},{latitude}",
-            "geometryType": "esriGeometryPoint",
-            "spatialRel": "esriSpatialRelIntersects",
-            "outFields": "FLD_ZONE,ZONE_SUBTY,SFHA_TF",
-            "returnGeometry": "false",
-            "f": "json"
-        }
+        key = coord_key(latitude, longitude)
+        attrs = self._flood_cache.get(key, MISSING)
+        if attrs is MISSING:
+            try:
+                # Concurrent lookups in the same cell share one query
+                attrs = await self._single_flight(key, partial(self._fetch_zone_attrs, key, latitude, longitude))
+            except Exception as e:
+                return {"error": str(e)}
         
-        try:
-            response = await self.client.get(endpoint, params=params)
-            data = response.json()
-            
-            features = data.get("features", [])
-            if features:
-                attrs = features[0].get("attributes", {})
-                zone = attrs.get("FLD_ZONE", "X")
-                
-                zone_descriptions = {
-                    "A": "High Risk - 1% annual flood",
-                    "AE": "High Risk with BFE",
-                    "AH": "High Risk - Shallow",
-                    "AO": "High Risk - Sheet Flow",
-                    "V": "High Risk - Coastal",
-                    "VE": "High Risk - Coastal with BFE",
-                    "X": "Minimal Risk",
-                    "B": "Moderate Risk (0.2%)",
-                    "C": "Minimal Risk"
-                }
-                
-                return {
-                    "flood_zone": zone,
-                    "zone_subtype": attrs.get("ZONE_SUBTY"),
-                    "in_sfha": attrs.get("SFHA_TF") == "T",
-                    "description": zone_descriptions.get(zone, "Unknown"),
-                    "coordinates": {"lat": latitude, "lon": longitude}
-                }
+        if attrs is not None:
+            zone = attrs.get("FLD_ZONE", "X")
             
             return {
-                "flood_zone": "X",
-                "in_sfha": False,
-                "description": "Minimal flood hazard"
+                "flood_zone": zone,
+                "zone_subtype": attrs.get("ZONE_SUBTY"),
+                "in_sfha": attrs.get("SFHA_TF") == "T",
+                "description": self.ZONE_DESCRIPTIONS.get(zone, "Unknown"),
+                "coordinates": {"lat": latitude, "lon": longitude}
             }
-            
-        except Exception as e:
-            return {"error": str(e)}
+        
+        return {
+            "flood_zone": "X",
+            "in_sfha": False,
+            "description": "Minimal flood hazard"
+        }
     
-    async def close(self):
-        await self.client.aclose()
-
+    async def _fetch_zone_attrs(self, key: tuple, latitude: float, longitude: float) -> Optional[Dict[str, Any]]:
+        endpoint = f"{self.FEMA_NFHL}/public/NFHL/MapServer/28/query"
+        
+        params = {**self.NFHL_POINT_PARAMS, "geometry": f"{longitude},{latitude}"}
+        
+        response = await self._request("GET", endpoint, params=params, timeout=self.timeout)
+        response.raise_for_status()
+        
+        # ArcGIS reports query errors as 200 {"error": ...}; only a real
+        # feature set (possibly empty - zone X) may be cached
+        data = loads_json(response)
+        if "features" not in data:
+            raise ValueError(f"NFHL query failed: {data.get('error', data)}")
+        features = data["features"]
+        attrs = features[0].get("attributes", {}) if features else None
+        self._flood_cache.set(key, attrs)
+        return attrs
 
 # =============================================================================
 # MCP SERVER REFERENCES
@@ -445,11 +271,11 @@ class SPDAPIClient:
     Unified client for all SPD/ZOD API integrations.
     """
     
-    def __init__(self):
-        self.real_estate = ApifyRealEstateClient()
-        self.census = CensusAPIClient()
-        self.ai_agents = AIAgentClient()
-        self.government = GovernmentDataClient()
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
+        self.real_estate = ApifyRealEstateClient(client=client)
+        self.census = CensusAPIClient(client=client)
+        self.ai_agents = AIAgentClient(client=client)
+        self.government = GovernmentDataClient(client=client)
     
     async def enrich_parcel(
         self,
@@ -464,14 +290,30 @@ class SPDAPIClient:
         - Flood zone
         - Zillow estimate (if available)
         """
-        results = await asyncio.gather(
-            self.census.get_demographics_by_zip(zip_code),
-            self.census.geocode_address(address),
-            return_exceptions=True
+        # Flood lookup needs the geocoded point, demographics do not: run
+        # demographics alongside the whole geocode -> flood chain
+        demographics, (geocode, flood_data) = await gather_with_defaults(
+            (
+                self.census.get_demographics_by_zip(zip_code),
+                self._geocode_with_flood_zone(address),
+            ),
+            ({}, ({}, {}))
         )
         
-        demographics = results[0] if not isinstance(results[0], Exception) else {}
-        geocode = results[1] if not isinstance(results[1], Exception) else {}
+        return {
+            "address": address,
+            "zip_code": zip_code,
+            "geocode": geocode,
+            "demographics": demographics,
+            "flood_zone": flood_data,
+            "enriched_at": utc_now_iso()
+        }
+    
+    async def _geocode_with_flood_zone(self, address: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Geocode an address, then look up the flood zone at that point"""
+        geocode = await self.census.geocode_address(address)
+        if not isinstance(geocode, dict):
+            return {}, {}
         
         # Get flood zone if we have coordinates
         flood_data = {}
@@ -480,15 +322,11 @@ class SPDAPIClient:
                 geocode["latitude"],
                 geocode["longitude"]
             )
-        
-        return {
-            "address": address,
-            "zip_code": zip_code,
-            "geocode": geocode,
-            "demographics": demographics,
-            "flood_zone": flood_data,
-            "enriched_at": datetime.utcnow().isoformat()
-        }
+        return geocode, flood_data
+    
+    # Price-to-income cutoffs: < 3 HIGH, < 5 MEDIUM, else LOW affordability
+    AFFORDABILITY_BINS = (3, 5)
+    AFFORDABILITY_LABELS = ("HIGH", "MEDIUM", "LOW")
     
     async def get_market_data(self, zip_code: str) -> Dict[str, Any]:
         """Get comprehensive market data for a zip code."""
@@ -496,7 +334,6 @@ class SPDAPIClient:
         
         # Add derived metrics
         if not demographics.get("error"):
-            pop = demographics.get("population", 0)
             income = demographics.get("median_income", 0)
             home_value = demographics.get("median_home_value", 0)
             
@@ -512,6 +349,29 @@ class SPDAPIClient:
         
         return demographics
     
+    async def get_market_data_batch(self, zip_codes: List[str]) -> List[Dict[str, Any]]:
+        """
+        get_market_data() for many zips: demographics are fetched
+        concurrently and the derived metrics computed in one vector pass.
+        """
+        if not HAS_NUMPY:
+            return list(await asyncio.gather(*(self.get_market_data(z) for z in zip_codes)))
+        
+        results = await asyncio.gather(*(self.census.get_demographics_by_zip(z) for z in zip_codes))
+        found = [d for d in results if not d.get("error")]
+        if not found:
+            return list(results)
+        
+        home = np.array([d.get("median_home_value", 0) for d in found], dtype=np.float64)
+        income = np.array([d.get("median_income", 0) for d in found], dtype=np.float64)
+        ratio = np.round(np.divide(home, income, out=np.zeros_like(home), where=income > 0), 2)
+        bucket = np.digitize(ratio, self.AFFORDABILITY_BINS)
+        
+        for d, r, b in zip(found, ratio.tolist(), bucket.tolist()):
+            d["price_to_income_ratio"] = r
+            d["affordability_score"] = self.AFFORDABILITY_LABELS[b]
+        return list(results)
+    
     async def close(self):
         await asyncio.gather(
             self.real_estate.close(),
@@ -525,28 +385,41 @@ class SPDAPIClient:
 # CONVENIENCE FUNCTIONS
 # =============================================================================
 
+# Process-wide client stack, reused across calls and closed at exit
+_spd_client: Optional[SPDAPIClient] = None
+
+
+def _get_spd_client() -> SPDAPIClient:
+    """Cached SPDAPIClient"""
+    global _spd_client
+    if _spd_client is None:
+        _spd_client = SPDAPIClient()
+    return _spd_client
+
+
+async def _close_all():
+    global _spd_client
+    client, _spd_client = _spd_client, None
+    if client is not None:
+        await client.close()
+
+
+@atexit.register
+def _close_all_at_exit():
+    if _spd_client is not None:
+        asyncio.run(_close_all())
+
+
 async def enrich_parcel_data(address: str, zip_code: str) -> Dict[str, Any]:
     """Convenience function for parcel enrichment."""
-    client = SPDAPIClient()
-    try:
-        return await client.enrich_parcel(address, zip_code)
-    finally:
-        await client.close()
+    return await _get_spd_client().enrich_parcel(address, zip_code)
 
 
 async def get_market_data(zip_code: str) -> Dict[str, Any]:
     """Convenience function for market data."""
-    client = CensusAPIClient()
-    try:
-        return await client.get_demographics_by_zip(zip_code)
-    finally:
-        await client.close()
+    return await _get_spd_client().census.get_demographics_by_zip(zip_code)
 
 
 async def get_flood_zone(lat: float, lon: float) -> Dict[str, Any]:
     """Convenience function for flood zone lookup."""
-    client = GovernmentDataClient()
-    try:
-        return await client.get_flood_zone(lat, lon)
-    finally:
-        await client.close()
+    return await _get_spd_client().government.get_flood_zone(lat, lon)
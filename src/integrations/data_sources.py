@@ -12,20 +12,117 @@ Data Sources:
 """
 
 import os
+import re
 import json
+import atexit
+import heapq
 import asyncio
-from typing import Dict, Any, List, Optional
+import logging
+from functools import partial
+from operator import attrgetter
+from types import MappingProxyType
+from typing import Dict, Any, AsyncIterator, List, Mapping, Optional
 from dataclasses import dataclass
-from datetime import datetime
 import httpx
 from urllib.parse import urlencode
 
+from src.integrations._httpclient import SharedClientBase, gather_with_defaults, loads_json, warm_up
+from src.integrations._ttlcache import MISSING, TTLCache, coord_key, utc_now_iso
+
+# Optional persistent cache for BCPAO parcel responses
+try:
+    import diskcache
+    HAS_DISKCACHE = True
+except ImportError:
+    HAS_DISKCACHE = False
+
+# Optional incremental JSON parser for large parcel listings
+try:
+    import ijson
+    HAS_IJSON = True
+except ImportError:
+    HAS_IJSON = False
+
+logger = logging.getLogger(__name__)
+
+# Static lookup tables, built once and shared read-only
+
+# ArcGIS /query parameters that never vary; call sites add "where"/"geometry"
+_ARC_BASE_PARAMS: Mapping[str, str] = MappingProxyType({
+    "outFields": "*",
+    "returnGeometry": "false",
+    "f": "json"
+})
+
+_ARC_GEOMETRY_PARAMS: Mapping[str, str] = MappingProxyType({**_ARC_BASE_PARAMS, "returnGeometry": "true"})
+
+_NFHL_POINT_PARAMS: Mapping[str, str] = MappingProxyType({
+    "geometryType": "esriGeometryPoint",
+    "spatialRel": "esriSpatialRelIntersects",
+    "outFields": "FLD_ZONE,ZONE_SUBTY,SFHA_TF",
+    "returnGeometry": "false",
+    "f": "json"
+})
+
+_CONSTRAINT_LAYERS: Mapping[str, str] = MappingProxyType({
+    "wellhead_protection": "WellheadProtection/MapServer/0",
+    "flood_zone": "FloodZones/MapServer/0",
+    "wetlands": "Wetlands/MapServer/0",
+    "conservation": "Conservation/MapServer/0",
+    "easements": "Easements/MapServer/0"
+})
+
+_FLOOD_ZONE_DESC: Mapping[str, str] = MappingProxyType({
+    "A": "High risk - 1% annual flood chance",
+    "AE": "High risk with base flood elevation",
+    "AH": "High risk - 1-3 foot shallow flooding",
+    "AO": "High risk - sheet flow flooding",
+    "V": "High risk - coastal flooding with waves",
+    "VE": "High risk - coastal with base flood elevation",
+    "X": "Minimal flood hazard",
+    "B": "Moderate flood hazard (0.2% annual chance)",
+    "C": "Minimal flood hazard"
+})
+
+_ZONING_DENSITY: Mapping[str, float] = MappingProxyType({
+    "RS": 4, "RM-6": 6, "RM-10": 10, "RM-15": 15, "RM-20": 20,
+    "RM-25": 25, "PUD": 8, "MU": 15
+})
+
+_FLU_DENSITY: Mapping[str, float] = MappingProxyType({"LDR": 4, "MDR": 10, "HDR": 20, "MU": 20})
+
+
+# Parcel IDs / account numbers: letters, digits, dashes and dots only, so a
+# validated ID can go straight into an ArcGIS WHERE literal without escaping
+_PARCEL_RE = re.compile(r"[A-Za-z0-9][A-Za-z0-9.-]{3,31}")
+
+
+def _is_parcel_id(parcel_id: Any) -> bool:
+    return isinstance(parcel_id, str) and _PARCEL_RE.fullmatch(parcel_id) is not None
+
+
+class _AsyncByteReader:
+    """Async file-like ``read()`` over a response byte stream, for ijson"""
+    
+    def __init__(self, chunks: AsyncIterator[bytes]):
+        self._chunks = chunks.__aiter__()
+    
+    async def read(self, size: int = -1) -> bytes:
+        # ijson probes with read(0) to detect bytes vs str - consume nothing.
+        # Short reads are fine; b"" signals end of stream.
+        if size == 0:
+            return b""
+        async for chunk in self._chunks:
+            if chunk:
+                return chunk
+        return b""
+
 
 # =============================================================================
 # BCPAO INTEGRATION
 # =============================================================================
 
-class BCPAOClient:
+class BCPAOClient(SharedClientBase):
     """
     Brevard County Property Appraiser API Client.
     
@@ -34,13 +131,42 @@ class BCPAOClient:
     - Parcel details
     - Sales history
     - GIS overlay data
+    
+    Parcel details are revalidated with conditional GETs: the last body is
+    kept with its ETag / Last-Modified (in memory and, when diskcache is
+    installed, under BCPAO_CACHE_DIR) and a 304 reply reuses it.
     """
     
     BASE_URL = "https://www.bcpao.us/api/v1"
     
-    def __init__(self, timeout: int = 30):
+    CACHE_TTL = 30 * 24 * 3600  # seconds
+    
+    def __init__(
+        self,
+        timeout: int = 30,
+        client: Optional[httpx.AsyncClient] = None,
+        cache_dir: Optional[str] = None
+    ):
+        super().__init__(client)
         self.timeout = timeout
-        self.client = httpx.AsyncClient(timeout=timeout)
+        
+        cache_dir = cache_dir if cache_dir is not None else os.environ.get("BCPAO_CACHE_DIR", ".cache/bcpao")
+        self._parcel_cache = TTLCache(maxsize=10_000, ttl=self.CACHE_TTL)
+        self._disk = diskcache.Cache(cache_dir) if HAS_DISKCACHE and cache_dir else None
+    
+    def _cached_parcel(self, account_number: str):
+        """(etag, last_modified, data) from memory, falling back to disk"""
+        entry = self._parcel_cache.get(account_number)
+        if entry is None and self._disk is not None:
+            entry = self._disk.get(("parcel", account_number))
+            if entry is not None:
+                self._parcel_cache.set(account_number, entry)
+        return entry
+    
+    def _cache_parcel(self, account_number: str, entry) -> None:
+        self._parcel_cache.set(account_number, entry)
+        if self._disk is not None:
+            self._disk.set(("parcel", account_number), entry, expire=self.CACHE_TTL)
     
     async def search_by_address(
         self,
@@ -53,14 +179,16 @@ class BCPAOClient:
             params["city"] = city
         
         try:
-            response = await self.client.get(
+            response = await self._request(
+                "GET",
                 f"{self.BASE_URL}/search",
-                params=params
+                params=params,
+                timeout=self.timeout
             )
             response.raise_for_status()
-            return response.json().get("results", [])
+            return loads_json(response).get("results", [])
         except Exception as e:
-            print(f"BCPAO search error: {e}")
+            logger.warning("BCPAO search error: %s", e)
             return []
     
     async def get_parcel_details(
@@ -68,14 +196,34 @@ class BCPAOClient:
         account_number: str
     ) -> Optional[Dict[str, Any]]:
         """Get detailed parcel information"""
+        cached = self._cached_parcel(account_number)
+        headers = {}
+        if cached is not None:
+            etag, last_modified, _ = cached
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+        
         try:
-            response = await self.client.get(
-                f"{self.BASE_URL}/parcels/{account_number}"
+            response = await self._request(
+                "GET",
+                f"{self.BASE_URL}/parcels/{account_number}",
+                headers=headers,
+                timeout=self.timeout
             )
+            if response.status_code == 304 and cached is not None:
+                return cached[2]
             response.raise_for_status()
-            return response.json()
+            data = loads_json(response)
+            
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+            if etag or last_modified:
+                self._cache_parcel(account_number, (etag, last_modified, data))
+            return data
         except Exception as e:
-            print(f"BCPAO parcel error: {e}")
+            logger.warning("BCPAO parcel error: %s", e)
             return None
     
     async def get_parcels_by_zoning(
@@ -93,14 +241,16 @@ class BCPAOClient:
             params["city"] = city
         
         try:
-            response = await self.client.get(
+            response = await self._request(
+                "GET",
                 f"{self.BASE_URL}/parcels/by-zoning",
-                params=params
+                params=params,
+                timeout=self.timeout
             )
             response.raise_for_status()
-            return response.json().get("parcels", [])
+            return loads_json(response).get("parcels", [])
         except Exception as e:
-            print(f"BCPAO zoning search error: {e}")
+            logger.warning("BCPAO zoning search error: %s", e)
             return []
     
     async def get_parcels_by_flu(
@@ -111,6 +261,24 @@ class BCPAOClient:
         limit: int = 100
     ) -> List[Dict[str, Any]]:
         """Get all parcels with specific Future Land Use"""
+        return [
+            parcel async for parcel in self.iter_parcels_by_flu(flu_code, city, min_acres, limit)
+        ]
+    
+    async def iter_parcels_by_flu(
+        self,
+        flu_code: str,
+        city: Optional[str] = None,
+        min_acres: float = 0.0,
+        limit: int = 100
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield parcels with specific Future Land Use as they arrive.
+        
+        With ijson installed the body is parsed incrementally, so callers
+        can start follow-up queries before the listing finishes
+        downloading; otherwise it is read whole and then yielded.
+        """
         params = {
             "flu": flu_code,
             "min_acres": min_acres,
@@ -120,25 +288,33 @@ class BCPAOClient:
             params["city"] = city
         
         try:
-            response = await self.client.get(
+            async with self.client.stream(
+                "GET",
                 f"{self.BASE_URL}/parcels/by-flu",
-                params=params
-            )
-            response.raise_for_status()
-            return response.json().get("parcels", [])
+                params=params,
+                timeout=self.timeout
+            ) as response:
+                response.raise_for_status()
+                if HAS_IJSON:
+                    reader = _AsyncByteReader(response.aiter_bytes())
+                    async for parcel in ijson.items_async(reader, "parcels.item", use_float=True):
+                        yield parcel
+                else:
+                    await response.aread()
+                    for parcel in loads_json(response).get("parcels", []):
+                        yield parcel
         except Exception as e:
-            print(f"BCPAO FLU search error: {e}")
-            return []
+            logger.warning("BCPAO FLU search error: %s", e)
     
     async def close(self):
-        await self.client.aclose()
-
+        if self._disk is not None:
+            self._disk.close()
 
 # =============================================================================
 # MUNICIPAL GIS INTEGRATION
 # =============================================================================
 
-class MunicipalGISClient:
+class MunicipalGISClient(SharedClientBase):
     """
     Municipal GIS API Client for zoning and FLU data.
     
@@ -156,10 +332,14 @@ class MunicipalGISClient:
         "Brevard County": "https://gis.brevardcounty.us/arcgis/rest/services"
     }
     
-    def __init__(self, jurisdiction: str, timeout: int = 30):
+    # Cap on in-flight batch queries against one ArcGIS host
+    MAX_CONCURRENT = 20
+    
+    def __init__(self, jurisdiction: str, timeout: int = 30, client: Optional[httpx.AsyncClient] = None):
+        super().__init__(client)
         self.jurisdiction = jurisdiction
         self.base_url = self.GIS_ENDPOINTS.get(jurisdiction)
-        self.client = httpx.AsyncClient(timeout=timeout)
+        self.timeout = timeout
     
     async def get_zoning_layer(
         self,
@@ -168,31 +348,81 @@ class MunicipalGISClient:
         """Get zoning district for a parcel"""
         if not self.base_url:
             return None
+        if not _is_parcel_id(parcel_id):
+            logger.warning("Invalid parcel ID: %r", parcel_id)
+            return None
         
         try:
             # Query zoning layer by parcel ID
-            params = {
-                "where": f"PARCEL_ID = '{parcel_id}'",
-                "outFields": "*",
-                "returnGeometry": "false",
-                "f": "json"
-            }
+            params = {**_ARC_BASE_PARAMS, "where": f"PARCEL_ID = '{parcel_id}'"}
             
-            response = await self.client.get(
+            response = await self._request(
+                "GET",
                 f"{self.base_url}/Zoning/MapServer/0/query",
-                params=params
+                params=params,
+                timeout=self.timeout
             )
             response.raise_for_status()
-            data = response.json()
+            data = loads_json(response)
             
             features = data.get("features", [])
             if features:
                 return features[0].get("attributes")
             return None
         except Exception as e:
-            print(f"GIS zoning query error: {e}")
+            logger.warning("GIS zoning query error: %s", e)
             return None
     
+    async def get_zoning_layer_batch(
+        self,
+        parcel_ids: List[str],
+        chunk_size: int = 100
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Get zoning districts for many parcels, keyed by PARCEL_ID.
+        
+        Issues one ``PARCEL_ID IN (...)`` query per chunk (POSTed, so long
+        WHERE clauses don't hit URL-length limits) instead of one request
+        per parcel. Chunks stay under the layer's maxRecordCount and run
+        concurrently, at most MAX_CONCURRENT at a time. Malformed IDs are
+        dropped before the query is built.
+        """
+        valid_ids = [pid for pid in parcel_ids if _is_parcel_id(pid)]
+        if len(valid_ids) < len(parcel_ids):
+            logger.warning("Skipping %d invalid parcel IDs", len(parcel_ids) - len(valid_ids))
+        if not self.base_url or not valid_ids:
+            return {}
+        
+        sem = asyncio.Semaphore(self.MAX_CONCURRENT)
+        
+        async def query_chunk(chunk):
+            data = {**_ARC_BASE_PARAMS, "where": "PARCEL_ID IN ('" + "','".join(chunk) + "')"}
+            try:
+                async with sem:
+                    response = await self._request(
+                        "POST",
+                        f"{self.base_url}/Zoning/MapServer/0/query",
+                        idempotent=True,  # read-only query, POSTed for the long where clause
+                        data=data,
+                        timeout=self.timeout
+                    )
+                response.raise_for_status()
+                return loads_json(response).get("features", [])
+            except Exception as e:
+                logger.warning("GIS zoning batch query error: %s", e)
+                return []
+        
+        chunks = [valid_ids[i:i + chunk_size] for i in range(0, len(valid_ids), chunk_size)]
+        results = await asyncio.gather(*(query_chunk(chunk) for chunk in chunks))
+        
+        zoning = {}
+        for features in results:
+            for feature in features:
+                attributes = feature.get("attributes") or {}
+                if "PARCEL_ID" in attributes:
+                    zoning[str(attributes["PARCEL_ID"])] = attributes
+        return zoning
+    
     async def get_flu_layer(
         self,
         parcel_id: str
@@ -200,28 +430,28 @@ class MunicipalGISClient:
         """Get Future Land Use designation for a parcel"""
         if not self.base_url:
             return None
+        if not _is_parcel_id(parcel_id):
+            logger.warning("Invalid parcel ID: %r", parcel_id)
+            return None
         
         try:
-            params = {
-                "where": f"PARCEL_ID = '{parcel_id}'",
-                "outFields": "*",
-                "returnGeometry": "false",
-                "f": "json"
-            }
+            params = {**_ARC_BASE_PARAMS, "where": f"PARCEL_ID = '{parcel_id}'"}
             
-            response = await self.client.get(
+            response = await self._request(
+                "GET",
                 f"{self.base_url}/FutureLandUse/MapServer/0/query",
-                params=params
+                params=params,
+                timeout=self.timeout
             )
             response.raise_for_status()
-            data = response.json()
+            data = loads_json(response)
             
             features = data.get("features", [])
             if features:
                 return features[0].get("attributes")
             return None
         except Exception as e:
-            print(f"GIS FLU query error: {e}")
+            logger.warning("GIS FLU query error: %s", e)
             return None
     
     async def get_constraint_layers(
@@ -239,49 +469,40 @@ class MunicipalGISClient:
         
         if not self.base_url:
             return constraints
+        if not _is_parcel_id(parcel_id):
+            logger.warning("Invalid parcel ID: %r", parcel_id)
+            return constraints
         
-        # Query each constraint layer
-        layer_mapping = {
-            "wellhead_protection": "WellheadProtection/MapServer/0",
-            "flood_zone": "FloodZones/MapServer/0",
-            "wetlands": "Wetlands/MapServer/0",
-            "conservation": "Conservation/MapServer/0",
-            "easements": "Easements/MapServer/0"
-        }
+        params = {**_ARC_GEOMETRY_PARAMS, "where": f"PARCEL_ID = '{parcel_id}'"}
         
-        for constraint_type, layer_path in layer_mapping.items():
+        async def fetch_layer(layer_path):
             try:
-                params = {
-                    "where": f"PARCEL_ID = '{parcel_id}'",
-                    "outFields": "*",
-                    "returnGeometry": "true",
-                    "f": "json"
-                }
-                
-                response = await self.client.get(
+                response = await self._request(
+                    "GET",
                     f"{self.base_url}/{layer_path}/query",
-                    params=params
+                    params=params,
+                    timeout=self.timeout
                 )
                 
                 if response.status_code == 200:
-                    data = response.json()
-                    features = data.get("features", [])
+                    features = loads_json(response).get("features", [])
                     if features:
-                        constraints[constraint_type] = features[0].get("attributes")
+                        return features[0].get("attributes")
             except Exception:
                 pass  # Layer may not exist for all jurisdictions
+            return None
+        
+        # Query every constraint layer concurrently
+        results = await asyncio.gather(*(fetch_layer(lp) for lp in _CONSTRAINT_LAYERS.values()))
+        constraints.update(zip(_CONSTRAINT_LAYERS, results))
         
         return constraints
-    
-    async def close(self):
-        await self.client.aclose()
-
 
 # =============================================================================
 # PLANNING DEPARTMENT RECORDS
 # =============================================================================
 
-class PlanningRecordsClient:
+class PlanningRecordsClient(SharedClientBase):
     """
     Client for querying municipal planning department records.
     
@@ -292,9 +513,10 @@ class PlanningRecordsClient:
     - Meeting minutes
     """
     
-    def __init__(self, jurisdiction: str, timeout: int = 30):
+    def __init__(self, jurisdiction: str, timeout: int = 30, client: Optional[httpx.AsyncClient] = None):
+        super().__init__(client)
         self.jurisdiction = jurisdiction
-        self.client = httpx.AsyncClient(timeout=timeout)
+        self.timeout = timeout
     
     async def get_rezoning_history(
         self,
@@ -354,24 +576,23 @@ class PlanningRecordsClient:
                 "location": "City Hall Council Chambers"
             }
         ]
-    
-    async def close(self):
-        await self.client.aclose()
-
 
 # =============================================================================
 # FEMA FLOOD MAP INTEGRATION
 # =============================================================================
 
-class FEMAFloodClient:
+class FEMAFloodClient(SharedClientBase):
     """
     FEMA National Flood Hazard Layer (NFHL) API Client.
     """
     
     BASE_URL = "https://hazards.fema.gov/gis/nfhl/rest/services"
     
-    def __init__(self, timeout: int = 30):
-        self.client = httpx.AsyncClient(timeout=timeout)
+    def __init__(self, timeout: int = 30, client: Optional[httpx.AsyncClient] = None):
+        super().__init__(client)
+        self.timeout = timeout
+        # Zone attributes per ~11 m cell; neighbouring parcels share a polygon
+        self._flood_cache = TTLCache(maxsize=10_000, ttl=86_400)
     
     async def get_flood_zone(
         self,
@@ -379,94 +600,114 @@ class FEMAFloodClient:
         longitude: float
     ) -> Optional[Dict[str, Any]]:
         """Get flood zone at coordinates"""
-        try:
-            params = {
-                "geometry": f"{longitude},{latitude}",
-                "geometryType": "esriGeometryPoint",
-                "spatialRel": "esriSpatialRelIntersects",
-                "outFields": "FLD_ZONE,ZONE_SUBTY,SFHA_TF",
-                "returnGeometry": "false",
-                "f": "json"
+        key = coord_key(latitude, longitude)
+        attrs = self._flood_cache.get(key, MISSING)
+        if attrs is MISSING:
+            try:
+                # Concurrent lookups in the same cell share one query
+                attrs = await self._single_flight(key, partial(self._fetch_zone_attrs, key, latitude, longitude))
+            except Exception as e:
+                logger.warning("FEMA flood query error: %s", e)
+                return None
+        
+        if attrs is not None:
+            return {
+                "flood_zone": attrs.get("FLD_ZONE"),
+                "zone_subtype": attrs.get("ZONE_SUBTY"),
+                "in_sfha": attrs.get("SFHA_TF") == "T",
+                "description": self._get_zone_description(attrs.get("FLD_ZONE"))
             }
-            
-            response = await self.client.get(
-                f"{self.BASE_URL}/public/NFHL/MapServer/28/query",
-                params=params
-            )
-            response.raise_for_status()
-            data = response.json()
-            
-            features = data.get("features", [])
-            if features:
-                attrs = features[0].get("attributes", {})
-                return {
-                    "flood_zone": attrs.get("FLD_ZONE"),
-                    "zone_subtype": attrs.get("ZONE_SUBTY"),
-                    "in_sfha": attrs.get("SFHA_TF") == "T",
-                    "description": self._get_zone_description(attrs.get("FLD_ZONE"))
-                }
-            return {"flood_zone": "X", "in_sfha": False, "description": "Minimal flood hazard"}
-        except Exception as e:
-            print(f"FEMA flood query error: {e}")
-            return None
+        return {"flood_zone": "X", "in_sfha": False, "description": "Minimal flood hazard"}
+    
+    async def _fetch_zone_attrs(self, key: tuple, latitude: float, longitude: float) -> Optional[Dict[str, Any]]:
+        params = {**_NFHL_POINT_PARAMS, "geometry": f"{longitude},{latitude}"}
+        
+        response = await self._request(
+            "GET",
+            f"{self.BASE_URL}/public/NFHL/MapServer/28/query",
+            params=params,
+            timeout=self.timeout
+        )
+        response.raise_for_status()
+        
+        # ArcGIS reports query errors as 200 {"error": ...}; only a real
+        # feature set (possibly empty - zone X) may be cached
+        data = loads_json(response)
+        if "features" not in data:
+            raise ValueError(f"NFHL query failed: {data.get('error', data)}")
+        features = data["features"]
+        attrs = features[0].get("attributes", {}) if features else None
+        self._flood_cache.set(key, attrs)
+        return attrs
     
     def _get_zone_description(self, zone: str) -> str:
         """Get human-readable flood zone description"""
-        descriptions = {
-            "A": "High risk - 1% annual flood chance",
-            "AE": "High risk with base flood elevation",
-            "AH": "High risk - 1-3 foot shallow flooding",
-            "AO": "High risk - sheet flow flooding",
-            "V": "High risk - coastal flooding with waves",
-            "VE": "High risk - coastal with base flood elevation",
-            "X": "Minimal flood hazard",
-            "B": "Moderate flood hazard (0.2% annual chance)",
-            "C": "Minimal flood hazard"
-        }
-        return descriptions.get(zone, "Unknown flood zone")
-    
-    async def close(self):
-        await self.client.aclose()
-
+        return _FLOOD_ZONE_DESC.get(zone, "Unknown flood zone")
 
 # =============================================================================
 # DATA AGGREGATOR
 # =============================================================================
 
+@dataclass(slots=True)
+class Opportunity:
+    """Parcel whose zoning allows less density than its Future Land Use"""
+    parcel: Dict[str, Any]
+    zoning: Dict[str, Any]
+    flu_code: str
+    current_density: float
+    flu_density: float
+    density_gap: float
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {f: getattr(self, f) for f in self.__dataclass_fields__}
+
+
 class OpportunityDataAggregator:
     """
     Aggregates data from all sources for opportunity analysis.
     """
     
-    def __init__(self, jurisdiction: str):
+    # Parcels per PARCEL_ID IN (...) zoning query
+    ZONING_BATCH_SIZE = 100
+    
+    def __init__(self, jurisdiction: str, client: Optional[httpx.AsyncClient] = None):
         self.jurisdiction = jurisdiction
-        self.bcpao = BCPAOClient()
-        self.gis = MunicipalGISClient(jurisdiction)
-        self.planning = PlanningRecordsClient(jurisdiction)
-        self.fema = FEMAFloodClient()
+        self.bcpao = BCPAOClient(client=client)
+        self.gis = MunicipalGISClient(jurisdiction, client=client)
+        self.planning = PlanningRecordsClient(jurisdiction, client=client)
+        self.fema = FEMAFloodClient(client=client)
+    
+    async def warm_up(self):
+        """Connect to BCPAO, the municipal GIS and FEMA before a query burst"""
+        urls = [self.bcpao.BASE_URL, self.fema.BASE_URL]
+        if self.gis.base_url:
+            urls.append(self.gis.base_url)
+        await warm_up(self.bcpao.client, *urls)
     
     async def get_parcel_data(
         self,
         account_number: str
     ) -> Dict[str, Any]:
         """Get comprehensive parcel data from all sources"""
-        # Gather data in parallel
-        bcpao_data, gis_zoning, gis_flu, gis_constraints = await asyncio.gather(
-            self.bcpao.get_parcel_details(account_number),
-            self.gis.get_zoning_layer(account_number),
-            self.gis.get_flu_layer(account_number),
-            self.gis.get_constraint_layers(account_number),
-            return_exceptions=True
+        # Gather data in parallel; a failed source falls back to its default
+        bcpao_data, gis_zoning, gis_flu, gis_constraints = await gather_with_defaults(
+            (
+                self.bcpao.get_parcel_details(account_number),
+                self.gis.get_zoning_layer(account_number),
+                self.gis.get_flu_layer(account_number),
+                self.gis.get_constraint_layers(account_number),
+            ),
+            (None, None, None, {})
         )
         
         # Combine results
         result = {
             "account_number": account_number,
-            "bcpao": bcpao_data if not isinstance(bcpao_data, Exception) else None,
-            "zoning": gis_zoning if not isinstance(gis_zoning, Exception) else None,
-            "flu": gis_flu if not isinstance(gis_flu, Exception) else None,
-            "constraints": gis_constraints if not isinstance(gis_constraints, Exception) else {},
-            "fetched_at": datetime.utcnow().isoformat()
+            "bcpao": bcpao_data,
+            "zoning": gis_zoning,
+            "flu": gis_flu,
+            "constraints": gis_constraints,
+            "fetched_at": utc_now_iso()
         }
         
         return result
@@ -476,7 +717,7 @@ class OpportunityDataAggregator:
         target_flu: List[str],
         min_acres: float = 0.5,
         max_results: int = 100
-    ) -> List[Dict[str, Any]]:
+    ) -> List["Opportunity"]:
         """
         Discover rezoning opportunities by finding parcels where
         current zoning < FLU maximum density.
@@ -484,49 +725,60 @@ class OpportunityDataAggregator:
         opportunities = []
         
         for flu_code in target_flu:
-            # Get parcels with this FLU designation
-            parcels = await self.bcpao.get_parcels_by_flu(
-                flu_code=flu_code,
-                city=self.jurisdiction,
-                min_acres=min_acres,
-                limit=max_results // len(target_flu)
-            )
+            # Stream parcels with this FLU designation, issuing a batched
+            # zoning query for each full chunk while the rest download
+            parcels = []
+            batches = []
+            chunk = []
+            try:
+                async for parcel in self.bcpao.iter_parcels_by_flu(
+                    flu_code=flu_code,
+                    city=self.jurisdiction,
+                    min_acres=min_acres,
+                    limit=max_results // len(target_flu)
+                ):
+                    parcels.append(parcel)
+                    chunk.append(str(parcel.get("parcel_id")))
+                    if len(chunk) == self.ZONING_BATCH_SIZE:
+                        batches.append(asyncio.ensure_future(self.gis.get_zoning_layer_batch(chunk)))
+                        chunk = []
+                if chunk:
+                    batches.append(asyncio.ensure_future(self.gis.get_zoning_layer_batch(chunk)))
+                
+                zonings = {}
+                for batch in await asyncio.gather(*batches):
+                    zonings.update(batch)
+            finally:
+                for batch in batches:
+                    batch.cancel()
+            flu_density = self._get_flu_density(flu_code)
             
             for parcel in parcels:
-                # Get zoning data
-                zoning = await self.gis.get_zoning_layer(parcel.get("parcel_id"))
-                
+                zoning = zonings.get(str(parcel.get("parcel_id")))
                 if zoning:
                     current_density = self._get_zoning_density(zoning.get("ZONE_CODE"))
-                    flu_density = self._get_flu_density(flu_code)
                     
                     if flu_density > current_density:
-                        opportunities.append({
-                            "parcel": parcel,
-                            "zoning": zoning,
-                            "flu_code": flu_code,
-                            "current_density": current_density,
-                            "flu_density": flu_density,
-                            "density_gap": flu_density - current_density
-                        })
+                        opportunities.append(Opportunity(
+                            parcel=parcel,
+                            zoning=zoning,
+                            flu_code=flu_code,
+                            current_density=current_density,
+                            flu_density=flu_density,
+                            density_gap=flu_density - current_density
+                        ))
         
-        # Sort by density gap (highest opportunity first)
-        opportunities.sort(key=lambda x: x["density_gap"], reverse=True)
-        
-        return opportunities[:max_results]
+        # Top max_results by density gap (highest opportunity first); same
+        # order as a stable reverse sort, without sorting the whole list
+        return heapq.nlargest(max_results, opportunities, key=attrgetter("density_gap"))
     
     def _get_zoning_density(self, zone_code: str) -> float:
         """Map zoning code to density"""
-        density_map = {
-            "RS": 4, "RM-6": 6, "RM-10": 10, "RM-15": 15, "RM-20": 20,
-            "RM-25": 25, "PUD": 8, "MU": 15
-        }
-        return density_map.get(zone_code, 4)
+        return _ZONING_DENSITY.get(zone_code, 4)
     
     def _get_flu_density(self, flu_code: str) -> float:
         """Map FLU code to max density"""
-        flu_map = {"LDR": 4, "MDR": 10, "HDR": 20, "MU": 20}
-        return flu_map.get(flu_code, 4)
+        return _FLU_DENSITY.get(flu_code, 4)
     
     async def close(self):
         await asyncio.gather(
@@ -541,6 +793,30 @@ class OpportunityDataAggregator:
 # CONVENIENCE FUNCTIONS
 # =============================================================================
 
+# One aggregator per jurisdiction, reused across calls and closed at exit
+_AGGREGATORS: Dict[str, OpportunityDataAggregator] = {}
+
+
+def _get_aggregator(jurisdiction: str) -> OpportunityDataAggregator:
+    """Cached OpportunityDataAggregator for a jurisdiction"""
+    aggregator = _AGGREGATORS.get(jurisdiction)
+    if aggregator is None:
+        aggregator = _AGGREGATORS[jurisdiction] = OpportunityDataAggregator(jurisdiction)
+    return aggregator
+
+
+async def _close_all():
+    aggregators = list(_AGGREGATORS.values())
+    _AGGREGATORS.clear()
+    await asyncio.gather(*(a.close() for a in aggregators))
+
+
+@atexit.register
+def _close_all_at_exit():
+    if _AGGREGATORS:
+        asyncio.run(_close_all())
+
+
 async def fetch_opportunity_data(
     jurisdiction: str,
     target_flu: List[str] = None,
@@ -562,28 +838,28 @@ async def fetch_opportunity_data(
     if target_flu is None:
         target_flu = ["HDR", "MDR"]
     
-    aggregator = OpportunityDataAggregator(jurisdiction)
+    aggregator = _get_aggregator(jurisdiction)
     
-    try:
-        # Get rezoning history for approval rate
-        rezoning_history = await aggregator.planning.get_rezoning_history(
+    # Get rezoning history for approval rate while connections open
+    rezoning_history, _ = await asyncio.gather(
+        aggregator.planning.get_rezoning_history(
             years_back=2,
             flu_designation=None
-        )
-        
-        # Discover opportunities
-        opportunities = await aggregator.discover_opportunities(
-            target_flu=target_flu,
-            min_acres=min_acres,
-            max_results=max_results
-        )
-        
-        return {
-            "jurisdiction": jurisdiction,
-            "target_flu": target_flu,
-            "opportunities": opportunities,
-            "rezoning_history": rezoning_history,
-            "fetched_at": datetime.utcnow().isoformat()
-        }
-    finally:
-        await aggregator.close()
+        ),
+        aggregator.warm_up()
+    )
+    
+    # Discover opportunities
+    opportunities = await aggregator.discover_opportunities(
+        target_flu=target_flu,
+        min_acres=min_acres,
+        max_results=max_results
+    )
+    
+    return {
+        "jurisdiction": jurisdiction,
+        "target_flu": target_flu,
+        "opportunities": [opp.to_dict() for opp in opportunities],
+        "rezoning_history": rezoning_history,
+        "fetched_at": utc_now_iso()
+    }
@@ -8,26 +8,57 @@ Database: mocerqjnksmhcjzxrewo.supabase.co
 """
 
 import os
-import json
+import gzip
+import urllib.parse
+import time
+import asyncio
 import logging
-from datetime import datetime
-from typing import List, Dict, Any, Optional
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import List, Dict, Any, Iterable, Iterator, Mapping, Optional, Tuple
 from dataclasses import dataclass
+from functools import lru_cache
+from itertools import product
+from types import MappingProxyType
 
-# Use standard library for HTTP (no external deps required)
-import urllib.request
-import urllib.parse
+import httpx
+
+from src.integrations._httpclient import (
+    CONNECT_RETRIES,
+    POOL_LIMITS,
+    SharedClientBase,
+    dumps_json,
+    loads_content,
+    loads_json
+)
+from src.integrations._ttlcache import TTLCache, utc_now_iso
+
+# Optional direct Postgres access for COPY-based bulk loads
+try:
+    import asyncpg
+    HAS_ASYNCPG = True
+except ImportError:
+    HAS_ASYNCPG = False
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Target size of one batch-insert body; keeps requests well under
+# PostgREST / gateway body limits
+MAX_BODY_BYTES = 1 << 20
 
-@dataclass
+# Gzip request bodies (Content-Encoding: gzip). Only enable when the
+# gateway in front of PostgREST decompresses request bodies.
+GZIP_BODIES = os.environ.get("SUPABASE_GZIP", "0") == "1"
+
+
+@dataclass(slots=True)
 class SupabaseConfig:
     """Supabase configuration"""
     url: str = "https://mocerqjnksmhcjzxrewo.supabase.co"
     anon_key: str = ""  # Set via environment or direct
     service_key: str = ""  # Set via environment for write access
+    db_url: str = ""  # Postgres pooler DSN (port 6543) for bulk COPY loads
     
     # Table names
     parcels_table: str = "rough_diamond_parcels"
@@ -35,157 +66,522 @@ class SupabaseConfig:
     search_runs_table: str = "search_runs"
 
 
-class SupabaseClient:
+@lru_cache(maxsize=1024)
+def _dumps_frozen(kind: type, items: Tuple, types: Tuple) -> str:
+    # types is part of the key only: 1, 1.0 and True hash alike but encode differently
+    return dumps_json(kind(items)).decode()
+
+
+def _json_column(value: Any) -> str:
+    """JSON text for a JSONB column; list / dict shapes the scorer repeats are encoded once"""
+    try:
+        if isinstance(value, list):
+            return _dumps_frozen(list, tuple(value), tuple(map(type, value)))
+        if isinstance(value, dict):
+            return _dumps_frozen(dict, tuple(value.items()), tuple(map(type, value.values())))
+    except TypeError:  # unhashable (nested list / dict) members
+        pass
+    return dumps_json(value).decode()
+
+
+def _parcel_record(parcel: Dict[str, Any], now_iso: Optional[str] = None) -> Dict[str, Any]:
+    """Map BCPAO fields to the rough_diamond_parcels schema"""
+    if now_iso is None:
+        now_iso = utc_now_iso()
+    get = parcel.get
+    account = get('account')
+    return {
+        "account": account,
+        "parcel_id": get('parcelID') or get('parcel_id'),
+        "address": get('siteAddress') or get('address'),
+        "acres": float(get('acreage') or get('acres') or 0),
+        "taxing_district": get('taxingDistrict') or get('district'),
+        "land_use_code": get('landUseCode') or get('land_use'),
+        "market_value": float(get('marketValue') or get('market_value') or 0),
+        "owner": get('owners') or get('owner'),
+        "bcpao_url": get('bcpao_url') or f"https://www.bcpao.us/PropertySearch/#/account/{account}",
+        "created_at": now_iso,
+        "updated_at": now_iso
+    }
+
+
+def _score_record(scored_parcel: Dict[str, Any], now_iso: Optional[str] = None) -> Dict[str, Any]:
+    """Map a scored parcel to the parcel_scores schema"""
+    if now_iso is None:
+        now_iso = utc_now_iso()
+    get = scored_parcel.get
+    return {
+        "account": get('account'),
+        "score": get('score'),
+        "recommendation": get('recommendation'),
+        "risk_level": get('risk_level'),
+        "timeline": get('timeline'),
+        "action": get('action'),
+        "scoring_factors": _json_column(get('scoring_factors', [])),
+        "component_scores": _json_column(get('component_scores', {})),
+        "scored_at": now_iso
+    }
+
+
+def _parcel_records(parcels: Iterable[Dict]) -> Iterator[Dict[str, Any]]:
+    """Lazily map a batch of parcels; rows share one created/updated timestamp"""
+    now_iso = utc_now_iso()
+    return (_parcel_record(p, now_iso) for p in parcels)
+
+
+def _score_records(scored_parcels: Iterable[Dict]) -> Iterator[Dict[str, Any]]:
+    """Lazily map a batch of scores; rows share one scored_at timestamp"""
+    now_iso = utc_now_iso()
+    return (_score_record(sp, now_iso) for sp in scored_parcels)
+
+
+# rough_diamond_parcels columns written by bulk_copy_parcels, in COPY order
+_PARCEL_COLUMNS = (
+    "account", "parcel_id", "address", "acres", "taxing_district", "land_use_code",
+    "market_value", "owner", "bcpao_url", "created_at", "updated_at"
+)
+
+
+def _parcel_copy_rows(parcels: Iterable[Dict]) -> List[Tuple]:
     """
-    Lightweight Supabase client using standard library
-    For production, consider using supabase-py
+    Parcel records as COPY tuples (DECIMAL columns as Decimal, timestamps
+    as datetimes), one per account - the last occurrence in the batch wins.
+    """
+    now = datetime.now(timezone.utc)
+    rows = {}
+    for record in _parcel_records(parcels):
+        record["acres"] = Decimal(str(record["acres"]))
+        record["market_value"] = Decimal(str(record["market_value"]))
+        record["created_at"] = record["updated_at"] = now
+        rows[record["account"]] = tuple(record[column] for column in _PARCEL_COLUMNS)
+    return list(rows.values())
+
+
+def _json_array_chunks(records: Iterable[Dict[str, Any]], max_bytes: int = MAX_BODY_BYTES) -> Iterator[bytes]:
+    """
+    Serialize records into JSON array bodies of about ``max_bytes`` each
+    (a single oversized record still gets its own body). Each record is
+    encoded once; bodies are joined from the encoded pieces.
+    """
+    chunk: List[bytes] = []
+    size = 2  # brackets
+    for record in records:
+        encoded = dumps_json(record)
+        if chunk and size + len(encoded) + 1 > max_bytes:
+            yield b"[" + b",".join(chunk) + b"]"
+            chunk, size = [], 2
+        chunk.append(encoded)
+        size += len(encoded) + 1
+    if chunk:
+        yield b"[" + b",".join(chunk) + b"]"
+
+
+def _search_run_record(run_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Map run metadata to the search_runs schema"""
+    return {
+        "run_type": run_data.get('run_type', 'bcpao_search'),
+        "total_found": run_data.get('total_found', 0),
+        "bid_count": run_data.get('bid_count', 0),
+        "review_count": run_data.get('review_count', 0),
+        "parameters": dumps_json(run_data.get('parameters', {})).decode(),
+        "status": run_data.get('status', 'completed'),
+        "run_at": utc_now_iso()
+    }
+
+
+class _SupabaseBase:
     """
+    Config, key resolution, headers, query endpoints and the GET cache
+    shared by the sync and async clients.
+    
+    GET bodies are served from memory for GET_CACHE_TTL seconds; after
+    that they are revalidated with If-None-Match, so an unchanged result
+    costs a bodiless 304. Any write through the client drops the cache.
+    """
+    
+    GET_CACHE_TTL = 60.0
+    MAX_BODY_BYTES = MAX_BODY_BYTES
+    GZIP_BODIES = GZIP_BODIES
     
     def __init__(self, config: SupabaseConfig = None):
         self.config = config or SupabaseConfig()
         
+        # endpoint -> (fetched_at, etag, raw body); kept past the TTL for revalidation
+        self._get_cache = TTLCache(maxsize=512, ttl=3600.0)
+        
         # Try to get keys from environment
         self.config.anon_key = os.environ.get('SUPABASE_ANON_KEY', self.config.anon_key)
         self.config.service_key = os.environ.get('SUPABASE_SERVICE_KEY', self.config.service_key)
+        self.config.db_url = os.environ.get('SUPABASE_DB_URL', self.config.db_url)
         
         if not self.config.service_key and not self.config.anon_key:
             logger.warning("No Supabase keys configured - database operations will fail")
+        
+        # Keys are fixed from here on: build every header variant once
+        self._headers = {
+            flags: MappingProxyType(self._build_headers(*flags))
+            for flags in product((True, False), repeat=3)
+        }
     
-    def _get_headers(self, use_service_key: bool = True) -> Dict[str, str]:
-        """Get headers for Supabase API requests"""
+    def _build_headers(self, use_service_key: bool, return_rows: bool, upsert: bool) -> Dict[str, str]:
         key = self.config.service_key if use_service_key else self.config.anon_key
+        prefer = "return=representation" if return_rows else "return=minimal"
+        if upsert:
+            prefer += ",resolution=merge-duplicates"
         return {
             "apikey": key,
             "Authorization": f"Bearer {key}",
             "Content-Type": "application/json",
-            "Prefer": "return=representation"
+            "Prefer": prefer
         }
     
-    def _make_request(self, method: str, endpoint: str, data: Any = None) -> Dict:
-        """Make HTTP request to Supabase REST API"""
-        url = f"{self.config.url}/rest/v1/{endpoint}"
+    def _get_headers(
+        self,
+        use_service_key: bool = True,
+        return_rows: bool = True,
+        upsert: bool = False
+    ) -> Mapping[str, str]:
+        """
+        Get (read-only) headers for Supabase API requests. return_rows=False
+        asks PostgREST for an empty 201 instead of echoing the written rows;
+        upsert merges rows that conflict on the endpoint's on_conflict key.
+        """
+        return self._headers[(use_service_key, return_rows, upsert)]
+    
+    def _url(self, endpoint: str) -> str:
+        return f"{self.config.url}/rest/v1/{endpoint}"
+    
+    def _encode_body(self, data: Any, headers: Mapping[str, str]) -> Tuple[Optional[bytes], Mapping[str, str]]:
+        """Serialize ``data`` (unless already encoded bytes), gzipping it if GZIP_BODIES"""
+        if not data:
+            return None, headers
+        body = data if isinstance(data, bytes) else dumps_json(data)
+        if self.GZIP_BODIES:
+            return gzip.compress(body, compresslevel=5), {**headers, "Content-Encoding": "gzip"}
+        return body, headers
+    
+    def _cache_lookup(self, endpoint: str) -> Tuple[Optional[Tuple[float, Optional[str], bytes]], bool]:
+        """(cache entry or None, whether it is still fresh)"""
+        entry = self._get_cache.get(endpoint)
+        if entry is None:
+            return None, False
+        return entry, time.monotonic() - entry[0] < self.GET_CACHE_TTL
+    
+    def _cache_store(self, endpoint: str, response: httpx.Response, entry) -> bytes:
+        """Record a GET response (200 or 304) and return the body to decode"""
+        if response.status_code == 304 and entry is not None:
+            etag, content = entry[1], entry[2]
+        else:
+            response.raise_for_status()
+            etag, content = response.headers.get("ETag"), response.content
+        self._get_cache.set(endpoint, (time.monotonic(), etag, content))
+        return content
+    
+    def _parcels_upsert_endpoint(self) -> str:
+        # account is UNIQUE but not the primary key, so name it explicitly
+        return f"{self.config.parcels_table}?on_conflict=account"
+    
+    def _bid_parcels_endpoint(self, limit: int) -> str:
+        return f"{self.config.scores_table}?recommendation=like.*BID*&order=score.desc&limit={limit}"
+    
+    def _district_endpoint(self, district_pattern: str, limit: int) -> str:
+        return f"{self.config.parcels_table}?taxing_district=ilike.*{district_pattern}*&limit={limit}"
+    
+    def _districts_endpoint(self, district_patterns: Iterable[str], limit: int) -> str:
+        # Same ilike match as _district_endpoint, OR-ed server-side; values are
+        # double-quoted so commas / parentheses in a pattern stay literal
+        terms = ",".join(
+            'taxing_district.ilike."*{}*"'.format(p.replace("\\", "\\\\").replace('"', '\\"'))
+            for p in district_patterns
+        )
+        return f"{self.config.parcels_table}?or=({urllib.parse.quote(terms, safe=',.*')})&limit={limit}"
+    
+    def _high_value_endpoint(self, min_score: int, limit: int) -> str:
+        return f"{self.config.scores_table}?score=gte.{min_score}&order=score.desc&limit={limit}"
+
+
+class SupabaseClient(_SupabaseBase):
+    """
+    Lightweight Supabase REST client over a keep-alive connection pool
+    For production, consider using supabase-py
+    """
+    
+    def __init__(self, config: SupabaseConfig = None, client: Optional[httpx.Client] = None):
+        super().__init__(config)
         
-        headers = self._get_headers()
+        # Reuse one pooled client so consecutive calls skip the TCP/TLS handshake
+        self._owns_client = client is None
+        self._client = client or httpx.Client(
+            timeout=30,
+            transport=httpx.HTTPTransport(limits=POOL_LIMITS, retries=CONNECT_RETRIES)
+        )
+    
+    def _make_request(
+        self,
+        method: str,
+        endpoint: str,
+        data: Any = None,
+        return_rows: bool = True,
+        upsert: bool = False
+    ) -> Optional[Dict]:
+        """Make HTTP request to Supabase REST API (None when return_rows=False)"""
+        url = self._url(endpoint)
         
-        if data:
-            data_bytes = json.dumps(data).encode('utf-8')
-        else:
-            data_bytes = None
+        headers = self._get_headers(return_rows=return_rows, upsert=upsert)
         
-        req = urllib.request.Request(url, data=data_bytes, headers=headers, method=method)
+        data_bytes, headers = self._encode_body(data, headers)
+        
+        entry = None
+        if method == "GET":
+            entry, fresh = self._cache_lookup(endpoint)
+            if fresh:
+                return loads_content(entry[2])
+            if entry is not None and entry[1]:
+                headers = {**headers, "If-None-Match": entry[1]}
         
         try:
-            with urllib.request.urlopen(req, timeout=30) as response:
-                return json.loads(response.read().decode())
-        except urllib.error.HTTPError as e:
-            error_body = e.read().decode() if e.fp else str(e)
-            logger.error(f"Supabase error {e.code}: {error_body}")
+            response = self._client.request(method, url, content=data_bytes, headers=headers)
+            if method == "GET":
+                return loads_content(self._cache_store(endpoint, response, entry))
+            response.raise_for_status()
+            self._get_cache.clear()
+            return loads_json(response) if return_rows else None
+        except httpx.HTTPStatusError as e:
+            logger.error(f"Supabase error {e.response.status_code}: {e.response.text}")
             raise
         except Exception as e:
             logger.error(f"Request failed: {e}")
             raise
     
+    def close(self):
+        """Close the connection pool (if this client created it)"""
+        if self._owns_client:
+            self._client.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+    
+    def _insert_chunked(
+        self,
+        endpoint: str,
+        records: Iterable[Dict],
+        return_rows: bool,
+        upsert: bool = False
+    ) -> List[Dict]:
+        rows = []
+        for body in _json_array_chunks(records, self.MAX_BODY_BYTES):
+            result = self._make_request("POST", endpoint, body, return_rows=return_rows, upsert=upsert)
+            if result:
+                rows.extend(result)
+        return rows
+    
     def insert_parcel(self, parcel: Dict[str, Any]) -> Dict:
-        """Insert a single parcel record"""
-        # Map BCPAO fields to database schema
-        record = {
-            "account": parcel.get('account'),
-            "parcel_id": parcel.get('parcelID') or parcel.get('parcel_id'),
-            "address": parcel.get('siteAddress') or parcel.get('address'),
-            "acres": float(parcel.get('acreage') or parcel.get('acres') or 0),
-            "taxing_district": parcel.get('taxingDistrict') or parcel.get('district'),
-            "land_use_code": parcel.get('landUseCode') or parcel.get('land_use'),
-            "market_value": float(parcel.get('marketValue') or parcel.get('market_value') or 0),
-            "owner": parcel.get('owners') or parcel.get('owner'),
-            "bcpao_url": parcel.get('bcpao_url') or f"https://www.bcpao.us/PropertySearch/#/account/{parcel.get('account')}",
-            "created_at": datetime.now().isoformat(),
-            "updated_at": datetime.now().isoformat()
-        }
-        
-        return self._make_request("POST", self.config.parcels_table, record)
-    
-    def insert_parcels_batch(self, parcels: List[Dict]) -> List[Dict]:
-        """Insert multiple parcel records"""
-        records = []
-        for p in parcels:
-            records.append({
-                "account": p.get('account'),
-                "parcel_id": p.get('parcelID') or p.get('parcel_id'),
-                "address": p.get('siteAddress') or p.get('address'),
-                "acres": float(p.get('acreage') or p.get('acres') or 0),
-                "taxing_district": p.get('taxingDistrict') or p.get('district'),
-                "land_use_code": p.get('landUseCode') or p.get('land_use'),
-                "market_value": float(p.get('marketValue') or p.get('market_value') or 0),
-                "owner": p.get('owners') or p.get('owner'),
-                "bcpao_url": f"https://www.bcpao.us/PropertySearch/#/account/{p.get('account')}",
-                "created_at": datetime.now().isoformat(),
-                "updated_at": datetime.now().isoformat()
-            })
-        
-        return self._make_request("POST", self.config.parcels_table, records)
+        """Upsert a single parcel record (keyed on account)"""
+        return self._make_request("POST", self._parcels_upsert_endpoint(), _parcel_record(parcel), upsert=True)
+    
+    def insert_parcels_batch(self, parcels: List[Dict], return_rows: bool = False) -> List[Dict]:
+        """
+        Upsert multiple parcel records, ~MAX_BODY_BYTES of JSON per request;
+        the written rows are only sent back if return_rows
+        """
+        return self._insert_chunked(
+            self._parcels_upsert_endpoint(), _parcel_records(parcels), return_rows, upsert=True
+        )
     
     def insert_score(self, scored_parcel: Dict[str, Any]) -> Dict:
         """Insert a parcel score record"""
-        record = {
-            "account": scored_parcel.get('account'),
-            "score": scored_parcel.get('score'),
-            "recommendation": scored_parcel.get('recommendation'),
-            "risk_level": scored_parcel.get('risk_level'),
-            "timeline": scored_parcel.get('timeline'),
-            "action": scored_parcel.get('action'),
-            "scoring_factors": json.dumps(scored_parcel.get('scoring_factors', [])),
-            "component_scores": json.dumps(scored_parcel.get('component_scores', {})),
-            "scored_at": datetime.now().isoformat()
-        }
-        
-        return self._make_request("POST", self.config.scores_table, record)
-    
-    def insert_scores_batch(self, scored_parcels: List[Dict]) -> List[Dict]:
-        """Insert multiple score records"""
-        records = []
-        for sp in scored_parcels:
-            records.append({
-                "account": sp.get('account'),
-                "score": sp.get('score'),
-                "recommendation": sp.get('recommendation'),
-                "risk_level": sp.get('risk_level'),
-                "timeline": sp.get('timeline'),
-                "action": sp.get('action'),
-                "scoring_factors": json.dumps(sp.get('scoring_factors', [])),
-                "component_scores": json.dumps(sp.get('component_scores', {})),
-                "scored_at": datetime.now().isoformat()
-            })
-        
-        return self._make_request("POST", self.config.scores_table, records)
+        return self._make_request("POST", self.config.scores_table, _score_record(scored_parcel))
+    
+    def insert_scores_batch(self, scored_parcels: List[Dict], return_rows: bool = False) -> List[Dict]:
+        """
+        Insert multiple score records, ~MAX_BODY_BYTES of JSON per request;
+        the written rows are only sent back if return_rows
+        """
+        return self._insert_chunked(self.config.scores_table, _score_records(scored_parcels), return_rows)
     
-    def log_search_run(self, run_data: Dict[str, Any]) -> Dict:
+    def log_search_run(self, run_data: Dict[str, Any], return_rows: bool = False) -> Optional[Dict]:
         """Log a search run for tracking"""
-        record = {
-            "run_type": run_data.get('run_type', 'bcpao_search'),
-            "total_found": run_data.get('total_found', 0),
-            "bid_count": run_data.get('bid_count', 0),
-            "review_count": run_data.get('review_count', 0),
-            "parameters": json.dumps(run_data.get('parameters', {})),
-            "status": run_data.get('status', 'completed'),
-            "run_at": datetime.now().isoformat()
-        }
-        
-        return self._make_request("POST", self.config.search_runs_table, record)
+        record = _search_run_record(run_data)
+        return self._make_request("POST", self.config.search_runs_table, record, return_rows=return_rows)
     
     def get_bid_parcels(self, limit: int = 50) -> List[Dict]:
         """Get top BID recommendation parcels"""
-        endpoint = f"{self.config.scores_table}?recommendation=like.*BID*&order=score.desc&limit={limit}"
-        return self._make_request("GET", endpoint)
+        return self._make_request("GET", self._bid_parcels_endpoint(limit))
     
     def get_parcels_by_district(self, district_pattern: str, limit: int = 100) -> List[Dict]:
         """Get parcels matching a district pattern"""
-        endpoint = f"{self.config.parcels_table}?taxing_district=ilike.*{district_pattern}*&limit={limit}"
-        return self._make_request("GET", endpoint)
+        return self._make_request("GET", self._district_endpoint(district_pattern, limit))
+    
+    def get_parcels_by_districts(self, district_patterns: List[str], limit: int = 100) -> List[Dict]:
+        """Get parcels matching any of several district patterns in one query (limit applies to the union)"""
+        if not district_patterns:
+            return []
+        return self._make_request("GET", self._districts_endpoint(district_patterns, limit))
     
     def get_high_value_parcels(self, min_score: int = 75, limit: int = 50) -> List[Dict]:
         """Get parcels with score above threshold"""
-        endpoint = f"{self.config.scores_table}?score=gte.{min_score}&order=score.desc&limit={limit}"
-        return self._make_request("GET", endpoint)
+        return self._make_request("GET", self._high_value_endpoint(min_score, limit))
+
+
+class AsyncSupabaseClient(_SupabaseBase, SharedClientBase):
+    """
+    Async Supabase REST client on the shared per-loop connection pool
+    (or an injected AsyncClient). Batch inserts are split into bodies of
+    ~MAX_BODY_BYTES that are posted concurrently.
+    """
+    
+    # Inserts are not idempotent - a retried POST could double-write
+    MAX_RETRIES = 0
+    
+    def __init__(self, config: SupabaseConfig = None, client: Optional[httpx.AsyncClient] = None):
+        _SupabaseBase.__init__(self, config)
+        SharedClientBase.__init__(self, client)
+        self._pg_pool = None
+    
+    async def close(self):
+        """Close the Postgres pool opened by bulk_copy_parcels (the HTTP client is shared)"""
+        if self._pg_pool is not None:
+            await self._pg_pool.close()
+            self._pg_pool = None
+    
+    async def _get_pg_pool(self):
+        if self._pg_pool is None:
+            self._pg_pool = await self._single_flight("pg_pool", self._create_pg_pool)
+        return self._pg_pool
+    
+    async def _create_pg_pool(self):
+        if not HAS_ASYNCPG:
+            raise RuntimeError("bulk_copy_parcels requires asyncpg (pip install asyncpg)")
+        if not self.config.db_url:
+            raise RuntimeError("bulk_copy_parcels requires SUPABASE_DB_URL (the pooler DSN)")
+        # The transaction-mode pooler cannot keep prepared statements
+        return await asyncpg.create_pool(dsn=self.config.db_url, min_size=1, max_size=10, statement_cache_size=0)
+    
+    async def bulk_copy_parcels(self, parcels: List[Dict]) -> int:
+        """
+        Upsert parcels over a direct Postgres connection instead of
+        PostgREST: COPY into a temp staging table, then one
+        INSERT ... ON CONFLICT (account) DO UPDATE. created_at is kept
+        for existing accounts. Unlike the REST upsert, which rejects a
+        batch that repeats an account, the last occurrence of a repeated
+        account is written. Returns the number of rows written.
+        """
+        rows = _parcel_copy_rows(parcels)
+        if not rows:
+            return 0
+        
+        table = self.config.parcels_table
+        columns = ", ".join(_PARCEL_COLUMNS)
+        updates = ", ".join(
+            f"{c} = EXCLUDED.{c}" for c in _PARCEL_COLUMNS if c not in ("account", "created_at")
+        )
+        pool = await self._get_pg_pool()
+        async with pool.acquire() as conn:
+            async with conn.transaction():
+                await conn.execute(
+                    f"CREATE TEMP TABLE _parcels_stage ON COMMIT DROP AS "
+                    f"SELECT {columns} FROM {table} WITH NO DATA"
+                )
+                await conn.copy_records_to_table("_parcels_stage", records=rows, columns=_PARCEL_COLUMNS)
+                # Rows are unique per account (_parcel_copy_rows), so ON CONFLICT
+                # never touches the same row twice
+                status = await conn.execute(
+                    f"INSERT INTO {table} ({columns}) "
+                    f"SELECT {columns} FROM _parcels_stage "
+                    f"ON CONFLICT (account) DO UPDATE SET {updates}"
+                )
+        return int(status.rsplit(" ", 1)[-1])
+    
+    async def _make_request(
+        self,
+        method: str,
+        endpoint: str,
+        data: Any = None,
+        return_rows: bool = True,
+        upsert: bool = False
+    ) -> Any:
+        """Make HTTP request to Supabase REST API (None when return_rows=False)"""
+        headers = self._get_headers(return_rows=return_rows, upsert=upsert)
+        data_bytes, headers = self._encode_body(data, headers)
+        
+        entry = None
+        if method == "GET":
+            entry, fresh = self._cache_lookup(endpoint)
+            if fresh:
+                return loads_content(entry[2])
+            if entry is not None and entry[1]:
+                headers = {**headers, "If-None-Match": entry[1]}
+        
+        try:
+            response = await self._request(method, self._url(endpoint), content=data_bytes, headers=headers)
+            if method == "GET":
+                return loads_content(self._cache_store(endpoint, response, entry))
+            response.raise_for_status()
+            self._get_cache.clear()
+            return loads_json(response) if return_rows else None
+        except httpx.HTTPStatusError as e:
+            logger.error(f"Supabase error {e.response.status_code}: {e.response.text}")
+            raise
+        except Exception as e:
+            logger.error(f"Request failed: {e}")
+            raise
+    
+    async def _insert_chunked(
+        self,
+        endpoint: str,
+        records: Iterable[Dict],
+        return_rows: bool,
+        upsert: bool = False
+    ) -> List[Dict]:
+        results = await asyncio.gather(*(
+            self._make_request("POST", endpoint, body, return_rows=return_rows, upsert=upsert)
+            for body in _json_array_chunks(records, self.MAX_BODY_BYTES)
+        ))
+        return [row for rows in results if rows for row in rows]
+    
+    async def insert_parcel(self, parcel: Dict[str, Any]) -> Dict:
+        """Upsert a single parcel record (keyed on account)"""
+        return await self._make_request("POST", self._parcels_upsert_endpoint(), _parcel_record(parcel), upsert=True)
+    
+    async def insert_parcels_batch(self, parcels: List[Dict], return_rows: bool = False) -> List[Dict]:
+        """Upsert multiple parcel records, ~MAX_BODY_BYTES per concurrent request"""
+        return await self._insert_chunked(
+            self._parcels_upsert_endpoint(), _parcel_records(parcels), return_rows, upsert=True
+        )
+    
+    async def insert_score(self, scored_parcel: Dict[str, Any]) -> Dict:
+        """Insert a parcel score record"""
+        return await self._make_request("POST", self.config.scores_table, _score_record(scored_parcel))
+    
+    async def insert_scores_batch(self, scored_parcels: List[Dict], return_rows: bool = False) -> List[Dict]:
+        """Insert multiple score records, ~MAX_BODY_BYTES per concurrent request"""
+        return await self._insert_chunked(self.config.scores_table, _score_records(scored_parcels), return_rows)
+    
+    async def log_search_run(self, run_data: Dict[str, Any], return_rows: bool = False) -> Optional[Dict]:
+        """Log a search run for tracking"""
+        record = _search_run_record(run_data)
+        return await self._make_request("POST", self.config.search_runs_table, record, return_rows=return_rows)
+    
+    async def get_bid_parcels(self, limit: int = 50) -> List[Dict]:
+        """Get top BID recommendation parcels"""
+        return await self._make_request("GET", self._bid_parcels_endpoint(limit))
+    
+    async def get_parcels_by_district(self, district_pattern: str, limit: int = 100) -> List[Dict]:
+        """Get parcels matching a district pattern"""
+        return await self._make_request("GET", self._district_endpoint(district_pattern, limit))
+    
+    async def get_parcels_by_districts(self, district_patterns: List[str], limit: int = 100) -> List[Dict]:
+        """Get parcels matching any of several district patterns in one query (limit applies to the union)"""
+        if not district_patterns:
+            return []
+        return await self._make_request("GET", self._districts_endpoint(district_patterns, limit))
+    
+    async def get_high_value_parcels(self, min_score: int = 75, limit: int = 50) -> List[Dict]:
+        """Get parcels with score above threshold"""
+        return await self._make_request("GET", self._high_value_endpoint(min_score, limit))
 
 
 # SQL for creating tables (run in Supabase SQL editor)
@@ -18,13 +18,16 @@ This MCP server integrates with:
 """
 
 import asyncio
+import itertools
 import json
 import os
+import time
 import httpx
 from datetime import datetime
-from typing import Optional, List, Dict, Any, Literal
+from typing import Optional, List, Dict, Any, Iterator, Literal, Tuple
 from enum import Enum
 from contextlib import asynccontextmanager
+from contextvars import ContextVar
 
 try:
     from mcp.server.fastmcp import FastMCP
@@ -34,6 +37,8 @@ except ImportError:
     
 from pydantic import BaseModel, Field, ConfigDict
 
+from src.integrations._httpclient import SHARED_POOL_LIMITS, get_shared_client, loads_json, make_client, warm_up
+
 
 # =============================================================================
 # CONFIGURATION
@@ -43,6 +48,24 @@ GITHUB_TOKEN = os.getenv("GITHUB_TOKEN", "")
 GITHUB_REPO = "breverdbidder/spd-site-plan-dev"
 SUPABASE_URL = os.getenv("SUPABASE_URL", "https://mocerqjnksmhcjzxrewo.supabase.co")
 SUPABASE_KEY = os.getenv("SUPABASE_KEY", "")
+GITHUB_RAW_URL = f"https://raw.githubusercontent.com/{GITHUB_REPO}/main"
+
+# Hosts the tools talk to - connections are opened at startup
+WARM_UP_URLS = ("https://api.github.com", GITHUB_RAW_URL)
+
+# Serve PROJECT_STATE.json from memory for this long before revalidating
+SPD_STATE_TTL = 60.0  # seconds
+
+# Pooled client opened by app_lifespan, reused by the tool implementations
+_http_client: ContextVar[Optional[httpx.AsyncClient]] = ContextVar("spd_http_client", default=None)
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """The lifespan's pooled client, or the shared per-loop pool outside the server"""
+    client = _http_client.get()
+    if client is None or client.is_closed:
+        return get_shared_client()
+    return client
 
 
 # =============================================================================
@@ -84,9 +107,16 @@ class OutputFormat(str, Enum):
 # INPUT MODELS
 # =============================================================================
 
-class DiscoverOpportunitiesInput(BaseModel):
+class ToolInput(BaseModel):
+    """
+    Base for MCP tool inputs. Pydantic v2 compiles each model's validator
+    once at class creation; inputs are frozen since tools only read them.
+    """
+    model_config = ConfigDict(str_strip_whitespace=True, extra='forbid', frozen=True)
+
+
+class DiscoverOpportunitiesInput(ToolInput):
     """Input for opportunity discovery pipeline."""
-    model_config = ConfigDict(str_strip_whitespace=True, extra='forbid')
     
     jurisdiction: JurisdictionType = Field(
         default=JurisdictionType.PALM_BAY,
@@ -114,9 +144,8 @@ class DiscoverOpportunitiesInput(BaseModel):
     )
 
 
-class PredictRezoningInput(BaseModel):
+class PredictRezoningInput(ToolInput):
     """Input for rezoning approval prediction."""
-    model_config = ConfigDict(str_strip_whitespace=True, extra='forbid')
     
     jurisdiction: JurisdictionType = Field(
         ...,
@@ -154,9 +183,8 @@ class PredictRezoningInput(BaseModel):
     )
 
 
-class ScoreFeasibilityInput(BaseModel):
+class ScoreFeasibilityInput(ToolInput):
     """Input for development feasibility scoring."""
-    model_config = ConfigDict(str_strip_whitespace=True, extra='forbid')
     
     jurisdiction: JurisdictionType = Field(..., description="Municipality")
     current_zoning: ZoningDistrict = Field(..., description="Current zoning")
@@ -170,9 +198,8 @@ class ScoreFeasibilityInput(BaseModel):
     avg_rent_per_sqft: float = Field(default=1.50, description="Average rent per sqft")
 
 
-class AnalyzeParcelInput(BaseModel):
+class AnalyzeParcelInput(ToolInput):
     """Input for single parcel analysis."""
-    model_config = ConfigDict(str_strip_whitespace=True, extra='forbid')
     
     parcel_id: Optional[str] = Field(default=None, description="Parcel ID")
     address: Optional[str] = Field(default=None, description="Property address")
@@ -180,9 +207,8 @@ class AnalyzeParcelInput(BaseModel):
     output_format: OutputFormat = Field(default=OutputFormat.MARKDOWN)
 
 
-class GetRegulatoryPathwayInput(BaseModel):
+class GetRegulatoryPathwayInput(ToolInput):
     """Input for regulatory pathway mapping."""
-    model_config = ConfigDict(str_strip_whitespace=True, extra='forbid')
     
     jurisdiction: JurisdictionType = Field(..., description="Municipality")
     current_zoning: ZoningDistrict = Field(..., description="Current zoning")
@@ -197,26 +223,180 @@ class GetRegulatoryPathwayInput(BaseModel):
 
 if FastMCP:
     @asynccontextmanager
-    async def app_lifespan():
-        """Initialize HTTP client and configuration."""
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            yield {
-                "http_client": client,
-                "github_headers": {
-                    "Authorization": f"token {GITHUB_TOKEN}",
-                    "Accept": "application/vnd.github+json"
+    async def app_lifespan(server: "FastMCP"):
+        """Initialize HTTP client and configuration (FastMCP passes the server)."""
+        # One pooled (HTTP/2 when available) client shared by every tool;
+        # opened before serving and closed at shutdown
+        async with make_client(60.0, limits=SHARED_POOL_LIMITS) as client:
+            token = _http_client.set(client)
+            # Populate the keep-alive pool so the first tool call skips TCP/TLS setup
+            await warm_up(client, *WARM_UP_URLS)
+            try:
+                yield {
+                    "http_client": client,
+                    "github_headers": {
+                        "Authorization": f"token {GITHUB_TOKEN}",
+                        "Accept": "application/vnd.github+json"
+                    }
                 }
-            }
+            finally:
+                _http_client.reset(token)
 
     mcp = FastMCP("spd_zod_mcp", lifespan=app_lifespan)
 else:
     mcp = None
 
 
+# =============================================================================
+# MARKDOWN TEMPLATES
+# =============================================================================
+
+OPPORTUNITIES_HEADER_MD = """# 🎯 Zoning Opportunity Discovery Results
+
+**Jurisdiction:** {jurisdiction}
+**Target FLU:** {target_flu}
+**Parcels Analyzed:** {parcels}
+**Opportunities Found:** {opportunities}
+**Additional Units Possible:** {additional_units}
+
+## Top Opportunities
+
+"""
+
+OPPORTUNITY_MD = """### {i}. {address}
+
+| Metric | Value |
+|--------|-------|
+| **Grade** | {grade} ({total_score:.0f}/100) |
+| **Current Zoning** | {current_zoning} |
+| **FLU Designation** | {flu_designation} |
+| **Density Gap** | {gap_du_acre} du/acre |
+| **Additional Units** | {additional_units} |
+| **Buildable** | {buildable_pct:.0f}% |
+
+"""
+
+SPD_STATUS_HEADER_MD = "# 📊 SPD Project Status\n\n"
+
+SPD_PROJECT_MD = """## {status_emoji} {name}
+
+**Address:** {address}, {city}, {state}
+**Status:** {status}
+**ML Score:** {ml_score} ({ml_grade})
+**Recommendation:** {recommendation}
+
+"""
+
+PATHWAY_STEP_MD = "| {step} | {name} | {weeks} weeks | ${cost:,} |\n"
+
+
+PATHWAY_MD = """# 📋 Regulatory Approval Pathway
+
+**Jurisdiction:** {jurisdiction}
+**Total Timeline:** ~{total_weeks} weeks ({months} months)
+**Estimated Costs:** ${total_cost:,}
+
+## Approval Steps
+
+| Step | Name | Duration | Cost |
+|------|------|----------|------|
+{steps}
+## Critical Path Items
+
+1. Rezoning approval ({jurisdiction} City Council)
+2. Traffic study completion (if required)
+3. Stormwater management plan approval
+
+## Stakeholders
+
+- {jurisdiction} Planning & Zoning Department
+- {jurisdiction} City Council
+- SJRWMD (if wetlands present)
+- Adjacent property owners
+- Utility providers
+
+## Tips for Success
+
+1. **Pre-Application Meeting**: Get buy-in early
+2. **Traffic Study**: Commission proactively if >50 units
+3. **Neighbor Outreach**: Meet with adjacent owners before public hearing
+4. **Professional Team**: Hire local land use attorney
+"""
+
+# Palm Bay standard process: (name, weeks, cost) per step
+_PRE_APPLICATION = ("Pre-Application Meeting", 2, 0)
+_REZONING_STEPS = (
+    ("Rezoning Application", 8, 1200),
+    ("Planning Board Hearing", 4, 0),
+    ("City Council Hearing", 4, 0),
+)
+_VARIANCE = ("Variance Application", 6, 800)
+_SITE_PLAN = ("Site Plan Review", 6, 2500)
+_BUILDING_PERMIT = ("Building Permit", 4, 5000)
+
+
+def _build_pathway(rezoning: bool, variance: bool, site_plan: bool):
+    """(rendered step rows, total weeks, total cost) for one combination of required approvals"""
+    steps = [_PRE_APPLICATION]
+    if rezoning:
+        steps.extend(_REZONING_STEPS)
+    if variance:
+        steps.append(_VARIANCE)
+    if site_plan:
+        steps.append(_SITE_PLAN)
+    steps.append(_BUILDING_PERMIT)
+    
+    rows = "".join(
+        PATHWAY_STEP_MD.format(step=i, name=name, weeks=weeks, cost=cost)
+        for i, (name, weeks, cost) in enumerate(steps, 1)
+    )
+    return rows, sum(step[1] for step in steps), sum(step[2] for step in steps)
+
+
+# Every (rezoning needed, variance, site plan) combination, rendered once at import
+PATHWAYS = {
+    flags: _build_pathway(*flags)
+    for flags in itertools.product((True, False), repeat=3)
+}
+
+
+def _bullets(items: List[str]) -> str:
+    return "".join(f"- {item}\n" for item in items)
+
+
 # =============================================================================
 # TOOL IMPLEMENTATIONS
 # =============================================================================
 
+def iter_opportunities_markdown(
+    results: Dict[str, Any],
+    jurisdiction: str,
+    target_flu: List[str]
+) -> Iterator[str]:
+    """Discovery report as markdown pieces: the header, then one block per top opportunity."""
+    yield OPPORTUNITIES_HEADER_MD.format(
+        jurisdiction=jurisdiction,
+        target_flu=', '.join(target_flu),
+        parcels=len(results.get('parcels', [])),
+        opportunities=results.get('opportunities_identified', 0),
+        additional_units=results.get('total_additional_units', 0)
+    )
+    for i, opp in enumerate(results.get("top_opportunities", [])[:10], 1):
+        score = opp.get("score", {})
+        gap = opp.get("density_gap", {})
+        yield OPPORTUNITY_MD.format(
+            i=i,
+            address=opp.get('address'),
+            grade=score.get('grade'),
+            total_score=score.get('total_score', 0),
+            current_zoning=opp.get('current_zoning'),
+            flu_designation=opp.get('flu_designation'),
+            gap_du_acre=gap.get('gap_du_acre', 0),
+            additional_units=gap.get('additional_units', 0),
+            buildable_pct=opp.get('buildable_pct', 100)
+        )
+
+
 async def discover_opportunities_impl(
     jurisdiction: str,
     target_flu: List[str],
@@ -229,8 +409,9 @@ async def discover_opportunities_impl(
         # Import the workflow
         from src.workflows.opportunity_discovery import run_opportunity_discovery
         
-        # Run pipeline
-        results = run_opportunity_discovery(
+        # Run pipeline (synchronous - keep it off the event loop)
+        results = await asyncio.to_thread(
+            run_opportunity_discovery,
             jurisdiction=jurisdiction,
             target_flu_categories=target_flu,
             min_acreage=min_acreage,
@@ -241,35 +422,7 @@ async def discover_opportunities_impl(
             return json.dumps(results.get("final_report", {}), indent=2)
         
         # Format as markdown
-        top_opps = results.get("top_opportunities", [])
-        
-        md = f"""# 🎯 Zoning Opportunity Discovery Results
-
-**Jurisdiction:** {jurisdiction}
-**Target FLU:** {', '.join(target_flu)}
-**Parcels Analyzed:** {len(results.get('parcels', []))}
-**Opportunities Found:** {results.get('opportunities_identified', 0)}
-**Additional Units Possible:** {results.get('total_additional_units', 0)}
-
-## Top Opportunities
-
-"""
-        for i, opp in enumerate(top_opps[:10], 1):
-            score = opp.get("score", {})
-            gap = opp.get("density_gap", {})
-            md += f"""### {i}. {opp.get('address')}
-
-| Metric | Value |
-|--------|-------|
-| **Grade** | {score.get('grade')} ({score.get('total_score', 0):.0f}/100) |
-| **Current Zoning** | {opp.get('current_zoning')} |
-| **FLU Designation** | {opp.get('flu_designation')} |
-| **Density Gap** | {gap.get('gap_du_acre', 0)} du/acre |
-| **Additional Units** | {gap.get('additional_units', 0)} |
-| **Buildable** | {opp.get('buildable_pct', 100):.0f}% |
-
-"""
-        return md
+        return "".join(iter_opportunities_markdown(results, jurisdiction, target_flu))
         
     except Exception as e:
         return f"Error running opportunity discovery: {str(e)}"
@@ -321,9 +474,7 @@ async def predict_rezoning_impl(
 
 """
         if result.risk_factors:
-            md += "## ⚠️ Risk Factors\n\n"
-            for rf in result.risk_factors:
-                md += f"- {rf}\n"
+            md += "## ⚠️ Risk Factors\n\n" + _bullets(result.risk_factors)
         
         return md
         
@@ -380,15 +531,10 @@ async def score_feasibility_impl(
 
 """
         if result.strengths:
-            md += "## ✅ Strengths\n\n"
-            for s in result.strengths:
-                md += f"- {s}\n"
-            md += "\n"
+            md += "## ✅ Strengths\n\n" + _bullets(result.strengths) + "\n"
         
         if result.weaknesses:
-            md += "## ⚠️ Weaknesses\n\n"
-            for w in result.weaknesses:
-                md += f"- {w}\n"
+            md += "## ⚠️ Weaknesses\n\n" + _bullets(result.weaknesses)
         
         return md
         
@@ -404,127 +550,78 @@ async def get_regulatory_pathway_impl(
     requires_site_plan: bool
 ) -> str:
     """Get regulatory approval pathway."""
-    
-    # Palm Bay standard process
-    steps = []
-    total_cost = 0
-    total_weeks = 0
-    
-    # Step 1: Pre-Application Meeting
-    steps.append({
-        "step": 1,
-        "name": "Pre-Application Meeting",
-        "description": "Meet with Planning & Zoning to discuss project",
-        "weeks": 2,
-        "cost": 0
-    })
-    total_weeks += 2
-    
-    # Step 2: Rezoning Application (if needed)
-    if current_zoning != target_zoning:
-        steps.append({
-            "step": 2,
-            "name": "Rezoning Application",
-            "description": f"Submit rezoning petition ({current_zoning} → {target_zoning})",
-            "weeks": 8,
-            "cost": 1200
-        })
-        total_weeks += 8
-        total_cost += 1200
-        
-        # Planning Board
-        steps.append({
-            "step": 3,
-            "name": "Planning Board Hearing",
-            "description": "Present to Planning and Zoning Board",
-            "weeks": 4,
-            "cost": 0
-        })
-        total_weeks += 4
-        
-        # City Council
-        steps.append({
-            "step": 4,
-            "name": "City Council Hearing",
-            "description": "Final approval by City Council",
-            "weeks": 4,
-            "cost": 0
-        })
-        total_weeks += 4
-    
-    # Variance (if needed)
-    if requires_variance:
-        steps.append({
-            "step": len(steps) + 1,
-            "name": "Variance Application",
-            "description": "Submit variance petition with justification",
-            "weeks": 6,
-            "cost": 800
-        })
-        total_weeks += 6
-        total_cost += 800
-    
-    # Site Plan Review
-    if requires_site_plan:
-        steps.append({
-            "step": len(steps) + 1,
-            "name": "Site Plan Review",
-            "description": "Submit detailed site development plan",
-            "weeks": 6,
-            "cost": 2500
-        })
-        total_weeks += 6
-        total_cost += 2500
-    
-    # Building Permit
-    steps.append({
-        "step": len(steps) + 1,
-        "name": "Building Permit",
-        "description": "Submit construction documents",
-        "weeks": 4,
-        "cost": 5000
-    })
-    total_weeks += 4
-    total_cost += 5000
-    
-    md = f"""# 📋 Regulatory Approval Pathway
+    step_rows, total_weeks, total_cost = PATHWAYS[
+        (current_zoning != target_zoning, bool(requires_variance), bool(requires_site_plan))
+    ]
+    return PATHWAY_MD.format(
+        jurisdiction=jurisdiction,
+        total_weeks=total_weeks,
+        months=total_weeks // 4,
+        total_cost=total_cost,
+        steps=step_rows
+    )
 
-**Jurisdiction:** {jurisdiction}
-**Total Timeline:** ~{total_weeks} weeks ({total_weeks // 4} months)
-**Estimated Costs:** ${total_cost:,}
 
-## Approval Steps
+def _render_project(project: Dict[str, Any]) -> str:
+    get = project.get
+    status = get('status')
+    return SPD_PROJECT_MD.format(
+        status_emoji="✅" if status == "COMPLETED" else "🔄",
+        name=get('name'),
+        address=get('address'),
+        city=get('city'),
+        state=get('state'),
+        status=status,
+        ml_score=get('ml_score', 'N/A'),
+        ml_grade=get('ml_grade', 'N/A'),
+        recommendation=get('recommendation', 'N/A')
+    )
 
-| Step | Name | Duration | Cost |
-|------|------|----------|------|
-"""
-    for step in steps:
-        md += f"| {step['step']} | {step['name']} | {step['weeks']} weeks | ${step['cost']:,} |\n"
-    
-    md += f"""
-## Critical Path Items
 
-1. Rezoning approval ({jurisdiction} City Council)
-2. Traffic study completion (if required)
-3. Stormwater management plan approval
+def _render_spd_status(state: Dict[str, Any]) -> str:
+    """Markdown project list for PROJECT_STATE.json."""
+    parts = [SPD_STATUS_HEADER_MD]
+    parts.extend(_render_project(project) for project in state.get("projects", []))
+    return "".join(parts)
 
-## Stakeholders
 
-- {jurisdiction} Planning & Zoning Department
-- {jurisdiction} City Council
-- SJRWMD (if wetlands present)
-- Adjacent property owners
-- Utility providers
+# url -> (fetched_at, etag, last_modified, rendered markdown)
+_SPD_STATE_CACHE: Dict[str, Tuple[float, Optional[str], Optional[str], str]] = {}
 
-## Tips for Success
 
-1. **Pre-Application Meeting**: Get buy-in early
-2. **Traffic Study**: Commission proactively if >50 units
-3. **Neighbor Outreach**: Meet with adjacent owners before public hearing
-4. **Professional Team**: Hire local land use attorney
-"""
+async def get_spd_status_impl() -> str:
+    """
+    Render PROJECT_STATE.json. The rendered report is reused for
+    SPD_STATE_TTL seconds, then revalidated with If-None-Match /
+    If-Modified-Since so an unchanged file costs a 304, not a download.
+    """
+    url = f"{GITHUB_RAW_URL}/PROJECT_STATE.json"
+    now = time.monotonic()
+    cached = _SPD_STATE_CACHE.get(url)
+    if cached is not None and now - cached[0] < SPD_STATE_TTL:
+        return cached[3]
     
-    return md
+    headers = {}
+    if cached is not None:
+        if cached[1]:
+            headers["If-None-Match"] = cached[1]
+        if cached[2]:
+            headers["If-Modified-Since"] = cached[2]
+    
+    try:
+        response = await get_http_client().get(url, headers=headers, timeout=30.0)
+        if response.status_code == 304 and cached is not None:
+            _SPD_STATE_CACHE[url] = (now,) + cached[1:]
+            return cached[3]
+        if response.status_code == 200:
+            md = _render_spd_status(loads_json(response))
+            _SPD_STATE_CACHE[url] = (
+                now, response.headers.get("ETag"), response.headers.get("Last-Modified"), md
+            )
+            return md
+        return "Error fetching project state"
+    except Exception as e:
+        return f"Error: {str(e)}"
 
 
 # =============================================================================
@@ -607,32 +704,7 @@ if mcp:
         """
         Get current status of SPD projects and pipeline.
         """
-        try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"https://raw.githubusercontent.com/{GITHUB_REPO}/main/PROJECT_STATE.json",
-                    timeout=30.0
-                )
-                if response.status_code == 200:
-                    state = response.json()
-                    projects = state.get("projects", [])
-                    
-                    md = "# 📊 SPD Project Status\n\n"
-                    
-                    for project in projects:
-                        status_emoji = "✅" if project.get("status") == "COMPLETED" else "🔄"
-                        md += f"""## {status_emoji} {project.get('name')}
-
-**Address:** {project.get('address')}, {project.get('city')}, {project.get('state')}
-**Status:** {project.get('status')}
-**ML Score:** {project.get('ml_score', 'N/A')} ({project.get('ml_grade', 'N/A')})
-**Recommendation:** {project.get('recommendation', 'N/A')}
-
-"""
-                    return md
-                return "Error fetching project state"
-        except Exception as e:
-            return f"Error: {str(e)}"
+        return await get_spd_status_impl()
 
 
 # =============================================================================
@@ -0,0 +1,154 @@
+"""
+Feasibility Scoring Kernels
+===========================
+Array form of the numeric core of DevelopmentFeasibilityScorer.score():
+market, constraint and financial component tiers, the weighted total and
+the grade. Used by score_batch() for large parcel sets; the scorer's
+scalar path remains the reference these kernels are tested against.
+"""
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+
+# Lower bounds of grades A+, A, B+, B, C, D - anything below is F
+GRADE_BOUNDS = (90, 80, 70, 60, 50, 40)
+
+
+def _batch_score_numpy(probability, vacancy, rent, buildable_pct, constraint_count, uplift_pct, location):
+    """NumPy scoring core - returns (market, constraint, financial, total, grade_idx)"""
+    market = np.select(
+        [vacancy <= 0.05, vacancy <= 0.07, vacancy <= 0.10], [95, 80, 65], 45
+    ).astype(np.int64)
+    market = np.where(
+        rent >= 1.80, np.minimum(100, market + 10),
+        np.where(rent < 1.30, np.maximum(0, market - 10), market)
+    )
+
+    constraint = np.select(
+        [buildable_pct >= 85, buildable_pct >= 70, buildable_pct >= 55, buildable_pct >= 40],
+        [95, 75, 55, 35], 15
+    ).astype(np.int64)
+    constraint = np.where(
+        constraint_count > 2, np.maximum(0, constraint - (constraint_count - 2) * 5), constraint
+    )
+
+    financial = np.select(
+        [uplift_pct >= 150, uplift_pct >= 100, uplift_pct >= 50, uplift_pct >= 25],
+        [95, 80, 65, 50], 30
+    ).astype(np.int64)
+
+    total = (
+        probability * 100 * 0.25 +
+        market * 0.20 +
+        constraint * 0.20 +
+        financial * 0.20 +
+        location * 0.15
+    )
+    grade_idx = (total[:, None] < np.array(GRADE_BOUNDS)).sum(axis=1).astype(np.int64)
+
+    return market, constraint, financial, total, grade_idx
+
+
+if HAS_NUMBA:
+    @njit(cache=True, parallel=True)
+    def _batch_score_kernel(probability, vacancy, rent, buildable_pct, constraint_count, uplift_pct, location):
+        """Compiled per-parcel loop with the same outputs as _batch_score_numpy()"""
+        n = probability.shape[0]
+        market = np.empty(n, dtype=np.int64)
+        constraint = np.empty(n, dtype=np.int64)
+        financial = np.empty(n, dtype=np.int64)
+        total = np.empty(n, dtype=np.float64)
+        grade_idx = np.empty(n, dtype=np.int64)
+
+        for i in prange(n):
+            vac = vacancy[i]
+            if vac <= 0.05:
+                m = 95
+            elif vac <= 0.07:
+                m = 80
+            elif vac <= 0.10:
+                m = 65
+            else:
+                m = 45
+            if rent[i] >= 1.80:
+                m = min(100, m + 10)
+            elif rent[i] < 1.30:
+                m = max(0, m - 10)
+
+            bpct = buildable_pct[i]
+            if bpct >= 85:
+                c = 95
+            elif bpct >= 70:
+                c = 75
+            elif bpct >= 55:
+                c = 55
+            elif bpct >= 40:
+                c = 35
+            else:
+                c = 15
+            if constraint_count[i] > 2:
+                c = max(0, c - (constraint_count[i] - 2) * 5)
+
+            up = uplift_pct[i]
+            if up >= 150:
+                f = 95
+            elif up >= 100:
+                f = 80
+            elif up >= 50:
+                f = 65
+            elif up >= 25:
+                f = 50
+            else:
+                f = 30
+
+            t = probability[i] * 100 * 0.25 + m * 0.20 + c * 0.20 + f * 0.20 + location[i] * 0.15
+            g = 0
+            for bound in (90, 80, 70, 60, 50, 40):
+                if t < bound:
+                    g += 1
+
+            market[i] = m
+            constraint[i] = c
+            financial[i] = f
+            total[i] = t
+            grade_idx[i] = g
+
+        return market, constraint, financial, total, grade_idx
+
+
+def batch_score(probability, vacancy, rent, buildable_pct, constraint_count, uplift_pct, location):
+    """
+    Score N parcels at once. Inputs are length-N arrays; grade_idx indexes
+    GRADE_BOUNDS order (0 = A+ ... 6 = F). Runs the Numba kernel when
+    numba is installed, the NumPy core otherwise.
+    """
+    args = (
+        np.ascontiguousarray(probability, dtype=np.float64),
+        np.ascontiguousarray(vacancy, dtype=np.float64),
+        np.ascontiguousarray(rent, dtype=np.float64),
+        np.ascontiguousarray(buildable_pct, dtype=np.float64),
+        np.ascontiguousarray(constraint_count, dtype=np.int64),
+        np.ascontiguousarray(uplift_pct, dtype=np.float64),
+        np.ascontiguousarray(location, dtype=np.int64),
+    )
+    kernel = _batch_score_kernel if HAS_NUMBA else _batch_score_numpy
+    return kernel(*args)
+
+
+def warm_up():
+    """
+    Compile the Numba kernel (or load it from the on-disk cache) ahead of
+    the first real batch. No-op without numba.
+    """
+    if HAS_NUMBA:
+        batch_score([0.5], [0.07], [1.5], [100.0], [0], [50.0], [50])
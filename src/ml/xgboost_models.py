@@ -16,8 +16,15 @@ from dataclasses import dataclass, asdict, field
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 from enum import Enum
+import inspect
 import math
 
+try:
+    import numpy  # noqa: F401
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
 
 # =============================================================================
 # TRAINING DATA - BREVARD COUNTY REZONING HISTORY (2020-2024)
@@ -425,6 +432,29 @@ class ValueUpliftEstimator:
 # XGBOOST DEVELOPMENT FEASIBILITY SCORER
 # =============================================================================
 
+FEASIBILITY_WEIGHTS = {
+    "rezoning_probability": 0.25,
+    "market_conditions": 0.20,
+    "site_constraints": 0.20,
+    "financial_potential": 0.20,
+    "location": 0.15,
+}
+
+# (minimum total score, grade, recommendation), best first
+FEASIBILITY_GRADES = (
+    (90, "A+", "STRONG BUY - Exceptional development opportunity"),
+    (80, "A", "BUY - Excellent opportunity with manageable risks"),
+    (70, "B+", "CONSIDER - Good opportunity, address weaknesses"),
+    (60, "B", "REVIEW - Moderate opportunity, significant due diligence needed"),
+    (50, "C", "CAUTION - Marginal opportunity, high risk"),
+    (40, "D", "AVOID - Poor risk/reward profile"),
+    (float("-inf"), "F", "SKIP - Not viable for development"),
+)
+
+# Below this many parcels score_batch() just loops score()
+BATCH_KERNEL_MIN = 32
+
+
 class DevelopmentFeasibilityScorer:
     """
     Combined XGBoost-style scorer for overall development feasibility.
@@ -464,10 +494,6 @@ class DevelopmentFeasibilityScorer:
         
         Returns score 0-100 with grade and detailed breakdown.
         """
-        strengths = []
-        weaknesses = []
-        feature_importances = {}
-        
         # 1. Rezoning Score (25% weight)
         rezoning_pred = self.rezoning_predictor.predict(
             jurisdiction=jurisdiction,
@@ -480,58 +506,39 @@ class DevelopmentFeasibilityScorer:
         )
         
         rezoning_score = rezoning_pred.approval_probability * 100
-        feature_importances["rezoning_probability"] = 0.25
-        
-        if rezoning_score >= 75:
-            strengths.append(f"High rezoning approval likelihood ({rezoning_score:.0f}%)")
-        elif rezoning_score < 50:
-            weaknesses.append(f"Low rezoning probability ({rezoning_score:.0f}%)")
         
         # 2. Market Score (20% weight)
         if market_vacancy_rate <= 0.05:
             market_score = 95
-            strengths.append(f"Excellent market conditions (vacancy {market_vacancy_rate*100:.1f}%)")
         elif market_vacancy_rate <= 0.07:
             market_score = 80
-            strengths.append("Strong rental market")
         elif market_vacancy_rate <= 0.10:
             market_score = 65
         else:
             market_score = 45
-            weaknesses.append(f"Weak market (vacancy {market_vacancy_rate*100:.1f}%)")
         
         # Rent factor
         if avg_rent_per_sqft >= 1.80:
             market_score = min(100, market_score + 10)
-            strengths.append(f"Premium rents (${avg_rent_per_sqft:.2f}/sqft)")
         elif avg_rent_per_sqft < 1.30:
             market_score = max(0, market_score - 10)
-            weaknesses.append(f"Below-market rents (${avg_rent_per_sqft:.2f}/sqft)")
-        
-        feature_importances["market_conditions"] = 0.20
         
         # 3. Constraint Score (20% weight)
         if buildable_pct >= 85:
             constraint_score = 95
-            strengths.append("Minimal site constraints")
         elif buildable_pct >= 70:
             constraint_score = 75
         elif buildable_pct >= 55:
             constraint_score = 55
-            weaknesses.append(f"Moderate constraints ({100-buildable_pct:.0f}% affected)")
         elif buildable_pct >= 40:
             constraint_score = 35
-            weaknesses.append(f"Significant constraints ({100-buildable_pct:.0f}% affected)")
         else:
             constraint_score = 15
-            weaknesses.append(f"Severe constraints ({100-buildable_pct:.0f}% affected)")
         
         # Additional constraint penalty
         if constraint_count > 2:
             constraint_score = max(0, constraint_score - (constraint_count - 2) * 5)
         
-        feature_importances["site_constraints"] = 0.20
-        
         # 4. Financial Score (20% weight)
         value_pred = self.value_estimator.predict(
             current_zoning=current_zoning,
@@ -543,32 +550,17 @@ class DevelopmentFeasibilityScorer:
         
         if value_pred.uplift_percentage >= 150:
             financial_score = 95
-            strengths.append(f"Excellent value uplift potential ({value_pred.uplift_percentage:.0f}%)")
         elif value_pred.uplift_percentage >= 100:
             financial_score = 80
-            strengths.append(f"Strong value uplift ({value_pred.uplift_percentage:.0f}%)")
         elif value_pred.uplift_percentage >= 50:
             financial_score = 65
         elif value_pred.uplift_percentage >= 25:
             financial_score = 50
         else:
             financial_score = 30
-            weaknesses.append(f"Limited value uplift ({value_pred.uplift_percentage:.0f}%)")
-        
-        feature_importances["financial_potential"] = 0.20
         
         # 5. Location Score (15% weight)
-        if zip_code in ["32937", "32940", "32953", "32903"]:
-            location_score = 95
-            strengths.append(f"Premium location ({PREMIUM_ZIPS.get(zip_code, {}).get('name', 'Unknown')})")
-        elif zip_code in ["32901", "32904"]:
-            location_score = 75
-        elif zip_code in PREMIUM_ZIPS:
-            location_score = 60
-        else:
-            location_score = 50
-        
-        feature_importances["location"] = 0.15
+        location_score = self._location_score(zip_code)
         
         # Calculate weighted total
         total_score = (
@@ -579,28 +571,13 @@ class DevelopmentFeasibilityScorer:
             location_score * 0.15
         )
         
-        # Determine grade
-        if total_score >= 90:
-            grade = "A+"
-            recommendation = "STRONG BUY - Exceptional development opportunity"
-        elif total_score >= 80:
-            grade = "A"
-            recommendation = "BUY - Excellent opportunity with manageable risks"
-        elif total_score >= 70:
-            grade = "B+"
-            recommendation = "CONSIDER - Good opportunity, address weaknesses"
-        elif total_score >= 60:
-            grade = "B"
-            recommendation = "REVIEW - Moderate opportunity, significant due diligence needed"
-        elif total_score >= 50:
-            grade = "C"
-            recommendation = "CAUTION - Marginal opportunity, high risk"
-        elif total_score >= 40:
-            grade = "D"
-            recommendation = "AVOID - Poor risk/reward profile"
-        else:
-            grade = "F"
-            recommendation = "SKIP - Not viable for development"
+        grade, recommendation = next(
+            (grade, rec) for bound, grade, rec in FEASIBILITY_GRADES if total_score >= bound
+        )
+        strengths, weaknesses = self._notes(
+            rezoning_score, market_vacancy_rate, avg_rent_per_sqft,
+            buildable_pct, value_pred.uplift_percentage, zip_code
+        )
         
         return FeasibilityScore(
             total_score=total_score,
@@ -610,12 +587,152 @@ class DevelopmentFeasibilityScorer:
             constraint_score=constraint_score,
             financial_score=financial_score,
             location_score=location_score,
-            feature_importances=feature_importances,
+            feature_importances=dict(FEASIBILITY_WEIGHTS),
             strengths=strengths,
             weaknesses=weaknesses,
             recommendation=recommendation,
             prediction_timestamp=datetime.utcnow().isoformat()
         )
+    
+    def score_batch(self, parcels: List[Dict]) -> List[FeasibilityScore]:
+        """
+        Score many parcels; each dict holds score() keyword arguments.
+        
+        Above BATCH_KERNEL_MIN parcels (and with numpy installed) the
+        component tiers, weighted total and grade run as one array pass
+        in src/ml/_scoring_kernels.py - Numba-compiled when numba is
+        installed. Results match score() row for row.
+        """
+        if len(parcels) <= BATCH_KERNEL_MIN or not HAS_NUMPY:
+            return [self.score(**parcel) for parcel in parcels]
+        
+        from src.ml._scoring_kernels import batch_score
+        
+        # Resolve score()'s parameters once; bind() only to raise its TypeError
+        signature = inspect.signature(self.score)
+        defaults = {
+            name: param.default for name, param in signature.parameters.items()
+            if param.default is not param.empty
+        }
+        names = signature.parameters.keys()
+        required = names - defaults.keys()
+        rows = []
+        for parcel in parcels:
+            if not (required <= parcel.keys() <= names):
+                signature.bind(**parcel)
+            p = {**defaults, **parcel}
+            rezoning_pred = self.rezoning_predictor.predict(
+                jurisdiction=p["jurisdiction"],
+                current_zoning=p["current_zoning"],
+                target_zoning=p["target_zoning"],
+                flu_designation=p["flu_designation"],
+                acreage=p["acreage"],
+                buildable_pct=p["buildable_pct"],
+                neighbor_opposition_risk=p["neighbor_opposition_risk"]
+            )
+            value_pred = self.value_estimator.predict(
+                current_zoning=p["current_zoning"],
+                target_zoning=p["target_zoning"],
+                acreage=p["acreage"],
+                zip_code=p["zip_code"],
+                buildable_pct=p["buildable_pct"]
+            )
+            rows.append((
+                rezoning_pred.approval_probability,
+                p["market_vacancy_rate"],
+                p["avg_rent_per_sqft"],
+                p["buildable_pct"],
+                p["constraint_count"],
+                value_pred.uplift_percentage,
+                self._location_score(p["zip_code"]),
+                p["zip_code"]
+            ))
+        
+        cols = list(zip(*rows))
+        market, constraint, financial, total, grade_idx = batch_score(*cols[:7])
+        timestamp = datetime.utcnow().isoformat()
+        
+        results = []
+        for i, (prob, vacancy, rent, bpct, _, uplift, location, zip_code) in enumerate(rows):
+            _, grade, recommendation = FEASIBILITY_GRADES[grade_idx[i]]
+            rezoning_score = prob * 100
+            strengths, weaknesses = self._notes(rezoning_score, vacancy, rent, bpct, uplift, zip_code)
+            results.append(FeasibilityScore(
+                total_score=float(total[i]),
+                grade=grade,
+                rezoning_score=rezoning_score,
+                market_score=int(market[i]),
+                constraint_score=int(constraint[i]),
+                financial_score=int(financial[i]),
+                location_score=location,
+                feature_importances=dict(FEASIBILITY_WEIGHTS),
+                strengths=strengths,
+                weaknesses=weaknesses,
+                recommendation=recommendation,
+                prediction_timestamp=timestamp
+            ))
+        return results
+    
+    @staticmethod
+    def _location_score(zip_code: str) -> int:
+        if zip_code in ["32937", "32940", "32953", "32903"]:
+            return 95
+        elif zip_code in ["32901", "32904"]:
+            return 75
+        elif zip_code in PREMIUM_ZIPS:
+            return 60
+        return 50
+    
+    @staticmethod
+    def _notes(
+        rezoning_score: float,
+        market_vacancy_rate: float,
+        avg_rent_per_sqft: float,
+        buildable_pct: float,
+        uplift_percentage: float,
+        zip_code: str
+    ) -> Tuple[List[str], List[str]]:
+        """Strengths and weaknesses behind each component score"""
+        strengths = []
+        weaknesses = []
+        
+        if rezoning_score >= 75:
+            strengths.append(f"High rezoning approval likelihood ({rezoning_score:.0f}%)")
+        elif rezoning_score < 50:
+            weaknesses.append(f"Low rezoning probability ({rezoning_score:.0f}%)")
+        
+        if market_vacancy_rate <= 0.05:
+            strengths.append(f"Excellent market conditions (vacancy {market_vacancy_rate*100:.1f}%)")
+        elif market_vacancy_rate <= 0.07:
+            strengths.append("Strong rental market")
+        elif market_vacancy_rate > 0.10:
+            weaknesses.append(f"Weak market (vacancy {market_vacancy_rate*100:.1f}%)")
+        
+        if avg_rent_per_sqft >= 1.80:
+            strengths.append(f"Premium rents (${avg_rent_per_sqft:.2f}/sqft)")
+        elif avg_rent_per_sqft < 1.30:
+            weaknesses.append(f"Below-market rents (${avg_rent_per_sqft:.2f}/sqft)")
+        
+        if buildable_pct >= 85:
+            strengths.append("Minimal site constraints")
+        elif buildable_pct < 40:
+            weaknesses.append(f"Severe constraints ({100-buildable_pct:.0f}% affected)")
+        elif buildable_pct < 55:
+            weaknesses.append(f"Significant constraints ({100-buildable_pct:.0f}% affected)")
+        elif buildable_pct < 70:
+            weaknesses.append(f"Moderate constraints ({100-buildable_pct:.0f}% affected)")
+        
+        if uplift_percentage >= 150:
+            strengths.append(f"Excellent value uplift potential ({uplift_percentage:.0f}%)")
+        elif uplift_percentage >= 100:
+            strengths.append(f"Strong value uplift ({uplift_percentage:.0f}%)")
+        elif uplift_percentage < 25:
+            weaknesses.append(f"Limited value uplift ({uplift_percentage:.0f}%)")
+        
+        if zip_code in ["32937", "32940", "32953", "32903"]:
+            strengths.append(f"Premium location ({PREMIUM_ZIPS.get(zip_code, {}).get('name', 'Unknown')})")
+        
+        return strengths, weaknesses
 
 
 # =============================================================================
@@ -678,6 +795,11 @@ def score_development_feasibility(
     )
 
 
+def score_development_feasibility_batch(parcels: List[Dict]) -> List[FeasibilityScore]:
+    """Convenience function for scoring many parcels in one pass."""
+    return DevelopmentFeasibilityScorer().score_batch(parcels)
+
+
 # =============================================================================
 # MAIN - DEMO
 # =============================================================================
@@ -139,8 +139,10 @@ class ZODXGBoostModel:
     - BidDeed.AI ML ecosystem
     """
     
+    MODEL_VERSION = "1.0.0"
+    
     def __init__(self, model_dir: str = "models/zod"):
-        self.model_version = "1.0.0"
+        self.model_version = self.MODEL_VERSION
         self.model_dir = Path(model_dir)
         self.classifier = None
         self.regressor = None
@@ -7,7 +7,8 @@ Core Concept: Properties where current zoning < FLU maximum = rezoning opportuni
 Example: Bliss Palm Bay - PUD zoning in HDR area → RM-20 rezoning opportunity
 """
 
-from typing import TypedDict, List, Dict, Optional, Any, Literal
+import operator
+from typing import TypedDict, Annotated, List, Dict, Optional, Any, Literal
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
 from enum import Enum
@@ -277,7 +278,7 @@ class OpportunityState(TypedDict, total=False):
     # =========================================================================
     # STAGE 6: OPPORTUNITY SCORING
     # =========================================================================
-    scores: Dict[str, OpportunityScore]  # parcel_id -> score
+    scores: Annotated[Dict[str, OpportunityScore], operator.or_]  # parcel_id -> score (merged across branches)
     ranked_parcels: List[str]           # Parcel IDs sorted by score
     top_opportunities: List[Dict[str, Any]]  # Top N with full details
     scoring_timestamp: str
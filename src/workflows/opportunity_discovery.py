@@ -19,12 +19,28 @@ Reference Case: Bliss Palm Bay
 - Opportunity: Rezone to RM-20 → 21 units at 19.7 du/acre
 """
 
-from typing import Dict, Any, Literal, List
+from typing import Dict, Any, Literal, List, Union
 from langgraph.graph import StateGraph, END
 from datetime import datetime
 import json
 import os
 
+try:
+    from langgraph.types import Send
+except ImportError:  # langgraph < 0.2
+    from langgraph.constants import Send
+
+# Node-level result caching (langgraph >= 0.6)
+try:
+    from langgraph.cache.memory import InMemoryCache
+    from langgraph.types import CachePolicy
+    HAS_NODE_CACHE = True
+except ImportError:
+    HAS_NODE_CACHE = False
+
+# Lifetime of a cached score_parcel result in fan-out graphs
+SCORE_CACHE_TTL = 3600  # seconds
+
 # Import state schema
 from src.state.opportunity_state import (
     OpportunityState,
@@ -451,35 +467,20 @@ def constraint_mapping_agent(state: OpportunityState) -> OpportunityState:
 # AGENT 5: OPPORTUNITY SCORING
 # =============================================================================
 
-def opportunity_scoring_agent(state: OpportunityState) -> OpportunityState:
+def score_parcel_inputs(state: OpportunityState) -> List[Dict[str, Any]]:
     """
-    Stage 5: Calculate and rank opportunities.
-    
-    Scoring Components (100 points):
-    - Density Gap Score (25%): Higher gap = better
-    - Lot Size Score (15%): Larger lots more efficient
-    - Constraint Score (20%): Fewer constraints = better
-    - Market Score (15%): Local demand factors
-    - Rezoning Probability (25%): Based on approval history
-    
-    Inputs: density_gaps, buildable_pct, constraints, parcels
-    Outputs: scores, ranked_parcels, top_opportunities
+    Stage 5a: one scoring input per parcel with a positive density gap.
+    These are the payloads fanned out to score_parcel_node.
     """
     density_gaps = state.get("density_gaps", {})
     buildable_pct = state.get("buildable_pct", {})
     constraints = state.get("constraints", {})
-    parcels = state.get("parcels", [])
-    parcels_raw = state.get("parcels_raw", [])
-    
-    # Build lookup
-    parcel_lookup = {p.parcel_id: p for p in parcels}
-    raw_lookup = {p.get("parcel_id"): p for p in parcels_raw}
-    
-    scores = {}
+    parcel_lookup = {p.parcel_id: p for p in state.get("parcels", [])}
     
     # Assume 70% approval rate (would come from market validation)
     approval_rate = 70.0
     
+    inputs = []
     for parcel_id, gap in density_gaps.items():
         if gap.gap_du_acre <= 0:
             continue  # Skip parcels with no opportunity
@@ -488,19 +489,51 @@ def opportunity_scoring_agent(state: OpportunityState) -> OpportunityState:
         if not parcel:
             continue
         
-        acreage = parcel.acreage
-        buildable = buildable_pct.get(parcel_id, 100)
-        constraint_count = len(constraints.get(parcel_id, []))
-        
-        score = calculate_opportunity_score(
-            density_gap=gap,
-            acreage=acreage,
-            buildable_pct=buildable,
-            approval_rate=approval_rate,
-            constraint_count=constraint_count
-        )
-        
-        scores[parcel_id] = score
+        inputs.append({
+            "parcel_id": parcel_id,
+            "density_gap": gap,
+            "acreage": parcel.acreage,
+            "buildable_pct": buildable_pct.get(parcel_id, 100),
+            "approval_rate": approval_rate,
+            "constraint_count": len(constraints.get(parcel_id, []))
+        })
+    
+    return inputs
+
+
+def score_parcel_node(task: Dict[str, Any]) -> Dict[str, Any]:
+    """Stage 5b: score a single parcel (one parallel branch per parcel)."""
+    score = calculate_opportunity_score(
+        density_gap=task["density_gap"],
+        acreage=task["acreage"],
+        buildable_pct=task["buildable_pct"],
+        approval_rate=task["approval_rate"],
+        constraint_count=task["constraint_count"]
+    )
+    # Merged into state["scores"] by its dict-union reducer
+    return {"scores": {task["parcel_id"]: score}}
+
+
+def rank_opportunities_agent(state: OpportunityState) -> OpportunityState:
+    """
+    Stage 5c: rank the scored parcels and build the top opportunities.
+    
+    Inputs: scores, density_gaps, buildable_pct, constraints, parcels
+    Outputs: scores, ranked_parcels, top_opportunities
+    """
+    density_gaps = state.get("density_gaps", {})
+    buildable_pct = state.get("buildable_pct", {})
+    constraints = state.get("constraints", {})
+    parcels = state.get("parcels", [])
+    parcels_raw = state.get("parcels_raw", [])
+    
+    # Build lookup
+    parcel_lookup = {p.parcel_id: p for p in parcels}
+    raw_lookup = {p.get("parcel_id"): p for p in parcels_raw}
+    
+    # Branches finish in any order - restore density-gap order so ties rank stably
+    merged = state.get("scores", {})
+    scores = {parcel_id: merged[parcel_id] for parcel_id in density_gaps if parcel_id in merged}
     
     # Rank by score
     ranked = sorted(scores.keys(), key=lambda x: scores[x].total_score, reverse=True)
@@ -540,6 +573,31 @@ def opportunity_scoring_agent(state: OpportunityState) -> OpportunityState:
     return state
 
 
+def opportunity_scoring_agent(state: OpportunityState) -> OpportunityState:
+    """
+    Stage 5: Calculate and rank opportunities.
+    
+    Scoring Components (100 points):
+    - Density Gap Score (25%): Higher gap = better
+    - Lot Size Score (15%): Larger lots more efficient
+    - Constraint Score (20%): Fewer constraints = better
+    - Market Score (15%): Local demand factors
+    - Rezoning Probability (25%): Based on approval history
+    
+    Sequential form of stages 5a-5c, and the graph's scoring node unless
+    it is built with fan_out=True (see fan_out_scoring).
+    
+    Inputs: density_gaps, buildable_pct, constraints, parcels
+    Outputs: scores, ranked_parcels, top_opportunities
+    """
+    scores = {}
+    for task in score_parcel_inputs(state):
+        scores.update(score_parcel_node(task)["scores"])
+    
+    state["scores"] = scores
+    return rank_opportunities_agent(state)
+
+
 # =============================================================================
 # AGENT 6: MARKET VALIDATION
 # =============================================================================
@@ -836,6 +894,14 @@ def final_report_node(state: OpportunityState) -> OpportunityState:
 # CONDITIONAL ROUTING
 # =============================================================================
 
+def fan_out_scoring(state: OpportunityState) -> Union[List[Send], Literal["opportunity_scoring"]]:
+    """Score every candidate parcel in its own parallel branch"""
+    tasks = score_parcel_inputs(state)
+    if not tasks:
+        return "opportunity_scoring"
+    return [Send("score_parcel", task) for task in tasks]
+
+
 def should_run_market_validation(state: OpportunityState) -> Literal["market_validation", "skip_to_report"]:
     """Only run market validation if we have opportunities"""
     opportunities = state.get("opportunities_identified", 0)
@@ -863,8 +929,15 @@ def needs_human_review(state: OpportunityState) -> Literal["human_review", "cont
 # BUILD GRAPH
 # =============================================================================
 
-def build_opportunity_graph() -> StateGraph:
-    """Build the Zoning-FLU Opportunity Discovery workflow"""
+def build_opportunity_graph(fan_out: bool = False) -> StateGraph:
+    """
+    Build the Zoning-FLU Opportunity Discovery workflow.
+    
+    With fan_out=True each candidate parcel is scored in its own
+    score_parcel branch (cached per payload when the graph is compiled
+    with cache=InMemoryCache()); by default opportunity_scoring_agent
+    scores them all in one node.
+    """
     
     graph = StateGraph(OpportunityState)
     
@@ -873,7 +946,15 @@ def build_opportunity_graph() -> StateGraph:
     graph.add_node("zoning_analysis", zoning_analysis_agent)
     graph.add_node("flu_analysis", flu_analysis_agent)
     graph.add_node("constraint_mapping", constraint_mapping_agent)
-    graph.add_node("opportunity_scoring", opportunity_scoring_agent)
+    if not fan_out:
+        graph.add_node("opportunity_scoring", opportunity_scoring_agent)
+    elif HAS_NODE_CACHE:
+        # Re-runs over the same parcels reuse each branch's score
+        graph.add_node("score_parcel", score_parcel_node, cache_policy=CachePolicy(ttl=SCORE_CACHE_TTL))
+        graph.add_node("opportunity_scoring", rank_opportunities_agent)
+    else:
+        graph.add_node("score_parcel", score_parcel_node)
+        graph.add_node("opportunity_scoring", rank_opportunities_agent)
     graph.add_node("market_validation", market_validation_agent)
     graph.add_node("regulatory_pathway", regulatory_pathway_agent)
     graph.add_node("final_report", final_report_node)
@@ -882,7 +963,17 @@ def build_opportunity_graph() -> StateGraph:
     graph.add_edge("data_acquisition", "zoning_analysis")
     graph.add_edge("zoning_analysis", "flu_analysis")
     graph.add_edge("flu_analysis", "constraint_mapping")
-    graph.add_edge("constraint_mapping", "opportunity_scoring")
+    
+    if fan_out:
+        # One score_parcel branch per parcel, joined at opportunity_scoring
+        graph.add_conditional_edges(
+            "constraint_mapping",
+            fan_out_scoring,
+            ["score_parcel", "opportunity_scoring"]
+        )
+        graph.add_edge("score_parcel", "opportunity_scoring")
+    else:
+        graph.add_edge("constraint_mapping", "opportunity_scoring")
     
     # Conditional: Only run market validation if opportunities exist
     graph.add_conditional_edges(
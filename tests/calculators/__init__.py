@@ -0,0 +1 @@
+# Calculators tests package
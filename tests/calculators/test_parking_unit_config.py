@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for Parking & Unit Configuration Calculator
+
+Coverage targets:
+- ParkingUnitCalculator scenario math
+- calculate_scenarios_vectorized() parity with the scalar path
+- parking_unit_analysis_node()
+
+Author: BidDeed.AI / Everest Capital USA
+"""
+
+import pytest
+from dataclasses import replace
+
+from src.calculators.parking_unit_config import (
+    ParkingUnitCalculator,
+    SiteConstraints,
+    ZoningDistrict,
+    parking_unit_analysis_node
+)
+
+
+# =============================================================================
+# TEST FIXTURES
+# =============================================================================
+
+@pytest.fixture
+def bliss_site():
+    """Bliss Palm Bay site constraints"""
+    return SiteConstraints(
+        lot_sf=46394,
+        lot_width=167.5,
+        lot_depth=277.0,
+        wellhead_sf=22000
+    )
+
+
+@pytest.fixture
+def calculator(bliss_site):
+    """Calculator for the Bliss Palm Bay site"""
+    return ParkingUnitCalculator(
+        site=bliss_site,
+        zoning=ZoningDistrict.RM_20,
+        parking_available=42
+    )
+
+
+# =============================================================================
+# SCALAR SCENARIOS
+# =============================================================================
+
+class TestScenarios:
+    """Tests for the per-scenario calculation path"""
+
+    def test_max_dwelling_units(self, calculator):
+        assert calculator.max_dwelling_units == 21
+
+    def test_all_scenarios(self, calculator):
+        a, b = calculator.calculate_all_scenarios()
+        assert a.total_tenants == 84
+        assert b.total_tenants == 63
+        assert a.parking.tenants_with_parking == 42
+        assert a.risk_level == "HIGH"
+        assert b.risk_level == "MEDIUM"
+
+    @pytest.mark.parametrize("pct_no_parking,expected", [
+        (0, "LOW"), (25, "LOW"), (25.1, "MEDIUM"), (40, "MEDIUM"), (40.1, "HIGH"), (100, "HIGH")
+    ])
+    def test_assess_risk_bounds(self, calculator, pct_no_parking, expected):
+        parking = replace(calculator.calculate_parking_allocation(21, 4), pct_without_parking=pct_no_parking)
+        assert calculator.assess_risk(parking) == expected
+
+    def test_to_json_serializes_dataclass_fields(self, calculator):
+        import json
+        scenarios = calculator.calculate_all_scenarios()
+        decoded = json.loads(calculator.to_json(scenarios))
+        assert decoded[0]["name"] == scenarios[0].name
+        assert decoded[0]["parking"]["tenants_with_parking"] == 42
+        assert decoded[1]["financials"]["noi"] == scenarios[1].financials.noi
+
+    def test_default_financials_match_explicit_rates(self, calculator):
+        scenario = calculator.calculate_scenario("A", 4, 320, 850, 650)
+        explicit = calculator.calculate_financials(
+            scenario.parking, scenario.rent_structure, scenario.building,
+            vacancy_rate=0.08, opex_rate=0.42, cap_rate=0.06
+        )
+        assert scenario.financials.noi == explicit.noi
+        assert scenario.financials.value == explicit.value
+        assert scenario.financials.egi == pytest.approx(explicit.egi)
+
+    def test_scenario_is_memoized(self, calculator):
+        first = calculator.calculate_scenario("A", 4, 320, 850, 650)
+        assert calculator.calculate_scenario("A", 4, 320, 850, 650) is first
+        assert calculator.calculate_scenario("A", 4, 320, 900, 650) is not first
+
+        calculator.parking_available = 84
+        assert calculator.calculate_scenario("A", 4, 320, 850, 650).parking.meets_code
+
+    @pytest.mark.parametrize("dwelling_units", [1, 5, 10, 21, 40, 80, 200])
+    def test_building_stories_is_minimum_fit(self, calculator, dwelling_units):
+        building = calculator.calculate_building_spec(dwelling_units, 1500)
+        envelope = calculator.site.building_envelope_sf
+        fitting = [s for s in range(2, 6) if building.gross_sf / s <= envelope]
+        expected = fitting[0] if fitting else 5
+        assert building.stories == expected
+        assert building.fits_envelope == bool(fitting)
+        assert building.units_per_floor * building.stories >= dwelling_units
+
+
+# =============================================================================
+# VECTORIZED SWEEP
+# =============================================================================
+
+class TestVectorizedScenarios:
+    """calculate_scenarios_vectorized() must match calculate_scenario()"""
+
+    PARAMS = [
+        (4, 320, 850, 650),
+        (3, 400, 900, 700),
+        (2, 550, 1100, 900),
+        (5, 250, 700, 550),
+    ]
+
+    def test_matches_scalar_path(self, calculator):
+        np = pytest.importorskip("numpy")
+        cols = list(zip(*self.PARAMS))
+        result = calculator.calculate_scenarios_vectorized(*(np.array(c) for c in cols))
+
+        for i, (micro, sf, rent_wp, rent_np) in enumerate(self.PARAMS):
+            scenario = calculator.calculate_scenario("s", micro, sf, rent_wp, rent_np)
+            assert result["total_tenants"][i] == scenario.total_tenants
+            assert result["tenants_with_parking"][i] == scenario.parking.tenants_with_parking
+            assert result["dwelling_unit_sf"][i] == scenario.dwelling_unit_sf
+            assert result["stories"][i] == scenario.building.stories
+            assert result["gross_sf"][i] == scenario.building.gross_sf
+            assert result["fits_envelope"][i] == scenario.building.fits_envelope
+            assert result["monthly_gross"][i] == scenario.financials.monthly_gross
+            assert result["noi"][i] == scenario.financials.noi
+            assert result["value"][i] == scenario.financials.value
+            assert result["construction_cost"][i] == scenario.financials.construction_cost
+
+    def test_batch_dicts_match_scalar_dicts(self, calculator):
+        pytest.importorskip("numpy")
+        batch = calculator.calculate_all_scenarios_batch()
+        scalar = [calculator.to_dict(s) for s in calculator.calculate_all_scenarios()]
+        assert len(batch) == 2
+        assert calculator.to_dicts_batch(batch) == scalar
+
+    def test_per_sample_rates(self, calculator):
+        np = pytest.importorskip("numpy")
+        vacancy = np.array([0.05, 0.10])
+        cap = np.array([0.055, 0.07])
+        result = calculator.calculate_scenarios_vectorized(
+            np.array([4, 3]), np.array([320, 400]), np.array([850, 900]), np.array([650, 700]),
+            vacancy_rate=vacancy, cap_rate=cap
+        )
+
+        for i, (micro, sf, rent_wp, rent_np) in enumerate(self.PARAMS[:2]):
+            scenario = calculator.calculate_scenario("s", micro, sf, rent_wp, rent_np)
+            financials = calculator.calculate_financials(
+                scenario.parking, scenario.rent_structure, scenario.building,
+                vacancy_rate=vacancy[i], cap_rate=cap[i]
+            )
+            assert result["noi"][i] == financials.noi
+            assert result["value"][i] == financials.value
+
+    def test_numba_kernel_matches_numpy(self, calculator):
+        np = pytest.importorskip("numpy")
+        from src.calculators import parking_unit_config as module
+        if not module.HAS_NUMBA:
+            pytest.skip("numba not installed")
+
+        n = len(self.PARAMS)
+        cols = [np.ascontiguousarray(c) for c in zip(*self.PARAMS)]
+        args = (
+            calculator.max_dwelling_units, cols[0].astype(np.int64), cols[1].astype(np.float64),
+            cols[2].astype(np.int64), cols[3].astype(np.int64), 2, calculator._envelope,
+            np.full(n, 0.08), np.full(n, 0.42), np.full(n, 0.06), 0.15
+        )
+        for compiled, reference in zip(module._scenarios_kernel(*args), module._scenarios_numpy(*args)):
+            np.testing.assert_allclose(compiled, reference)
+
+
+# =============================================================================
+# LANGGRAPH NODE
+# =============================================================================
+
+class TestParkingUnitAnalysisNode:
+    """Tests for parking_unit_analysis_node()"""
+
+    def test_default_state(self):
+        result = parking_unit_analysis_node({})
+        assert result["unit_config_complete"] is True
+        assert len(result["parking_analysis"]["scenarios"]) == 2
+        assert result["recommended_scenario"] in ("Scenario A", "Scenario B")
+
+    def test_unknown_zoning_district_raises(self):
+        with pytest.raises(KeyError):
+            parking_unit_analysis_node({"zoning_district": "RM_99"})
+
+    def test_zoning_district_is_used(self):
+        result = parking_unit_analysis_node({"zoning_district": "RM_15"})
+        assert result["parking_analysis"]["scenarios"][0]["dwelling_units"] == 15
@@ -0,0 +1,683 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for SPD/ZOD API Integrations
+
+Coverage targets:
+- CensusData / PropertyValuation serialization
+- CensusAPIClient geocode / ACS caching (bounded, expiring) and single-flight
+- SingleFlight isolation from a cancelled leader
+- County-wide ACS batching (get_county_tracts / enrich_batch)
+- Shared connection pool
+- api_mega_library re-exports
+- SPDAPIClient.get_market_data_batch parity with get_market_data
+- SPDAPIClient.enrich_parcel overlap of demographics with geocode -> flood
+- enrich_opportunity_with_apis freshness short-circuit and default fetcher reuse
+- Rate limiting and 429/5xx retries (none for non-idempotent POSTs)
+- ApifyRealEstateClient.run_actor start-once / poll paths
+
+HTTP is served by httpx.MockTransport; no network access is required.
+
+Author: BidDeed.AI / Everest Capital USA
+"""
+
+import asyncio
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from src.integrations.api_integrations import (
+    ApifyRealEstateClient,
+    CensusAPIClient,
+    CensusData,
+    EnhancedDataFetcher,
+    HostRateLimiter,
+    PropertyValuation,
+    _normalize_addr,
+    close_shared_client,
+    enrich_opportunity_with_apis
+)
+
+
+# =============================================================================
+# TEST FIXTURES
+# =============================================================================
+
+GEOCODE_RESPONSE = {
+    "result": {
+        "addressMatches": [{
+            "matchedAddress": "2165 SANDY PINES DR NE, PALM BAY, FL, 32905",
+            "coordinates": {"x": -80.61, "y": 28.03},
+            "geographies": {
+                "Census Tracts": [{
+                    "STATE": "12",
+                    "COUNTY": "009",
+                    "TRACT": "064100",
+                    "GEOID": "12009064100",
+                    "NAME": "Census Tract 641"
+                }]
+            }
+        }]
+    }
+}
+
+ACS_HEADER = [
+    "NAME", "B01003_001E", "B19013_001E", "B25077_001E", "B25001_001E", "B25002_003E",
+    "B25003_002E", "B25003_003E", "B01002_001E", "B11001_001E", "B17001_002E",
+    "state", "county", "tract"
+]
+
+ACS_ROW = [
+    "Census Tract 641", "4000", "55000", "250000", "1600", "100",
+    "1000", "500", "41.5", "1500", "400", "12", "009", "064100"
+]
+
+ACS_ROW_2 = [
+    "Census Tract 642", "3000", "-", "null", "0", "0",
+    "0", "0", "38.0", "900", "0", "12", "009", "064200"
+]
+
+
+class Recorder:
+    """MockTransport handler that records requests"""
+
+    def __init__(self):
+        self.requests = []
+
+    def __call__(self, request):
+        self.requests.append(request)
+        if "geocoder" in request.url.path:
+            return httpx.Response(200, json=GEOCODE_RESPONSE)
+        if request.url.params.get("for") == "tract:*":
+            return httpx.Response(200, json=[ACS_HEADER, ACS_ROW, ACS_ROW_2])
+        return httpx.Response(200, json=[ACS_HEADER, ACS_ROW])
+
+
+@pytest.fixture
+def recorder():
+    return Recorder()
+
+
+@pytest.fixture
+def census(recorder):
+    transport = httpx.MockTransport(recorder)
+    return CensusAPIClient(api_key="test", cache_dir="", client=httpx.AsyncClient(transport=transport))
+
+
+# =============================================================================
+# DATA CLASSES
+# =============================================================================
+
+class TestDataClasses:
+    """to_dict() is a flat field copy"""
+
+    def test_to_dict_matches_asdict(self):
+        from dataclasses import asdict
+        census = CensusData("12009064100", "Tract 641", 4000, 55000.0, 250000.0, 6.2, 66.7, 33.3, 41.5, 1500, 10.0)
+        valuation = PropertyValuation("1 Main St", zillow_estimate=250000.0, sources=["zillow"])
+        assert census.to_dict() == asdict(census)
+        assert valuation.to_dict() == asdict(valuation)
+        assert not hasattr(census, "__dict__")
+
+    def test_cached_records_are_immutable(self):
+        from dataclasses import FrozenInstanceError
+        census = CensusData("12009064100", "Tract 641", 4000, 55000.0, 250000.0, 6.2, 66.7, 33.3, 41.5, 1500, 10.0)
+        with pytest.raises(FrozenInstanceError):
+            census.median_income = 0.0
+
+
+# =============================================================================
+# CENSUS CACHING
+# =============================================================================
+
+class TestCensusCache:
+    """Repeated lookups must not hit the network"""
+
+    def test_normalize_addr(self):
+        assert _normalize_addr("  2165 Sandy Pines Dr. NE,  Palm Bay ") == "2165 sandy pines dr ne palm bay"
+
+    def test_geocode_cached_by_normalized_address(self, census, recorder):
+        async def run():
+            first = await census.geocode_address("2165 Sandy Pines Dr NE, Palm Bay, FL")
+            second = await census.geocode_address("2165 sandy pines dr ne  palm bay fl")
+            await census.close()
+            return first, second
+
+        first, second = asyncio.run(run())
+        assert first == second
+        assert first["geoid"] == "12009064100"
+        assert (first["latitude"], first["longitude"]) == (28.03, -80.61)
+        assert len(recorder.requests) == 1
+
+    def test_concurrent_geocodes_share_one_request(self, recorder):
+        async def slow_handler(request):
+            await asyncio.sleep(0.01)
+            return recorder(request)
+
+        async def run():
+            transport = httpx.MockTransport(slow_handler)
+            census = CensusAPIClient(cache_dir="", client=httpx.AsyncClient(transport=transport))
+            return await asyncio.gather(*[census.geocode_address("1 Main St, Palm Bay") for _ in range(5)])
+
+        results = asyncio.run(run())
+        assert all(r["geoid"] == "12009064100" for r in results)
+        assert len(recorder.requests) == 1
+
+    def test_tract_demographics_cached(self, census, recorder):
+        async def run():
+            first = await census.get_tract_demographics("12", "009", "064100")
+            second = await census.get_tract_demographics("12", "009", "064100")
+            other_year = await census.get_tract_demographics("12", "009", "064100", year=2021)
+            await census.close()
+            return first, second, other_year
+
+        first, second, other_year = asyncio.run(run())
+        assert second is first
+        assert first.population == 4000
+        assert first.vacancy_rate == 6.2
+        assert other_year == first
+        assert len(recorder.requests) == 2
+
+    def test_memory_cache_is_bounded(self, census, recorder):
+        census._geo_cache.maxsize = 1
+
+        async def run():
+            for address in ("1 Main St", "2 Main St", "1 Main St"):
+                await census.geocode_address(address)
+
+        asyncio.run(run())
+        assert len(census._geo_cache) == 1
+        assert len(recorder.requests) == 3
+
+    def test_memory_cache_expires(self, census, recorder):
+        census._tract_cache.ttl = -1
+
+        async def run():
+            await census.get_tract_demographics("12", "009", "064100")
+            await census.get_tract_demographics("12", "009", "064100")
+
+        asyncio.run(run())
+        assert len(recorder.requests) == 2
+
+    def test_zip_demographics_cached_and_copied(self, census, recorder):
+        async def run():
+            first = await census.get_demographics_by_zip("32905")
+            first["price_to_income_ratio"] = 4.5
+            second = await census.get_demographics_by_zip("32905")
+            await census.close()
+            return first, second
+
+        first, second = asyncio.run(run())
+        assert second["population"] == 4000
+        assert "price_to_income_ratio" not in second
+        assert len(recorder.requests) == 1
+
+
+class TestSingleFlight:
+    """Coalesced callers are independent of each other's cancellation"""
+
+    def test_leader_cancel_does_not_cancel_followers(self):
+        from src.integrations._httpclient import SingleFlight
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.02)
+            return "result"
+
+        async def run():
+            flights = SingleFlight()
+            leader = asyncio.ensure_future(flights.do("k", fetch))
+            await asyncio.sleep(0)
+            follower = asyncio.ensure_future(flights.do("k", fetch))
+            await asyncio.sleep(0)
+            leader.cancel()
+            return await follower, leader.cancelled(), flights._inflight
+
+        result, leader_cancelled, inflight = asyncio.run(run())
+        assert result == "result"
+        assert leader_cancelled
+        assert calls == [1]
+        assert inflight == {}
+
+    def test_exception_shared_and_key_released(self):
+        from src.integrations._httpclient import SingleFlight
+
+        async def fetch():
+            await asyncio.sleep(0)
+            raise ValueError("boom")
+
+        async def run():
+            flights = SingleFlight()
+            results = await asyncio.gather(flights.do("k", fetch), flights.do("k", fetch), return_exceptions=True)
+            return results, flights._inflight
+
+        results, inflight = asyncio.run(run())
+        assert all(isinstance(r, ValueError) for r in results)
+        assert inflight == {}
+
+
+# =============================================================================
+# COUNTY BATCHING
+# =============================================================================
+
+class TestCountyBatch:
+    """One ACS request per county instead of one per address"""
+
+    def test_county_tracts_match_single_tract(self, census, recorder):
+        async def run():
+            tracts = await census.get_county_tracts("12", "009")
+            single = await census.get_tract_demographics("12", "009", "064100")
+            await census.close()
+            return tracts, single
+
+        tracts, single = asyncio.run(run())
+        assert set(tracts) == {"064100", "064200"}
+        assert tracts["064100"] == single
+        assert tracts["064200"].median_income == 0.0
+        assert tracts["064200"].vacancy_rate == 0
+        assert len(recorder.requests) == 1
+
+    def test_enrich_batch(self, recorder):
+        async def run():
+            fetcher = EnhancedDataFetcher(client=httpx.AsyncClient(transport=httpx.MockTransport(recorder)))
+            fetcher.census._disk = None
+            addresses = ["1 Main St, Palm Bay, FL", "2 Main St, Palm Bay, FL", "3 Main St, Palm Bay, FL"]
+            return await fetcher.enrich_batch(addresses, include_valuation=False)
+
+        results = asyncio.run(run())
+        assert [r["address"][0] for r in results] == ["1", "2", "3"]
+        assert all(r["demographics"]["geoid"] == "12009064100" for r in results)
+        acs_requests = [r for r in recorder.requests if "acs" in r.url.path]
+        assert len(acs_requests) == 1
+
+    def test_repeat_enrichment_served_from_cache(self, recorder):
+        async def run():
+            fetcher = EnhancedDataFetcher(client=httpx.AsyncClient(transport=httpx.MockTransport(recorder)))
+            fetcher.census._disk = None
+            first = await fetcher.get_enhanced_property_data("1 Main St, Palm Bay, FL", include_valuation=False)
+            acs_before = len([r for r in recorder.requests if "acs" in r.url.path])
+            second = await fetcher.get_enhanced_property_data("1 Main St, Palm Bay, FL", include_valuation=False)
+            acs_after = len([r for r in recorder.requests if "acs" in r.url.path])
+            return first, second, acs_before, acs_after
+
+        first, second, acs_before, acs_after = asyncio.run(run())
+        assert second["demographics"] == first["demographics"]
+        assert (acs_before, acs_after) == (1, 1)
+
+    def test_cached_tract_skips_county_query(self, recorder):
+        async def run():
+            fetcher = EnhancedDataFetcher(client=httpx.AsyncClient(transport=httpx.MockTransport(recorder)))
+            fetcher.census._disk = None
+            await fetcher.census.get_tract_demographics("12", "009", "064100")
+            return await fetcher.enrich_batch(["1 Main St, Palm Bay, FL"], include_valuation=False)
+
+        results = asyncio.run(run())
+        assert results[0]["demographics"]["geoid"] == "12009064100"
+        assert not [r for r in recorder.requests if r.url.params.get("for") == "tract:*"]
+
+    def test_enrich_all_yields_every_address(self, recorder):
+        async def run():
+            fetcher = EnhancedDataFetcher(client=httpx.AsyncClient(transport=httpx.MockTransport(recorder)))
+            fetcher.census._disk = None
+            addresses = [f"{i} Main St, Palm Bay, FL" for i in range(6)]
+            return [r async for r in fetcher.enrich_all(addresses, max_at_once=2, include_valuation=False)]
+
+        results = asyncio.run(run())
+        assert sorted(r["address"] for r in results) == [f"{i} Main St, Palm Bay, FL" for i in range(6)]
+        assert all(r["demographics"]["geoid"] == "12009064100" for r in results)
+
+    def test_numpy_batch_matches_row_parser(self, census):
+        pytest.importorskip("numpy")
+        rows = [
+            ACS_ROW,
+            ACS_ROW_2,
+            ["T3", "null", "1", "", "7", "7", "3", "x", "", "5", "-", "12", "009", "000300"],
+            ["T4", "1234", "48000.5", "199999", "250", "12", "150", "88", "40.2", "238", "97", "12", "009", "000400"],
+        ]
+        batch = census._parse_tract_rows(ACS_HEADER, rows, "12", "009")
+        for row in rows:
+            expected = census._parse_tract_row(dict(zip(ACS_HEADER, row)), geoid="12009" + row[-1])
+            assert batch[row[-1]] == expected
+
+
+# =============================================================================
+# CONNECTION POOL
+# =============================================================================
+
+class TestSharedClient:
+    """API clients reuse one AsyncClient per event loop"""
+
+    def test_clients_share_pool(self):
+        async def run():
+            fetcher = EnhancedDataFetcher(firecrawl_key="test")
+            clients = {id(fetcher.census.client), id(fetcher.apify.client), id(fetcher.firecrawl.client)}
+            await fetcher.close()
+            still_open = not fetcher.census.client.is_closed
+            await close_shared_client()
+            return clients, still_open
+
+        clients, still_open = asyncio.run(run())
+        assert len(clients) == 1
+        assert still_open
+
+    def test_injected_client_is_used(self, census):
+        assert census.client is census._client
+
+    def test_mega_library_reexports_clients(self):
+        from src.integrations import api_mega_library
+        assert api_mega_library.CensusAPIClient is CensusAPIClient
+        assert api_mega_library.ApifyRealEstateClient is ApifyRealEstateClient
+
+
+# =============================================================================
+# MARKET DATA
+# =============================================================================
+
+class TestMarketDataBatch:
+    """get_market_data_batch() must match get_market_data() per zip"""
+
+    # zip -> (median income, median home value); None means no ACS row
+    ZIPS = {
+        "32905": ("55000", "250000"),   # 4.55 -> MEDIUM
+        "32907": ("80000", "200000"),   # 2.5  -> HIGH
+        "32908": ("40000", "240000"),   # 6.0  -> LOW
+        "32909": ("50000", "150000"),   # exactly 3 -> MEDIUM
+        "32950": ("0", "300000"),       # no income -> ratio 0
+        "32999": None,
+    }
+
+    def _client(self):
+        from src.integrations.api_mega_library import SPDAPIClient
+
+        def handler(request):
+            zip_code = request.url.params["for"].rsplit(":", 1)[1]
+            row = self.ZIPS[zip_code]
+            header = ["B01003_001E", "B19013_001E", "B25077_001E", "B25002_003E", "B25003_002E"]
+            if row is None:
+                return httpx.Response(200, json=[header])
+            return httpx.Response(200, json=[header, ["1000", row[0], row[1], "10", "500"]])
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        spd = SPDAPIClient(client=client)
+        spd.census = CensusAPIClient(api_key="test", cache_dir="", client=client)
+        return spd
+
+    def test_batch_matches_single(self):
+        async def run():
+            single = [await self._client().get_market_data(z) for z in self.ZIPS]
+            batch = await self._client().get_market_data_batch(list(self.ZIPS))
+            return single, batch
+
+        single, batch = asyncio.run(run())
+        assert batch == single
+        assert [d.get("affordability_score") for d in batch] == ["MEDIUM", "HIGH", "LOW", "MEDIUM", "HIGH", None]
+        assert batch[-1]["error"] == "No data found"
+
+    def test_python_fallback(self, monkeypatch):
+        from src.integrations import api_mega_library
+        monkeypatch.setattr(api_mega_library, "HAS_NUMPY", False)
+        batch = asyncio.run(self._client().get_market_data_batch(["32905", "32908"]))
+        assert [d["price_to_income_ratio"] for d in batch] == [4.55, 6.0]
+
+
+class TestEnrichParcel:
+    """enrich_parcel() runs demographics alongside the geocode -> flood chain"""
+
+    def test_flood_lookup_overlaps_demographics(self):
+        from src.integrations.api_mega_library import SPDAPIClient
+        events = []
+
+        async def handler(request):
+            host = request.url.host
+            events.append(("start", host))
+            if host == "api.census.gov":
+                await asyncio.sleep(0.05)
+                response = httpx.Response(200, json=[ACS_HEADER, ACS_ROW])
+            elif "geocoder" in request.url.path:
+                response = httpx.Response(200, json=GEOCODE_RESPONSE)
+            else:
+                response = httpx.Response(200, json={"features": [{"attributes": {"FLD_ZONE": "X"}}]})
+            events.append(("end", host))
+            return response
+
+        async def run():
+            client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            spd = SPDAPIClient(client=client)
+            spd.census = CensusAPIClient(api_key="test", cache_dir="", client=client)
+            return await spd.enrich_parcel("2165 Sandy Pines Dr NE", "32905")
+
+        result = asyncio.run(run())
+        assert result["demographics"]["population"] == 4000
+        assert result["geocode"]["tract_fips"] == "064100"
+        assert result["flood_zone"]["flood_zone"] == "X"
+        # FEMA was queried before the (slow) demographics call returned
+        assert events.index(("start", "hazards.fema.gov")) < events.index(("end", "api.census.gov"))
+
+
+# =============================================================================
+# RATE LIMITING / RETRIES
+# =============================================================================
+
+class TestRateLimitAndRetry:
+    """Throttled responses are retried instead of silently dropped"""
+
+    def test_retries_429_honoring_retry_after(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            if len(calls) < 3:
+                return httpx.Response(429, headers={"Retry-After": "0"})
+            return httpx.Response(200, json=GEOCODE_RESPONSE)
+
+        async def run():
+            census = CensusAPIClient(cache_dir="", client=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+            return await census.geocode_address("1 Main St")
+
+        assert asyncio.run(run())["tract_fips"] == "064100"
+        assert len(calls) == 3
+
+    def test_gives_up_after_max_retries(self):
+        def handler(request):
+            return httpx.Response(503, headers={"Retry-After": "0"})
+
+        async def run():
+            census = CensusAPIClient(cache_dir="", client=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+            census.MAX_RETRIES = 2
+            return await census.geocode_address("1 Main St")
+
+        assert asyncio.run(run()) is None
+
+    @staticmethod
+    def post(handler, **kwargs):
+        async def run():
+            census = CensusAPIClient(cache_dir="", client=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+            return await census._request("POST", "https://api.apify.com/v2/acts/x/runs", **kwargs)
+        return asyncio.run(run())
+
+    def test_post_not_retried_on_5xx(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(502, headers={"Retry-After": "0"})
+
+        assert self.post(handler).status_code == 502
+        assert len(calls) == 1
+
+    def test_post_not_retried_on_read_timeout(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            raise httpx.ReadTimeout("slow", request=request)
+
+        with pytest.raises(httpx.ReadTimeout):
+            self.post(handler)
+        assert len(calls) == 1
+
+    def test_post_retried_on_429_and_connect_error(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            if len(calls) == 1:
+                raise httpx.ConnectError("refused", request=request)
+            if len(calls) == 2:
+                return httpx.Response(429, headers={"Retry-After": "0"})
+            return httpx.Response(201)
+
+        assert self.post(handler).status_code == 201
+        assert len(calls) == 3
+
+    def test_idempotent_post_gets_full_retries(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            if len(calls) < 3:
+                return httpx.Response(503, headers={"Retry-After": "0"})
+            return httpx.Response(200)
+
+        assert self.post(handler, idempotent=True).status_code == 200
+        assert len(calls) == 3
+
+    def test_limiter_spaces_requests(self):
+        limiter = HostRateLimiter({"example.com": 20})
+
+        async def run():
+            start = asyncio.get_running_loop().time()
+            for _ in range(25):
+                await limiter.acquire("example.com")
+            return asyncio.get_running_loop().time() - start
+
+        # 20-token burst, then 5 more at 20/s
+        assert asyncio.run(run()) >= 0.2
+
+
+# =============================================================================
+# APIFY ACTORS
+# =============================================================================
+
+class TestApifyRunActor:
+    """run_actor starts one run and waits on it by id"""
+
+    @staticmethod
+    def run_actor(handler, **kwargs):
+        async def run():
+            apify = ApifyRealEstateClient(
+                api_token="test", client=httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            )
+            return await apify.run_actor("petr_cermak/zillow-api-scraper", {"searchTerms": ["x"]}, **kwargs)
+        return asyncio.run(run())
+
+    def test_run_finishing_in_first_poll(self):
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            if request.url.path.endswith("/runs"):
+                return httpx.Response(201, json={"data": {"id": "r1", "status": "SUCCEEDED", "defaultDatasetId": "ds1"}})
+            return httpx.Response(200, json=[{"zestimate": 250000}])
+
+        assert self.run_actor(handler) == [{"zestimate": 250000}]
+        assert [r.url.path for r in requests] == [
+            "/v2/acts/petr_cermak~zillow-api-scraper/runs", "/v2/datasets/ds1/items"
+        ]
+        # waitForFinish only bounds the wait; no run timeout is imposed
+        assert "timeout" not in requests[0].url.params
+
+    def test_slow_run_is_polled_not_restarted(self):
+        requests = []
+        statuses = iter(["RUNNING", "SUCCEEDED"])
+
+        def handler(request):
+            requests.append(request)
+            if request.url.path.endswith("/runs"):
+                return httpx.Response(201, json={"data": {"id": "r1", "status": "RUNNING", "defaultDatasetId": "ds1"}})
+            if request.url.path == "/v2/actor-runs/r1":
+                return httpx.Response(200, json={"data": {"id": "r1", "status": next(statuses), "defaultDatasetId": "ds1"}})
+            return httpx.Response(200, json=[{"price": 1}])
+
+        assert self.run_actor(handler) == [{"price": 1}]
+        assert [r.method for r in requests].count("POST") == 1
+        assert [r.url.path for r in requests].count("/v2/actor-runs/r1") == 2
+
+    def test_failed_run_returns_none(self):
+        def handler(request):
+            if request.url.path.endswith("/runs"):
+                return httpx.Response(201, json={"data": {"id": "r1", "status": "FAILED", "defaultDatasetId": "ds1"}})
+            raise AssertionError("dataset of a failed run must not be read")
+
+        assert self.run_actor(handler) is None
+
+    def test_gives_up_at_deadline(self):
+        def handler(request):
+            return httpx.Response(200, json={"data": {"id": "r1", "status": "RUNNING"}})
+
+        assert self.run_actor(handler, wait_secs=0) is None
+
+
+# =============================================================================
+# OPPORTUNITY ENRICHMENT
+# =============================================================================
+
+class TestEnrichOpportunity:
+    """Fresh opportunities skip the API calls"""
+
+    @staticmethod
+    def opportunity(enriched_at):
+        return {
+            "address": "1 Main St, Palm Bay, FL",
+            "census_demographics": {"median_income": 1},
+            "market_valuation": {"consensus_value": 1},
+            "api_enriched_at": enriched_at
+        }
+
+    def enrich(self, recorder, opportunity, **kwargs):
+        async def run():
+            fetcher = EnhancedDataFetcher(client=httpx.AsyncClient(transport=httpx.MockTransport(recorder)))
+            fetcher.census._disk = None
+            return await enrich_opportunity_with_apis(opportunity, fetcher=fetcher, **kwargs)
+        return asyncio.run(run())
+
+    def test_fresh_opportunity_is_returned_unchanged(self, recorder):
+        from datetime import datetime
+        opp = self.opportunity(datetime.utcnow().isoformat())
+        assert self.enrich(recorder, opp) is opp
+        assert opp["census_demographics"] == {"median_income": 1}
+        assert recorder.requests == []
+
+    def test_stale_or_forced_opportunity_is_refetched(self, recorder):
+        from datetime import datetime, timedelta
+        stale = self.opportunity((datetime.utcnow() - timedelta(days=2)).isoformat())
+        assert self.enrich(recorder, stale)["census_demographics"]["geoid"] == "12009064100"
+
+        fresh = self.opportunity(datetime.utcnow().isoformat())
+        assert self.enrich(recorder, fresh, force=True)["census_demographics"]["geoid"] == "12009064100"
+
+    def test_own_enrichment_stamp_counts_as_fresh(self, recorder):
+        from datetime import datetime, timedelta
+        stale = self.opportunity((datetime.utcnow() - timedelta(days=2)).isoformat())
+        enriched = self.enrich(recorder, stale)
+        assert enriched["api_enriched_at"].endswith("+00:00")
+        enriched["market_valuation"] = {"consensus_value": 1}
+        count = len(recorder.requests)
+        assert self.enrich(recorder, enriched) is enriched
+        assert len(recorder.requests) == count
+
+    def test_default_fetcher_is_reused(self, recorder, monkeypatch):
+        from src.integrations import api_integrations
+        fetcher = EnhancedDataFetcher(client=httpx.AsyncClient(transport=httpx.MockTransport(recorder)))
+        fetcher.census._disk = None
+        monkeypatch.setattr(api_integrations, "_fetchers", {(None, None): fetcher})
+
+        async def run():
+            for _ in range(2):
+                await enrich_opportunity_with_apis({"address": "1 Main St, Palm Bay, FL"})
+
+        asyncio.run(run())
+        geocodes = [r for r in recorder.requests if "geocoder" in r.url.path]
+        assert len(geocodes) == 1
+        assert api_integrations._get_fetcher() is fetcher
@@ -0,0 +1,675 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for Zoning-FLU Data Source Integrations
+
+Coverage targets:
+- Pooled client configuration
+- Shared client injection
+- Flood-zone TTL cache (failed NFHL queries are not cached)
+- BCPAO conditional GETs
+- Retry with backoff (every BCPAO / GIS read; no 5xx retry for AI-agent POSTs)
+- Partial-failure fan-out (gather_with_defaults / get_parcel_data)
+
+HTTP is served by httpx.MockTransport; no network access is required.
+
+Author: BidDeed.AI / Everest Capital USA
+"""
+
+import asyncio
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from src.integrations._httpclient import POOL_LIMITS, close_shared_client, loads_json, make_client
+from src.integrations._ttlcache import TTLCache, utc_now_iso
+from src.integrations.data_sources import (
+    BCPAOClient,
+    FEMAFloodClient,
+    MunicipalGISClient,
+    OpportunityDataAggregator
+)
+
+
+# =============================================================================
+# CONNECTION POOL
+# =============================================================================
+
+class TestPooledClient:
+    """Clients are built with tuned keep-alive limits"""
+
+    def test_make_client_pool_limits(self):
+        pool = make_client(30)._transport._pool
+        assert pool._max_connections == POOL_LIMITS.max_connections
+        assert pool._max_keepalive_connections == POOL_LIMITS.max_keepalive_connections
+        assert pool._keepalive_expiry == POOL_LIMITS.keepalive_expiry
+
+    def test_loads_json_matches_stdlib(self):
+        payload = {"features": [{"attributes": {"PARCEL_ID": "2830001", "ACRES": 1.25, "FLU": None}}]}
+        response = httpx.Response(200, json=payload)
+        assert loads_json(response) == response.json() == payload
+
+    def test_http2_follows_flag(self, monkeypatch):
+        from src.integrations import _httpclient
+        monkeypatch.setattr(_httpclient, "HTTP2_ENABLED", True)
+        assert make_client(30)._transport._pool._http2 is True
+        monkeypatch.setattr(_httpclient, "HTTP2_ENABLED", False)
+        assert make_client(30)._transport._pool._http2 is False
+
+    def test_warm_up_opens_each_host(self):
+        hosts = []
+
+        def handler(request):
+            hosts.append((request.method, request.url.host))
+            if request.url.host == "hazards.fema.gov":
+                raise httpx.ConnectError("unreachable")
+            return httpx.Response(200)
+
+        async def run():
+            client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            await OpportunityDataAggregator("Palm Bay", client=client).warm_up()
+            await client.aclose()
+
+        asyncio.run(run())
+        assert sorted(hosts) == [
+            ("HEAD", "gis.palmbayflorida.org"), ("HEAD", "hazards.fema.gov"), ("HEAD", "www.bcpao.us")
+        ]
+
+    def test_context_manager_leaves_shared_client_open(self):
+        async def run():
+            async with FEMAFloodClient() as fema:
+                client = fema.client
+            still_open = not client.is_closed
+            await close_shared_client()
+            return client, still_open
+
+        client, still_open = asyncio.run(run())
+        assert still_open
+        assert client.is_closed
+
+
+# =============================================================================
+# SHARED CLIENT
+# =============================================================================
+
+class TestSharedClient:
+    """Aggregator sub-clients reuse one AsyncClient"""
+
+    def test_sub_clients_share_default_pool(self):
+        async def run():
+            agg = OpportunityDataAggregator("Palm Bay")
+            clients = {id(c.client) for c in (agg.bcpao, agg.gis, agg.planning, agg.fema)}
+            await close_shared_client()
+            return clients
+
+        assert len(asyncio.run(run())) == 1
+
+    def test_injected_client_is_used_and_not_closed(self):
+        seen = []
+
+        def handler(request):
+            seen.append(request.url.host)
+            return httpx.Response(200, json={"features": []})
+
+        async def run():
+            client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            agg = OpportunityDataAggregator("Palm Bay", client=client)
+            await agg.fema.get_flood_zone(28.0, -80.6)
+            await agg.close()
+            closed = client.is_closed
+            await client.aclose()
+            return closed
+
+        assert asyncio.run(run()) is False
+        assert seen == ["hazards.fema.gov"]
+
+
+# =============================================================================
+# CONVENIENCE FUNCTIONS
+# =============================================================================
+
+class TestCachedAggregator:
+    """Convenience functions reuse one aggregator per jurisdiction"""
+
+    def test_aggregator_cached_per_jurisdiction(self):
+        from src.integrations import data_sources
+
+        try:
+            first = data_sources._get_aggregator("Palm Bay")
+            assert data_sources._get_aggregator("Palm Bay") is first
+            assert data_sources._get_aggregator("Melbourne") is not first
+        finally:
+            asyncio.run(data_sources._close_all())
+        assert data_sources._AGGREGATORS == {}
+
+
+# =============================================================================
+# OPPORTUNITY DISCOVERY
+# =============================================================================
+
+class TestDiscoverOpportunities:
+    """discover_opportunities() batches zoning lookups into IN queries"""
+
+    ZONES = {"2830001": "RS", "2830002": "RM-20", "2830003": "RM-10", "2830004": "RS"}
+    INJECTED = "2830005' OR '1'='1"
+
+    def _handler(self, state):
+        async def handler(request):
+            if request.url.host == "www.bcpao.us":
+                parcels = [{"parcel_id": pid} for pid in [*self.ZONES, self.INJECTED]]
+                return httpx.Response(200, json={"parcels": parcels})
+            assert request.method == "POST"
+            where = dict(httpx.QueryParams(request.content.decode()))["where"]
+            state["wheres"].append(where)
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+            await asyncio.sleep(0.01)
+            state["active"] -= 1
+            features = [
+                {"attributes": {"PARCEL_ID": pid, "ZONE_CODE": zone}}
+                for pid, zone in self.ZONES.items()
+                if f"'{pid}'" in where
+            ]
+            return httpx.Response(200, json={"features": features})
+        return handler
+
+    def _run(self, state, coro_fn):
+        async def run():
+            client = httpx.AsyncClient(transport=httpx.MockTransport(self._handler(state)))
+            agg = OpportunityDataAggregator("Palm Bay", client=client)
+            try:
+                return await coro_fn(agg)
+            finally:
+                await client.aclose()
+        return asyncio.run(run())
+
+    def test_results_ranked_by_density_gap(self):
+        state = {"active": 0, "peak": 0, "wheres": []}
+        opportunities = self._run(state, lambda agg: agg.discover_opportunities(["HDR"], max_results=10))
+        assert [o.parcel["parcel_id"] for o in opportunities] == ["2830001", "2830004", "2830003"]
+        assert [o.density_gap for o in opportunities] == [16, 16, 10]
+        assert state["wheres"] == ["PARCEL_ID IN ('2830001','2830002','2830003','2830004')"]
+
+    def test_top_results_keep_stable_order(self):
+        state = {"active": 0, "peak": 0, "wheres": []}
+        opportunities = self._run(state, lambda agg: agg.discover_opportunities(["HDR", "MDR"], max_results=3))
+        assert [(o.parcel["parcel_id"], o.flu_code) for o in opportunities] == [
+            ("2830001", "HDR"), ("2830004", "HDR"), ("2830003", "HDR")
+        ]
+
+    def test_opportunity_to_dict_keeps_wire_format(self):
+        state = {"active": 0, "peak": 0, "wheres": []}
+        opportunities = self._run(state, lambda agg: agg.discover_opportunities(["HDR"], max_results=1))
+        assert opportunities[0].to_dict() == {
+            "parcel": {"parcel_id": "2830001"},
+            "zoning": {"PARCEL_ID": "2830001", "ZONE_CODE": "RS"},
+            "flu_code": "HDR",
+            "current_density": 4,
+            "flu_density": 20,
+            "density_gap": 16
+        }
+        assert not hasattr(opportunities[0], "__dict__")
+
+    def test_zoning_batches_follow_parcel_stream(self):
+        state = {"active": 0, "peak": 0, "wheres": []}
+
+        async def discover(agg):
+            agg.ZONING_BATCH_SIZE = 3
+            return await agg.discover_opportunities(["HDR"], max_results=10)
+
+        assert len(self._run(state, discover)) == 3
+        assert state["wheres"] == ["PARCEL_ID IN ('2830001','2830002','2830003')", "PARCEL_ID IN ('2830004')"]
+
+    def test_invalid_parcel_ids_never_reach_gis(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(200, json={"features": []})
+
+        async def run():
+            client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            gis = MunicipalGISClient("Palm Bay", client=client)
+            results = [
+                await gis.get_zoning_layer(self.INJECTED),
+                await gis.get_flu_layer("28 37"),
+                await gis.get_constraint_layers("2830001\n"),
+                await gis.get_zoning_layer_batch([self.INJECTED, None, "abc"]),
+            ]
+            await client.aclose()
+            return results
+
+        zoning, flu, constraints, batch = asyncio.run(run())
+        assert zoning is None and flu is None and batch == {}
+        assert set(constraints.values()) == {None}
+        assert calls == []
+
+    def test_brevard_parcel_id_formats_are_valid(self):
+        from src.integrations.data_sources import _is_parcel_id
+        assert _is_parcel_id("2830001")
+        assert _is_parcel_id("29-36-26-KL-00001.0-0012.00")
+        assert not _is_parcel_id(self.INJECTED)
+        assert not _is_parcel_id(2830001)
+
+    def test_parcel_stream_error_yields_nothing(self):
+        def handler(request):
+            return httpx.Response(500)
+
+        async def run():
+            client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            bcpao = BCPAOClient(client=client, cache_dir="")
+            parcels = [p async for p in bcpao.iter_parcels_by_flu("HDR")]
+            await client.aclose()
+            return parcels
+
+        assert asyncio.run(run()) == []
+
+    def test_batch_chunks_and_bounds_concurrency(self):
+        state = {"active": 0, "peak": 0, "wheres": []}
+
+        async def batch(agg):
+            agg.gis.MAX_CONCURRENT = 2
+            return await agg.gis.get_zoning_layer_batch(list(self.ZONES) + ["990000%d" % i for i in range(6)], chunk_size=2)
+
+        zoning = self._run(state, batch)
+        assert set(zoning) == set(self.ZONES)
+        assert zoning["2830002"]["ZONE_CODE"] == "RM-20"
+        assert len(state["wheres"]) == 5
+        assert state["peak"] == 2
+
+
+# =============================================================================
+# CONSTRAINT LAYERS
+# =============================================================================
+
+class TestConstraintLayers:
+    """get_constraint_layers() queries all overlays concurrently"""
+
+    def test_layers_fetched_concurrently(self):
+        state = {"active": 0, "peak": 0}
+
+        async def handler(request):
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+            await asyncio.sleep(0.01)
+            state["active"] -= 1
+            if "Wetlands" in request.url.path:
+                return httpx.Response(404)
+            if "Easements" in request.url.path:
+                raise httpx.ConnectError("layer offline")
+            assert request.url.params["returnGeometry"] == "true"
+            assert request.url.params["where"] == "PARCEL_ID = '2830001'"
+            layer = request.url.path.split("/")[-4]
+            return httpx.Response(200, json={"features": [{"attributes": {"LAYER": layer}}]})
+
+        async def run():
+            client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            gis = MunicipalGISClient("Palm Bay", client=client)
+            try:
+                return await gis.get_constraint_layers("2830001")
+            finally:
+                await client.aclose()
+
+        constraints = asyncio.run(run())
+        assert constraints == {
+            "wellhead_protection": {"LAYER": "WellheadProtection"},
+            "flood_zone": {"LAYER": "FloodZones"},
+            "wetlands": None,
+            "conservation": {"LAYER": "Conservation"},
+            "easements": None
+        }
+        assert state["peak"] == 5
+
+# =============================================================================
+# FLOOD ZONE CACHE
+# =============================================================================
+
+class TestFloodZoneCache:
+    """Nearby flood-zone lookups reuse one FEMA query"""
+
+    def test_ttl_cache_expires_and_evicts(self, monkeypatch):
+        from src.integrations import _ttlcache
+        now = [100.0]
+        monkeypatch.setattr(_ttlcache.time, "monotonic", lambda: now[0])
+
+        cache = TTLCache(maxsize=2, ttl=10)
+        cache.set("a", 1)
+        cache.set("b", None)
+        assert cache.get("a") == 1
+        cache.set("c", 3)
+        assert cache.get("b", "miss") == "miss"
+        assert cache.get("a") == 1
+        now[0] += 10
+        assert cache.get("a") is None
+        assert len(cache) == 1
+
+    def test_utc_now_iso_formats_once_per_second(self, monkeypatch):
+        from datetime import datetime, timezone
+        from src.integrations import _ttlcache
+        now = [1767225600.2]
+        monkeypatch.setattr(_ttlcache.time, "time", lambda: now[0])
+
+        first = utc_now_iso()
+        now[0] += 0.5
+        assert utc_now_iso() is first
+        assert first == "2026-01-01T00:00:00+00:00"
+        now[0] += 1
+        assert datetime.fromisoformat(utc_now_iso()) == datetime(2026, 1, 1, 0, 0, 1, tzinfo=timezone.utc)
+
+    def test_nearby_points_share_query(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            attrs = {"FLD_ZONE": "AE", "ZONE_SUBTY": None, "SFHA_TF": "T"}
+            return httpx.Response(200, json={"features": [{"attributes": attrs}]})
+
+        async def run():
+            client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            fema = FEMAFloodClient(client=client)
+            zones = [
+                await fema.get_flood_zone(28.03001, -80.61001),
+                await fema.get_flood_zone(28.03002, -80.61002),
+                await fema.get_flood_zone(28.04, -80.61),
+            ]
+            await client.aclose()
+            return zones
+
+        zones = asyncio.run(run())
+        assert all(z["flood_zone"] == "AE" and z["in_sfha"] for z in zones)
+        assert len(calls) == 2
+
+    def test_concurrent_lookups_share_query(self):
+        calls = []
+
+        async def handler(request):
+            calls.append(request)
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json={"features": [{"attributes": {"FLD_ZONE": "X"}}]})
+
+        async def run():
+            client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            fema = FEMAFloodClient(client=client)
+            zones = await asyncio.gather(*(fema.get_flood_zone(28.03, -80.61) for _ in range(5)))
+            await client.aclose()
+            return zones
+
+        zones = asyncio.run(run())
+        assert all(z["flood_zone"] == "X" for z in zones)
+        assert len(calls) == 1
+
+    def test_errors_are_not_cached(self, caplog):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            if len(calls) <= 3:
+                return httpx.Response(503)
+            return httpx.Response(200, json={"features": []})
+
+        async def run():
+            client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            fema = FEMAFloodClient(client=client)
+            fema.RETRY_BACKOFF = 0
+            zones = [await fema.get_flood_zone(28.03, -80.61) for _ in range(3)]
+            await client.aclose()
+            return zones
+
+        with caplog.at_level("WARNING", logger="src.integrations.data_sources"):
+            assert asyncio.run(run())[0] is None
+        # first lookup exhausts its retries; the second succeeds and is cached
+        assert len(calls) == 4
+        assert [r.getMessage()[:22] for r in caplog.records] == ["FEMA flood query error"]
+
+
+    @pytest.mark.parametrize("failure", [
+        httpx.Response(404),
+        httpx.Response(200, json={"error": {"code": 400, "message": "Invalid query"}}),
+    ])
+    def test_failed_queries_are_not_cached_as_zone_x(self, failure):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            if len(calls) == 1:
+                return failure
+            return httpx.Response(200, json={"features": [{"attributes": {"FLD_ZONE": "AE", "SFHA_TF": "T"}}]})
+
+        async def run():
+            client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            fema = FEMAFloodClient(client=client)
+            zones = [await fema.get_flood_zone(28.03, -80.61) for _ in range(2)]
+            await client.aclose()
+            return zones
+
+        first, second = asyncio.run(run())
+        assert first is None
+        assert second["flood_zone"] == "AE"
+        assert len(calls) == 2
+
+    @pytest.mark.parametrize("failure", [
+        httpx.Response(404),
+        httpx.Response(200, json={"error": {"code": 400, "message": "Invalid query"}}),
+    ])
+    def test_mega_library_failed_queries_are_not_cached(self, failure):
+        from src.integrations.api_mega_library import GovernmentDataClient
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            if len(calls) == 1:
+                return failure
+            return httpx.Response(200, json={"features": [{"attributes": {"FLD_ZONE": "AE", "SFHA_TF": "T"}}]})
+
+        async def run():
+            client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            government = GovernmentDataClient(client=client)
+            zones = [await government.get_flood_zone(28.03, -80.61) for _ in range(2)]
+            await client.aclose()
+            return zones
+
+        first, second = asyncio.run(run())
+        assert "error" in first
+        assert second["flood_zone"] == "AE"
+        assert len(calls) == 2
+
+# =============================================================================
+# BCPAO CONDITIONAL GET
+# =============================================================================
+
+class TestBCPAOConditionalGet:
+    """Parcel details are revalidated with If-None-Match / If-Modified-Since"""
+
+    PARCEL = {"account": "2830001", "owner": "SANDY PINES LLC", "acres": 1.06}
+
+    def _fetch(self, handler, times=3):
+        async def run():
+            client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            bcpao = BCPAOClient(client=client, cache_dir="")
+            results = [await bcpao.get_parcel_details("2830001") for _ in range(times)]
+            await client.aclose()
+            return results
+        return asyncio.run(run())
+
+    def test_not_modified_reuses_cached_body(self):
+        seen = []
+
+        def handler(request):
+            seen.append(dict(request.headers))
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            headers = {"ETag": '"v1"', "Last-Modified": "Wed, 01 Jan 2025 00:00:00 GMT"}
+            return httpx.Response(200, json=self.PARCEL, headers=headers)
+
+        results = self._fetch(handler)
+        assert results == [self.PARCEL] * 3
+        assert "if-none-match" not in seen[0]
+        assert seen[1]["if-none-match"] == '"v1"'
+        assert seen[1]["if-modified-since"] == "Wed, 01 Jan 2025 00:00:00 GMT"
+
+    def test_changed_parcel_replaces_cache(self):
+        versions = iter([("v1", 1.06), ("v2", 2.5), ("v2", None)])
+
+        def handler(request):
+            tag, acres = next(versions)
+            if acres is None:
+                assert request.headers["If-None-Match"] == tag
+                return httpx.Response(304)
+            return httpx.Response(200, json=dict(self.PARCEL, acres=acres), headers={"ETag": tag})
+
+        assert [r["acres"] for r in self._fetch(handler)] == [1.06, 2.5, 2.5]
+
+    def test_no_validators_means_no_cache(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            assert "If-None-Match" not in request.headers
+            return httpx.Response(200, json=self.PARCEL)
+
+        assert self._fetch(handler, times=2) == [self.PARCEL] * 2
+        assert len(calls) == 2
+
+
+# =============================================================================
+# RETRIES
+# =============================================================================
+
+class TestRetry:
+    """Transient failures are retried instead of becoming empty results"""
+
+    def _gis(self, handler, retries=2):
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        gis = MunicipalGISClient("Palm Bay", client=client)
+        gis.RETRY_BACKOFF = 0
+        gis.MAX_RETRIES = retries
+        return gis
+
+    def test_transient_errors_are_retried(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            if len(calls) == 1:
+                raise httpx.ReadTimeout("slow layer")
+            if len(calls) == 2:
+                return httpx.Response(503)
+            return httpx.Response(200, json={"features": [{"attributes": {"ZONE_CODE": "RS"}}]})
+
+        zoning = asyncio.run(self._gis(handler).get_zoning_layer("2830001"))
+        assert zoning == {"ZONE_CODE": "RS"}
+        assert len(calls) == 3
+
+    def test_gives_up_after_max_retries(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            raise httpx.ConnectError("down")
+
+        assert asyncio.run(self._gis(handler, retries=1).get_flu_layer("2830001")) is None
+        assert len(calls) == 2
+
+    def test_client_errors_are_not_retried(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(404)
+
+        assert asyncio.run(self._gis(handler).get_zoning_layer("2830001")) is None
+        assert len(calls) == 1
+
+    def test_all_bcpao_and_gis_reads_are_retried(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request.url.path)
+            if calls.count(request.url.path) == 1:
+                return httpx.Response(503)
+            attrs = {"features": [{"attributes": {"LAYER": request.url.path}}]}
+            return httpx.Response(200, json={"results": [{"id": 1}], "parcels": [{"id": 2}], **attrs})
+
+        async def run():
+            client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            bcpao = BCPAOClient(client=client)
+            bcpao.RETRY_BACKOFF = 0
+            gis = self._gis(handler)
+            return (
+                await bcpao.search_by_address("1 Main St"),
+                await bcpao.get_parcels_by_zoning("RS"),
+                await gis.get_constraint_layers("2830001")
+            )
+
+        search, by_zoning, constraints = asyncio.run(run())
+        assert search == [{"id": 1}]
+        assert by_zoning == [{"id": 2}]
+        assert all(layer is not None for layer in constraints.values())
+        assert all(calls.count(path) == 2 for path in calls)
+
+    def test_ai_agent_post_not_retried_on_5xx(self):
+        from src.integrations.api_mega_library import AIAgentClient
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(502, json={"error": "bad gateway"})
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        agent = AIAgentClient(apify_key="test", client=client)
+        asyncio.run(agent.research_company("Acme"))
+        assert len(calls) == 1
+
+    def test_retry_delay_backoff(self, monkeypatch):
+        from src.integrations import _httpclient
+        monkeypatch.setattr(_httpclient.random, "random", lambda: 0.5)
+        assert _httpclient.retry_delay(None, 0, base=0.2, cap=2.0) == pytest.approx(0.3)
+        assert _httpclient.retry_delay(None, 5, base=0.2, cap=2.0) == 2.0
+        assert _httpclient.retry_delay(httpx.Response(429, headers={"Retry-After": "7"}), 0) == 7.0
+
+
+# =============================================================================
+# PARTIAL FAILURES
+# =============================================================================
+
+class TestGatherWithDefaults:
+    """A failed source falls back to its default instead of failing the fan-out"""
+
+    def test_all_succeed(self):
+        from src.integrations._httpclient import gather_with_defaults
+
+        async def value(v):
+            return v
+
+        assert asyncio.run(gather_with_defaults((value(1), value(2)), (None, None))) == [1, 2]
+
+    def test_failures_use_defaults_and_others_finish(self):
+        from src.integrations._httpclient import gather_with_defaults
+
+        async def fail():
+            raise RuntimeError("source down")
+
+        async def slow(v):
+            await asyncio.sleep(0.01)
+            return v
+
+        result = asyncio.run(gather_with_defaults((fail(), slow("ok"), fail()), ({}, None, "fallback")))
+        assert result == [{}, "ok", "fallback"]
+
+    def test_parcel_data_survives_failed_source(self, monkeypatch):
+        def handler(request):
+            return httpx.Response(200, json={"features": [{"attributes": {"ZONE_CODE": "RS"}}]})
+
+        async def boom(*args, **kwargs):
+            raise RuntimeError("BCPAO down")
+
+        async def run():
+            client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            aggregator = OpportunityDataAggregator("Palm Bay", client=client)
+            monkeypatch.setattr(aggregator.bcpao, "get_parcel_details", boom)
+            return await aggregator.get_parcel_data("2830001")
+
+        data = asyncio.run(run())
+        assert data["bcpao"] is None
+        assert data["zoning"] == {"ZONE_CODE": "RS"}
+        assert isinstance(data["constraints"], dict)
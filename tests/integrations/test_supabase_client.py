@@ -0,0 +1,398 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for the Supabase REST Client
+
+Coverage targets:
+- Pooled client reuse across requests
+- PostgREST request / error handling
+- Prefer: return=minimal / merge-duplicates upserts
+- GET TTL cache with ETag revalidation
+- Byte-size batch chunking and gzip bodies
+- COPY rows (one per account, last wins) / configuration checks for bulk_copy_parcels
+- BCPAO / score record mapping
+- AsyncSupabaseClient chunked concurrent batch inserts
+
+HTTP is served by httpx.MockTransport; no network access is required.
+
+Author: BidDeed.AI / Everest Capital USA
+"""
+
+import asyncio
+import json
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from src.integrations.supabase_client import AsyncSupabaseClient, SupabaseClient, SupabaseConfig
+
+
+# =============================================================================
+# TEST FIXTURES
+# =============================================================================
+
+class Recorder:
+    """MockTransport handler that records requests and echoes JSON bodies like PostgREST"""
+
+    def __init__(self, status=201):
+        self.requests = []
+        self.status = status
+
+    def __call__(self, request):
+        self.requests.append(request)
+        if "return=minimal" in request.headers.get("Prefer", ""):
+            return httpx.Response(self.status)
+        body = json.loads(request.content) if request.content else []
+        return httpx.Response(self.status, json=body)
+
+
+@pytest.fixture
+def recorder():
+    return Recorder()
+
+
+@pytest.fixture
+def supabase(recorder):
+    client = httpx.Client(transport=httpx.MockTransport(recorder))
+    return SupabaseClient(SupabaseConfig(service_key="service"), client=client)
+
+
+# =============================================================================
+# CONNECTION POOL
+# =============================================================================
+
+class TestPooledClient:
+    """Requests go through one long-lived pooled client"""
+
+    def test_requests_share_client(self, supabase, recorder):
+        supabase.insert_parcel({"account": "2830001"})
+        supabase.get_bid_parcels(limit=5)
+        assert len(recorder.requests) == 2
+        assert recorder.requests[0].url.path == "/rest/v1/rough_diamond_parcels"
+        assert recorder.requests[1].url.params["limit"] == "5"
+
+    def test_districts_in_one_query(self, supabase, recorder):
+        supabase.get_parcels_by_districts(["PALM BAY", 'Unincorp, "North"'], limit=200)
+        assert supabase.get_parcels_by_districts([]) == []
+        (request,) = recorder.requests
+        assert request.url.params["or"] == (
+            '(taxing_district.ilike."*PALM BAY*",taxing_district.ilike."*Unincorp, \\"North\\"*")'
+        )
+        assert request.url.params["limit"] == "200"
+
+    def test_injected_client_left_open(self, supabase):
+        with supabase:
+            pass
+        assert not supabase._client.is_closed
+
+    def test_owned_client_closed(self):
+        with SupabaseClient(SupabaseConfig(service_key="service")) as supabase:
+            client = supabase._client
+        assert client.is_closed
+
+    def test_config_is_slotted(self):
+        config = SupabaseConfig(service_key="service")
+        assert not hasattr(config, "__dict__")
+        config.service_key = "rotated"
+        assert config.service_key == "rotated"
+
+    def test_headers_built_once(self, supabase):
+        headers = supabase._get_headers()
+        assert supabase._get_headers() is headers
+        assert headers["Authorization"] == "Bearer service"
+        with pytest.raises(TypeError):
+            headers["Prefer"] = "return=minimal"
+
+    def test_http_errors_raise(self):
+        client = httpx.Client(transport=httpx.MockTransport(Recorder(status=409)))
+        supabase = SupabaseClient(SupabaseConfig(service_key="service"), client=client)
+        with pytest.raises(httpx.HTTPStatusError):
+            supabase.insert_parcel({"account": "2830001"})
+
+
+# =============================================================================
+# PREFER HEADERS
+# =============================================================================
+
+class TestPreferHeaders:
+    """Batch writes skip the echoed rows; parcel writes upsert on account"""
+
+    def test_batch_insert_returns_minimal(self, supabase, recorder):
+        assert supabase.insert_scores_batch([{"account": "1", "score": 80}]) == []
+        assert supabase.log_search_run({"total_found": 3}) is None
+        for request in recorder.requests:
+            assert request.headers["Prefer"] == "return=minimal"
+
+    def test_batch_insert_rows_on_request(self, supabase, recorder):
+        rows = supabase.insert_scores_batch([{"account": "1", "score": 80}], return_rows=True)
+        assert rows[0]["score"] == 80
+        assert recorder.requests[0].headers["Prefer"] == "return=representation"
+
+    def test_parcels_upsert_on_account(self, supabase, recorder):
+        supabase.insert_parcels_batch([{"account": "1"}])
+        supabase.insert_parcel({"account": "1"})
+        batch, single = recorder.requests
+        assert batch.url.params["on_conflict"] == single.url.params["on_conflict"] == "account"
+        assert batch.headers["Prefer"] == "return=minimal,resolution=merge-duplicates"
+        assert single.headers["Prefer"] == "return=representation,resolution=merge-duplicates"
+
+    def test_async_batch_returns_minimal(self, recorder):
+        async def run():
+            client = httpx.AsyncClient(transport=httpx.MockTransport(recorder))
+            supabase = AsyncSupabaseClient(SupabaseConfig(service_key="service"), client=client)
+            return await supabase.insert_parcels_batch([{"account": "1"}])
+
+        assert asyncio.run(run()) == []
+        assert recorder.requests[0].headers["Prefer"] == "return=minimal,resolution=merge-duplicates"
+
+
+# =============================================================================
+# GET CACHE
+# =============================================================================
+
+class TestGetCache:
+    """Repeat reads come from memory, stale ones revalidate by ETag"""
+
+    ROWS = [{"account": "2830001", "score": 91}]
+
+    def _supabase(self, calls):
+        def handler(request):
+            calls.append(request)
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, json=self.ROWS, headers={"ETag": '"v1"'})
+
+        client = httpx.Client(transport=httpx.MockTransport(handler))
+        return SupabaseClient(SupabaseConfig(service_key="service"), client=client)
+
+    def test_fresh_reads_served_from_cache(self):
+        calls = []
+        supabase = self._supabase(calls)
+        first = supabase.get_high_value_parcels(min_score=90)
+        first[0]["score"] = 0
+        assert supabase.get_high_value_parcels(min_score=90) == self.ROWS
+        assert len(calls) == 1
+        supabase.get_high_value_parcels(min_score=80)
+        assert len(calls) == 2
+
+    def test_stale_reads_revalidate_with_etag(self):
+        calls = []
+        supabase = self._supabase(calls)
+        supabase.GET_CACHE_TTL = 0
+        supabase.get_bid_parcels()
+        assert supabase.get_bid_parcels() == self.ROWS
+        assert "If-None-Match" not in calls[0].headers
+        assert calls[1].headers["If-None-Match"] == '"v1"'
+
+    def test_writes_invalidate_cache(self, recorder):
+        supabase = SupabaseClient(
+            SupabaseConfig(service_key="service"),
+            client=httpx.Client(transport=httpx.MockTransport(recorder))
+        )
+        supabase.get_bid_parcels()
+        supabase.insert_scores_batch([{"account": "1", "score": 80}])
+        supabase.get_bid_parcels()
+        assert [r.method for r in recorder.requests] == ["GET", "POST", "GET"]
+
+
+# =============================================================================
+# BATCH BODIES
+# =============================================================================
+
+class TestBatchBodies:
+    """Batch inserts are split by serialized size, optionally gzipped"""
+
+    def test_chunks_respect_byte_budget(self):
+        from src.integrations.supabase_client import _json_array_chunks
+        records = [{"account": f"{i:07d}", "owner": "X" * 50} for i in range(100)]
+        bodies = list(_json_array_chunks(records, max_bytes=1000))
+        assert len(bodies) > 1
+        assert all(len(b) <= 1000 for b in bodies)
+        assert [r for b in bodies for r in json.loads(b)] == records
+
+    def test_oversized_record_gets_own_body(self):
+        from src.integrations.supabase_client import _json_array_chunks
+        records = [{"a": 1}, {"big": "X" * 500}, {"b": 2}]
+        bodies = [json.loads(b) for b in _json_array_chunks(records, max_bytes=100)]
+        assert bodies == [[{"a": 1}], [{"big": "X" * 500}], [{"b": 2}]]
+
+    def test_sync_batch_posts_each_chunk(self, supabase, recorder):
+        supabase.MAX_BODY_BYTES = 1000
+        supabase.insert_parcels_batch([{"account": str(i)} for i in range(10)])
+        assert len(recorder.requests) > 1
+        assert sum(len(json.loads(r.content)) for r in recorder.requests) == 10
+
+    def test_gzip_bodies(self):
+        import gzip
+        seen = []
+
+        def handler(request):
+            seen.append((request.headers.get("Content-Encoding"), json.loads(gzip.decompress(request.content))))
+            return httpx.Response(201)
+
+        supabase = SupabaseClient(
+            SupabaseConfig(service_key="service"),
+            client=httpx.Client(transport=httpx.MockTransport(handler))
+        )
+        supabase.GZIP_BODIES = True
+        supabase.insert_scores_batch([{"account": "1", "score": 80}])
+        assert seen[0][0] == "gzip"
+        assert seen[0][1][0]["score"] == 80
+
+
+# =============================================================================
+# BULK COPY
+# =============================================================================
+
+class TestBulkCopy:
+    """COPY rows match the REST mapping; missing setup fails loudly"""
+
+    def test_copy_rows_follow_columns(self):
+        from decimal import Decimal
+        from src.integrations.supabase_client import _PARCEL_COLUMNS, _parcel_copy_rows
+        (row,) = _parcel_copy_rows([{"account": "2830001", "acreage": 1.25, "marketValue": "95000"}])
+        record = dict(zip(_PARCEL_COLUMNS, row))
+        assert record["account"] == "2830001"
+        assert record["acres"] == Decimal("1.25")
+        assert record["market_value"] == Decimal("95000.0")
+        assert record["created_at"] is record["updated_at"]
+        assert record["created_at"].tzinfo is not None
+
+    def test_repeated_account_keeps_last_occurrence(self):
+        from decimal import Decimal
+        from src.integrations.supabase_client import _PARCEL_COLUMNS, _parcel_copy_rows
+        rows = _parcel_copy_rows([
+            {"account": "1", "acreage": 1.0},
+            {"account": "2", "acreage": 2.0},
+            {"account": "1", "acreage": 3.0},
+        ])
+        records = [dict(zip(_PARCEL_COLUMNS, row)) for row in rows]
+        assert [(r["account"], r["acres"]) for r in records] == [("1", Decimal("3.0")), ("2", Decimal("2.0"))]
+
+    def test_requires_driver_and_dsn(self, monkeypatch):
+        from src.integrations import supabase_client
+        monkeypatch.delenv("SUPABASE_DB_URL", raising=False)
+        supabase = AsyncSupabaseClient(SupabaseConfig(service_key="service"))
+
+        monkeypatch.setattr(supabase_client, "HAS_ASYNCPG", False)
+        with pytest.raises(RuntimeError, match="asyncpg"):
+            asyncio.run(supabase.bulk_copy_parcels([{"account": "1"}]))
+
+        monkeypatch.setattr(supabase_client, "HAS_ASYNCPG", True)
+        with pytest.raises(RuntimeError, match="SUPABASE_DB_URL"):
+            asyncio.run(supabase.bulk_copy_parcels([{"account": "1"}]))
+
+    def test_empty_batch_skips_connection(self):
+        supabase = AsyncSupabaseClient(SupabaseConfig(service_key="service"))
+        assert asyncio.run(supabase.bulk_copy_parcels([])) == 0
+
+
+# =============================================================================
+# RECORD MAPPING
+# =============================================================================
+
+class TestRecordMapping:
+    """BCPAO field aliases and shared batch timestamps"""
+
+    def test_parcel_aliases_and_defaults(self):
+        from src.integrations.supabase_client import _parcel_record
+        bcpao = _parcel_record({"account": "2830001", "parcelID": "28-37", "acreage": "1.5", "owners": "SMITH"})
+        plain = _parcel_record({"account": "2830001", "parcel_id": "28-37", "acres": 1.5, "owner": "SMITH",
+                                "bcpao_url": "https://example.test/2830001"})
+        assert bcpao["parcel_id"] == plain["parcel_id"] == "28-37"
+        assert bcpao["acres"] == plain["acres"] == 1.5
+        assert bcpao["owner"] == plain["owner"] == "SMITH"
+        assert bcpao["market_value"] == 0.0
+        assert bcpao["bcpao_url"].endswith("/account/2830001")
+        assert plain["bcpao_url"] == "https://example.test/2830001"
+
+    def test_batch_rows_share_timestamp(self, supabase, recorder):
+        supabase.insert_parcels_batch([{"account": str(i)} for i in range(3)])
+        rows = json.loads(recorder.requests[0].content)
+        assert len({(r["created_at"], r["updated_at"]) for r in rows}) == 1
+        assert rows[0]["created_at"] == rows[0]["updated_at"]
+        assert rows[0]["created_at"].endswith("+00:00")
+
+    def test_json_columns_encode_without_orjson(self, monkeypatch):
+        from src.integrations import _httpclient
+        from src.integrations.supabase_client import _score_record
+        record = _score_record({"component_scores": {"zoning": 20}}, "2026-01-01T00:00:00")
+        monkeypatch.setattr(_httpclient, "HAS_ORJSON", False)
+        fallback = _score_record({"component_scores": {"zoning": 20}}, "2026-01-01T00:00:00")
+        assert json.loads(record["component_scores"]) == json.loads(fallback["component_scores"]) == {"zoning": 20}
+
+    def test_fallback_encoder_matches_orjson_bytes(self, monkeypatch):
+        from src.integrations import _httpclient
+        from src.integrations.supabase_client import _parcel_record
+        if not _httpclient.HAS_ORJSON:
+            pytest.skip("orjson not installed")
+        record = _parcel_record({"account": "1", "owner": "MUÑOZ", "acres": 1.5}, "2026-01-01T00:00:00")
+        fast = _httpclient.dumps_json([record])
+        monkeypatch.setattr(_httpclient, "HAS_ORJSON", False)
+        assert _httpclient.dumps_json([record]) == fast
+
+    def test_json_column_cache_keeps_types_apart(self):
+        from src.integrations.supabase_client import _json_column
+        assert _json_column(["zoning", "flu"]) is _json_column(["zoning", "flu"])
+        assert json.loads(_json_column([1])) == [1]
+        assert json.loads(_json_column([True])) == [True]
+        assert _json_column([True]) != _json_column([1])
+        assert json.loads(_json_column({"a": 1.5})) == {"a": 1.5}
+        assert json.loads(_json_column([{"nested": [1]}])) == [{"nested": [1]}]
+
+    def test_score_record_encodes_json_columns(self):
+        from src.integrations.supabase_client import _score_record
+        record = _score_record({"account": "1", "score": 80, "scoring_factors": ["a"]}, "2026-01-01T00:00:00")
+        assert json.loads(record["scoring_factors"]) == ["a"]
+        assert json.loads(record["component_scores"]) == {}
+        assert record["scored_at"] == "2026-01-01T00:00:00"
+
+
+# =============================================================================
+# ASYNC CLIENT
+# =============================================================================
+
+class TestAsyncClient:
+    """AsyncSupabaseClient posts batch chunks concurrently"""
+
+    @staticmethod
+    def _record_size():
+        from src.integrations._httpclient import dumps_json
+        from src.integrations.supabase_client import _parcel_record
+        return len(dumps_json(_parcel_record({"account": "0"})))
+
+    def test_batch_split_into_concurrent_chunks(self):
+        in_flight = []
+        peak = []
+        bodies = []
+
+        async def handler(request):
+            in_flight.append(request)
+            peak.append(len(in_flight))
+            await asyncio.sleep(0.01)
+            in_flight.remove(request)
+            body = json.loads(request.content)
+            bodies.append(body)
+            return httpx.Response(201, json=body)
+
+        async def run():
+            client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            supabase = AsyncSupabaseClient(SupabaseConfig(service_key="service"), client=client)
+            supabase.MAX_BODY_BYTES = 2 * self._record_size() + 100
+            return await supabase.insert_parcels_batch([{"account": str(i)} for i in range(5)], return_rows=True)
+
+        rows = asyncio.run(run())
+        assert [r["account"] for r in rows] == ["0", "1", "2", "3", "4"]
+        assert sorted(len(b) for b in bodies) == [1, 2, 2]
+        assert max(peak) == 3
+
+    def test_queries_match_sync_client(self, supabase, recorder):
+        async def run():
+            client = httpx.AsyncClient(transport=httpx.MockTransport(recorder))
+            async with AsyncSupabaseClient(SupabaseConfig(service_key="service"), client=client) as supabase:
+                return await supabase.get_bid_parcels(limit=5)
+
+        asyncio.run(run())
+        supabase.get_bid_parcels(limit=5)
+        assert recorder.requests[0].url == recorder.requests[1].url
+        assert recorder.requests[0].headers["apikey"] == "service"
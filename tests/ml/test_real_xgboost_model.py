@@ -0,0 +1,451 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for the Rezoning Data Collector & Predictors
+
+Coverage targets:
+- RezoningDecision serialization
+- RezoningDataCollector JSONL append / compaction / legacy migration
+- Deduplication by decision ID
+- training_arrays() feature construction
+- Zoning density table and predict_batch() parity with predict()
+- Memoized model probabilities
+- Compiled (Treelite) predictor parity with predict_proba
+- QuantizedTrees int8-leaf scoring
+- RuleBasedPredictor precomputed outcomes
+
+Author: BidDeed.AI / Everest Capital USA
+"""
+
+import pytest
+
+from src.ml.real_xgboost_model import (
+    RezoningDataCollector,
+    RezoningDecision,
+    QuantizedTrees,
+    RezoningXGBoostModel,
+    RuleBasedPredictor,
+    density_increase_batch,
+    training_arrays
+)
+
+
+# =============================================================================
+# TEST FIXTURES
+# =============================================================================
+
+def make_decision(case_number: str = "CPZ24-00008", **overrides) -> RezoningDecision:
+    """Palm Bay rezoning decision with overridable fields"""
+    values = dict(
+        case_number=case_number,
+        ordinance_number="2024-54",
+        jurisdiction="Palm Bay",
+        address="1 Main St",
+        parcel_id="28-37-01",
+        acreage=1.065,
+        from_zoning="PUD",
+        to_zoning="RM-20",
+        from_flu="RES 20",
+        to_flu=None,
+        outcome="APPROVED",
+        pz_board_vote="5-0",
+        council_vote="4-1",
+        decision_date="2024-06-01",
+        had_opposition=True,
+        density_increase=12.0
+    )
+    values.update(overrides)
+    return RezoningDecision(**values)
+
+
+class LinearModel:
+    """Stand-in for a fitted classifier: probability is a fixed function of the features"""
+
+    WEIGHTS = (0.01, 0.02, 0.2, -0.15, 0.05, 0.05)
+
+    def __init__(self):
+        self.calls = 0
+        self.inputs = []
+
+    def predict_proba(self, features):
+        import numpy as np
+        self.calls += 1
+        self.inputs.append(features)
+        p = 0.4 + np.asarray(features, dtype=np.float64) @ np.array(self.WEIGHTS)
+        return np.column_stack([1 - p, p])
+
+
+def train_synthetic(collector: RezoningDataCollector) -> RezoningXGBoostModel:
+    """Train on 150 seeded synthetic decisions (skips without xgboost / scikit-learn)"""
+    np = pytest.importorskip("numpy")
+    pytest.importorskip("xgboost")
+    pytest.importorskip("sklearn")
+
+    rng = np.random.default_rng(7)
+    for i in range(150):
+        opposition = bool(rng.random() < 0.4)
+        collector.add_decision(make_decision(
+            f"CPZ-{i:05d}",
+            acreage=float(rng.uniform(0.2, 20)),
+            density_increase=float(rng.uniform(0, 16)),
+            had_opposition=opposition,
+            flu_consistent=bool(rng.random() < 0.7),
+            outcome="DENIED" if opposition and rng.random() < 0.7 else "APPROVED"
+        ))
+
+    model = RezoningXGBoostModel(collector)
+    model.train()
+    return model
+
+
+@pytest.fixture
+def collector(tmp_path):
+    """Empty collector writing under a temporary directory"""
+    collector = RezoningDataCollector(data_dir=str(tmp_path / "rezoning"))
+    yield collector
+    collector.close()
+
+
+# =============================================================================
+# SERIALIZATION
+# =============================================================================
+
+class TestDecisionSerialization:
+    """to_dict_fast() must match the dataclasses.asdict() path"""
+
+    def test_fast_dict_matches_asdict(self):
+        decision = make_decision()
+        assert decision.to_dict_fast() == decision.to_dict()
+
+    def test_fast_dict_is_a_copy(self):
+        decision = make_decision()
+        decision.to_dict_fast()["acreage"] = 0.0
+        assert decision.acreage == 1.065
+
+
+# =============================================================================
+# DATA COLLECTOR
+# =============================================================================
+
+class TestDataCollector:
+    """Persistence of collected decisions"""
+
+    def test_save_and_reload(self, collector):
+        assert collector.add_decision(make_decision("CPZ24-00001"))
+        assert collector.add_decision(make_decision("CPZ24-00002", outcome="DENIED"))
+        collector.save()
+
+        reloaded = RezoningDataCollector(data_dir=collector.data_dir)
+        assert [d.to_dict() for d in reloaded.decisions] == [d.to_dict() for d in collector.decisions]
+
+    def test_adds_are_appended_without_save(self, collector):
+        collector.add_decision(make_decision("CPZ24-00001"))
+        collector.add_decision(make_decision("CPZ24-00002"))
+        collector.add_decision(make_decision("CPZ24-00002"))
+        with open(collector.data_file, "rb") as f:
+            assert len(f.readlines()) == 2
+
+        reloaded = RezoningDataCollector(data_dir=collector.data_dir)
+        assert [d.case_number for d in reloaded.decisions] == ["CPZ24-00001", "CPZ24-00002"]
+
+    def test_save_compacts_edits(self, collector):
+        collector.add_decision(make_decision("CPZ24-00001"))
+        collector.add_decision(make_decision("CPZ24-00002"))
+        collector.decisions[0].verified = True
+        collector.save()
+        collector.add_decision(make_decision("CPZ24-00003"))
+
+        reloaded = RezoningDataCollector(data_dir=collector.data_dir)
+        assert [d.verified for d in reloaded.decisions] == [True, False, False]
+        assert len(reloaded.decisions) == 3
+
+    def test_migrates_legacy_json(self, collector):
+        import json, os
+        os.makedirs(collector.data_dir)
+        legacy = {"decisions": [make_decision("CPZ24-00001").to_dict()], "count": 1}
+        with open(os.path.join(collector.data_dir, "decisions.json"), "w") as f:
+            json.dump(legacy, f)
+
+        migrated = RezoningDataCollector(data_dir=collector.data_dir)
+        assert not migrated.add_decision(make_decision("CPZ24-00001"))
+        assert migrated.add_decision(make_decision("CPZ24-00002"))
+
+        reloaded = RezoningDataCollector(data_dir=collector.data_dir)
+        assert [d.case_number for d in reloaded.decisions] == ["CPZ24-00001", "CPZ24-00002"]
+
+    def test_orjson_and_stdlib_lines_agree(self, collector, monkeypatch):
+        import json
+        from src.ml import real_xgboost_model as module
+        if not module.HAS_ORJSON:
+            pytest.skip("orjson not installed")
+        decision = make_decision("CPZ24-00001", address="Malabar Rd – Unit 1")
+        fast = collector._encode_line(decision)
+        monkeypatch.setattr(module, "HAS_ORJSON", False)
+        slow = collector._encode_line(decision)
+        assert json.loads(fast) == json.loads(slow) == decision.to_dict()
+
+        collector.add_decision(decision)
+        reloaded = RezoningDataCollector(data_dir=collector.data_dir)
+        assert reloaded.decisions[0].address == "Malabar Rd – Unit 1"
+
+    def test_duplicates_rejected(self, collector):
+        assert collector.add_decision(make_decision("CPZ24-00001"))
+        assert not collector.add_decision(make_decision("CPZ24-00001", outcome="DENIED"))
+        assert collector.add_decision(make_decision("CPZ24-00001", jurisdiction="Melbourne"))
+        assert len(collector.decisions) == 2
+
+    def test_reloaded_collector_rejects_saved_ids(self, collector):
+        collector.add_decision(make_decision("CPZ24-00001"))
+        collector.save()
+
+        reloaded = RezoningDataCollector(data_dir=collector.data_dir)
+        assert not reloaded.add_decision(make_decision("CPZ24-00001"))
+        assert reloaded.add_decision(make_decision("CPZ24-00002"))
+
+    def test_id_is_stable(self):
+        decision = make_decision()
+        assert decision.get_id() == make_decision(outcome="DENIED").get_id()
+        assert len(decision.get_id()) == 12
+        decision.case_number = "CPZ24-00009"
+        assert decision.get_id() == make_decision("CPZ24-00009").get_id()
+
+
+# =============================================================================
+# TRAINING FEATURES
+# =============================================================================
+
+class TestTrainingArrays:
+    """training_arrays() must match the per-row feature lists"""
+
+    def test_matches_row_features(self):
+        np = pytest.importorskip("numpy")
+        decisions = [
+            make_decision("CPZ24-00001"),
+            make_decision("CPZ24-00002", outcome="WITHDRAWN"),
+            make_decision("CPZ24-00003", outcome="DENIED", flu_consistent=False, had_traffic_study=True),
+            make_decision("CPZ24-00004", acreage=12.5, had_opposition=False, had_stormwater_plan=True),
+        ]
+        X, y = training_arrays(decisions)
+
+        expected = [
+            [d.acreage, d.density_increase, float(d.flu_consistent), float(d.had_opposition),
+             float(d.had_traffic_study), float(d.had_stormwater_plan)]
+            for d in decisions if d.outcome != "WITHDRAWN"
+        ]
+        assert X.dtype == np.float32
+        np.testing.assert_allclose(X, np.array(expected, dtype=np.float32))
+        assert y.tolist() == [1, 0, 1]
+
+    def test_no_decided_cases(self):
+        pytest.importorskip("numpy")
+        X, y = training_arrays([make_decision(outcome="WITHDRAWN")])
+        assert X.shape == (0, 6)
+        assert y.shape == (0,)
+
+
+# =============================================================================
+# BATCH PREDICTION
+# =============================================================================
+
+class TestPredictBatch:
+    """predict_batch() must agree with row-by-row predict()"""
+
+    FROM = ["RS-1", "PUD", "RM-6", "XX-9", "CC", "RS-2"]
+    TO = ["RM-20", "RM-20", "PMU", "RM-10", "RS-3", "UNKNOWN"]
+    ACRES = [1.065, 5.0, 0.5, 2.0, 10.0, 3.3]
+    OPPOSITION = [False, True, False, True, False, True]
+    CONSISTENT = [True, True, False, False, True, True]
+
+    def test_density_increase_matches_dict_lookups(self):
+        pytest.importorskip("numpy")
+        from src.ml.real_xgboost_model import PALM_BAY_ZONING_DENSITY
+        increases = density_increase_batch(self.FROM, self.TO)
+        for i, (from_zoning, to_zoning) in enumerate(zip(self.FROM, self.TO)):
+            from_density = PALM_BAY_ZONING_DENSITY.get(from_zoning, 4.0) or 4.0
+            to_density = PALM_BAY_ZONING_DENSITY.get(to_zoning, from_density) or from_density
+            assert increases[i] == pytest.approx(to_density - from_density)
+
+    def _assert_matches_scalar(self, model, batch):
+        for i, prediction in enumerate(batch):
+            scalar = model.predict(
+                jurisdiction="Palm Bay", from_zoning=self.FROM[i], to_zoning=self.TO[i], from_flu="",
+                acreage=self.ACRES[i], has_opposition=self.OPPOSITION[i], flu_consistent=self.CONSISTENT[i]
+            )
+            assert prediction.prediction_method == scalar.prediction_method
+            assert prediction.approval_probability == pytest.approx(scalar.approval_probability, rel=1e-5)
+            assert prediction.lower_bound == pytest.approx(scalar.lower_bound, rel=1e-5)
+            assert prediction.upper_bound == pytest.approx(scalar.upper_bound, rel=1e-5)
+            assert prediction.warnings == scalar.warnings
+
+    def test_trained_batch_matches_predict(self, collector):
+        pytest.importorskip("numpy")
+        model = RezoningXGBoostModel(collector)
+        model.model, model.is_trained = LinearModel(), True
+        batch = model.predict_batch(self.FROM, self.TO, self.ACRES, self.OPPOSITION, self.CONSISTENT)
+        assert len(batch) == len(self.FROM)
+        self._assert_matches_scalar(model, batch)
+
+    def test_untrained_batch_uses_rules(self, collector):
+        model = RezoningXGBoostModel(collector)
+        batch = model.predict_batch(self.FROM, self.TO, self.ACRES, self.OPPOSITION, self.CONSISTENT)
+        assert {p.prediction_method for p in batch} == {"RULE_BASED"}
+        self._assert_matches_scalar(model, batch)
+
+
+# =============================================================================
+# PREDICTION CACHE
+# =============================================================================
+
+class TestPredictionCache:
+    """Repeat predictions reuse the model probability, not the Prediction"""
+
+    ARGS = dict(jurisdiction="Palm Bay", from_zoning="RS-1", to_zoning="RM-20", from_flu="RES 20", acreage=1.065)
+
+    def test_repeat_inputs_hit_cache(self, collector):
+        pytest.importorskip("numpy")
+        model = RezoningXGBoostModel(collector)
+        model.model, model.is_trained = LinearModel(), True
+
+        first = model.predict(**self.ARGS)
+        first.warnings.append("mutated")
+        second = model.predict(**self.ARGS)
+        assert model.model.calls == 1
+        assert second is not first
+        assert second.warnings == []
+        assert second.approval_probability == first.approval_probability
+
+        model.predict(**{**self.ARGS, "acreage": 1.066})
+        model.predict(**self.ARGS, has_opposition=True)
+        assert model.model.calls == 3
+
+    def test_single_row_features_reuse_buffer(self, collector):
+        np = pytest.importorskip("numpy")
+        model = RezoningXGBoostModel(collector)
+        model.model, model.is_trained = LinearModel(), True
+
+        model.predict(**self.ARGS)
+        model.predict(**{**self.ARGS, "to_zoning": "RM-10"}, flu_consistent=False)
+        first, second = model.model.inputs
+        assert first is second is model._feature_buf
+        np.testing.assert_allclose(second, [[1.065, 7.5, 0, 0, 0, 0]])
+
+
+# =============================================================================
+# COMPILED PREDICTOR
+# =============================================================================
+
+class TestCompiledPredictor:
+    """The compiled tree library must score like the XGBoost wrapper"""
+
+    def test_compiled_matches_predict_proba(self, collector):
+        np = pytest.importorskip("numpy")
+        pytest.importorskip("tl2cgen")
+        model = train_synthetic(collector)
+        if model._compiled is None:
+            pytest.skip("no C toolchain to compile the model")
+
+        X, _ = training_arrays(collector.decisions)
+        np.testing.assert_allclose(
+            model._positive_proba(X), model.model.predict_proba(X)[:, 1], rtol=1e-5
+        )
+
+    def test_compile_failure_logged(self, collector, caplog):
+        class BrokenModel:
+            def get_booster(self):
+                raise RuntimeError("no booster")
+
+        model = RezoningXGBoostModel(collector)
+        model.model = BrokenModel()
+        with caplog.at_level("WARNING", logger="src.ml.real_xgboost_model"):
+            assert model._compile() is None
+        assert "Compiling the rezoning model failed" in caplog.text
+
+
+# =============================================================================
+# QUANTIZED TREES
+# =============================================================================
+
+class TestQuantizedTrees:
+    """int8-leaf trees must stay within quantization error of the float trees"""
+
+    TREES = [
+        {"nodeid": 0, "split": "f0", "split_condition": 2.5, "yes": 1, "no": 2, "missing": 2, "children": [
+            {"nodeid": 1, "leaf": 0.31},
+            {"nodeid": 2, "split": "f3", "split_condition": 0.5, "yes": 3, "no": 4, "missing": 3, "children": [
+                {"nodeid": 3, "leaf": 0.12},
+                {"nodeid": 4, "leaf": -0.47},
+            ]},
+        ]},
+        {"nodeid": 0, "split": "density_increase", "split_condition": 10.0, "yes": 1, "no": 2, "missing": 1,
+         "children": [{"nodeid": 1, "leaf": 0.05}, {"nodeid": 2, "leaf": -0.2}]},
+        {"nodeid": 0, "leaf": 0.01},
+    ]
+
+    @staticmethod
+    def _float_margin(tree, row):
+        from src.ml.real_xgboost_model import FEATURE_NAMES
+        while "leaf" not in tree:
+            split = tree["split"]
+            x = row[FEATURE_NAMES.index(split) if split in FEATURE_NAMES else int(split[1:])]
+            target = tree["missing"] if x != x else tree["yes"] if x < tree["split_condition"] else tree["no"]
+            tree = next(child for child in tree["children"] if child["nodeid"] == target)
+        return tree["leaf"]
+
+    def test_matches_float_trees(self):
+        np = pytest.importorskip("numpy")
+        rows = np.array([
+            [1.0, 4.0, 1, 0, 0, 0],
+            [5.0, 12.0, 1, 1, 0, 0],
+            [5.0, 2.0, 0, 0, 0, 0],
+            [np.nan, np.nan, 1, np.nan, 0, 0],
+        ], dtype=np.float32)
+        quantized = QuantizedTrees.from_tree_dumps(self.TREES, base_margin=0.2)
+        assert quantized.leaf_q.dtype == np.int8
+
+        expected = np.array([0.2 + sum(self._float_margin(t, row) for t in self.TREES) for row in rows])
+        tolerance = float(quantized.scale.sum()) / 2
+        np.testing.assert_allclose(quantized.margin(rows), expected, atol=tolerance)
+        np.testing.assert_allclose(quantized.predict_proba(rows), 1 / (1 + np.exp(-expected)), atol=tolerance)
+
+    def test_trained_model_quantization_error(self, collector):
+        np = pytest.importorskip("numpy")
+        model = train_synthetic(collector)
+        X, _ = training_arrays(collector.decisions)
+        exact = model.model.predict_proba(X)[:, 1]
+        # sigmoid' <= 1/4, so probability error <= margin error / 4
+        tolerance = float(model.quantized.scale.sum()) / 8 + 1e-5
+        np.testing.assert_allclose(model.predict_proba_q(X), exact, atol=tolerance)
+
+    def test_untrained_model_has_no_quantized_trees(self, collector):
+        with pytest.raises(ValueError):
+            RezoningXGBoostModel(collector).predict_proba_q([[1.0, 0, 1, 0, 0, 0]])
+
+
+# =============================================================================
+# RULE-BASED PREDICTOR
+# =============================================================================
+
+class TestRuleBasedPredictor:
+    """Precomputed rule outcomes"""
+
+    def _predict(self, from_zoning, to_zoning, **flags):
+        return RuleBasedPredictor().predict("Palm Bay", from_zoning, to_zoning, "RES 20", 1.065, **flags)
+
+    def test_large_density_jump(self):
+        prediction = self._predict("PUD", "RM-20")
+        assert prediction.approval_probability == pytest.approx(0.70)
+        assert prediction.lower_bound == pytest.approx(0.50)
+        assert prediction.upper_bound == pytest.approx(0.90)
+        assert prediction.warnings[-1] == "Large density increase (16 du/acre) may face scrutiny"
+
+    def test_inconsistent_flu_with_opposition(self):
+        prediction = self._predict("RS-2", "RM-10", has_opposition=True, flu_consistent=False)
+        assert prediction.approval_probability == pytest.approx(0.30)
+        assert prediction.lower_bound == pytest.approx(0.20)
+        assert prediction.upper_bound == pytest.approx(0.90)
+        assert len(prediction.warnings) == 3
+        assert prediction.warnings[0].startswith("⚠️ PREDICTION BASED ON RULES")
+
+    def test_warnings_not_shared_between_predictions(self):
+        first = self._predict("RS-1", "RS-2")
+        first.warnings.append("mutated")
+        assert self._predict("RS-1", "RS-2").warnings == first.warnings[:-1]
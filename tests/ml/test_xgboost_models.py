@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for ZOD XGBoost-Style Models
+
+Coverage targets:
+- DevelopmentFeasibilityScorer.score() grading
+- score_batch() parity with the scalar path (loop and kernel sizes)
+- _scoring_kernels Numba kernel vs NumPy core, explicit warm_up()
+
+Author: BidDeed.AI / Everest Capital USA
+"""
+
+import itertools
+
+import pytest
+
+from src.ml.xgboost_models import (
+    BATCH_KERNEL_MIN,
+    DevelopmentFeasibilityScorer,
+    score_development_feasibility,
+    score_development_feasibility_batch
+)
+
+
+# =============================================================================
+# TEST FIXTURES
+# =============================================================================
+
+BLISS = dict(
+    jurisdiction="Palm Bay",
+    current_zoning="PUD",
+    target_zoning="RM-20",
+    flu_designation="HDR",
+    acreage=1.065,
+    zip_code="32905"
+)
+
+
+def parcel_grid():
+    """Parcels spanning every component tier boundary"""
+    return [
+        dict(BLISS, jurisdiction=j, current_zoning=cz, zip_code=z, buildable_pct=b,
+             constraint_count=c, market_vacancy_rate=v, avg_rent_per_sqft=r)
+        for j, cz, z, b, c, v, r in itertools.product(
+            ["Palm Bay", "Melbourne"], ["PUD", "RS"], ["32937", "32901", "32909", ""],
+            [100, 85, 70, 55, 40, 39.9], [0, 3, 30], [0.05, 0.07, 0.10, 0.2], [1.2, 1.5, 1.8]
+        )
+    ]
+
+
+def comparable(result):
+    data = result.to_dict()
+    data.pop("prediction_timestamp")
+    return data
+
+
+@pytest.fixture
+def scorer():
+    return DevelopmentFeasibilityScorer()
+
+
+# =============================================================================
+# SCALAR SCORING
+# =============================================================================
+
+class TestFeasibilityScore:
+    """Tests for DevelopmentFeasibilityScorer.score()"""
+
+    def test_bliss_palm_bay(self, scorer):
+        result = scorer.score(**BLISS, buildable_pct=52.6, constraint_count=3)
+        assert result.constraint_score == 30
+        assert result.location_score == 60
+        assert 0 <= result.total_score <= 100
+        assert "Significant constraints (47% affected)" in result.weaknesses
+
+    def test_grade_matches_total(self, scorer):
+        bounds = [(90, "A+"), (80, "A"), (70, "B+"), (60, "B"), (50, "C"), (40, "D"), (float("-inf"), "F")]
+        for parcel in parcel_grid()[::25]:
+            result = scorer.score(**parcel)
+            assert result.grade == next(g for bound, g in bounds if result.total_score >= bound)
+
+    def test_convenience_function(self, scorer):
+        assert comparable(score_development_feasibility(**BLISS)) == comparable(scorer.score(**BLISS))
+
+
+# =============================================================================
+# BATCH SCORING
+# =============================================================================
+
+class TestScoreBatch:
+    """score_batch() must match score() row for row"""
+
+    def test_small_batch_loops_scalar(self, scorer):
+        parcels = parcel_grid()[:BATCH_KERNEL_MIN]
+        assert [comparable(r) for r in scorer.score_batch(parcels)] == [
+            comparable(scorer.score(**p)) for p in parcels
+        ]
+
+    def test_kernel_batch_matches_scalar(self, scorer):
+        pytest.importorskip("numpy")
+        parcels = parcel_grid()
+        assert len(parcels) > BATCH_KERNEL_MIN
+        assert [comparable(r) for r in score_development_feasibility_batch(parcels)] == [
+            comparable(scorer.score(**p)) for p in parcels
+        ]
+
+    def test_kernel_batch_component_types(self, scorer):
+        pytest.importorskip("numpy")
+        result = scorer.score_batch(parcel_grid())[0]
+        assert type(result.market_score) is int
+        assert type(result.total_score) is float
+
+    def test_unknown_argument_rejected(self, scorer):
+        pytest.importorskip("numpy")
+        parcels = [dict(BLISS, bogus=1)] * (BATCH_KERNEL_MIN + 1)
+        with pytest.raises(TypeError):
+            scorer.score_batch(parcels)
+
+    def test_missing_argument_rejected(self, scorer):
+        pytest.importorskip("numpy")
+        parcel = dict(BLISS)
+        del parcel["acreage"]
+        with pytest.raises(TypeError):
+            scorer.score_batch([parcel] * (BATCH_KERNEL_MIN + 1))
+
+    def test_warm_up_is_explicit(self):
+        pytest.importorskip("numpy")
+        from src.ml import _scoring_kernels as module
+        module.warm_up()
+        if module.HAS_NUMBA:
+            assert module._batch_score_kernel.signatures
+
+    def test_numba_kernel_matches_numpy(self):
+        np = pytest.importorskip("numpy")
+        from src.ml import _scoring_kernels as module
+        if not module.HAS_NUMBA:
+            pytest.skip("numba not installed")
+
+        rng = np.random.default_rng(7)
+        n = 1000
+        args = (
+            rng.random(n), rng.random(n) * 0.2, rng.random(n) + 0.8, rng.random(n) * 100,
+            rng.integers(0, 10, n), rng.random(n) * 300, rng.choice([50, 60, 75, 95], n)
+        )
+        for compiled, reference in zip(module._batch_score_kernel(*args), module._batch_score_numpy(*args)):
+            np.testing.assert_array_equal(compiled, reference)